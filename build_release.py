@@ -30,10 +30,19 @@ def main():
                 shutil.rmtree(dst)
             shutil.copytree(src, dst)
 
-    # PyInstaller ile build (temp dizinde geliştirme ortamı adı yok)
+    # PyInstaller ile build (temp dizinde geliştirme ortamı adı yok).
+    # .spec yoksa eşdeğer komut satırı kullanılır; kelime listeleri
+    # paketle birlikte EXE'ye gömülmelidir.
+    if os.path.isfile(os.path.join(build_dir, "SecureVault.spec")):
+        target = ["SecureVault.spec"]
+    else:
+        wordlists = os.path.join("securevault", "wordlists")
+        target = ["--onefile", "--noconsole", "--name", "SecureVault",
+                  "--add-data", f"{wordlists}{os.pathsep}{wordlists}",
+                  "main.py"]
     subprocess.run(
         [sys.executable, "-m", "PyInstaller", "--clean", "--noconfirm",
-         "SecureVault.spec"],
+         *target],
         cwd=build_dir,
         check=True,
     )
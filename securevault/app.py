@@ -3,7 +3,7 @@
 import os
 import sys
 import threading
-from typing import Optional
+from typing import Callable, Optional
 
 import tkinter as tk
 from tkinter import ttk, messagebox
@@ -23,11 +23,20 @@ from securevault.constants import (
     APP_TITLE,
     DEFAULT_CATEGORIES,
     FONT_FAMILY,
+    QUICK_UNLOCK_WINDOW_SECONDS,
+    SEARCH_DEBOUNCE_MS,
     THEMES,
 )
-from securevault.data_manager import DataManager
+from securevault.crypto import KdfUnavailableError
+from securevault.data_manager import (
+    DataManager,
+    OperationCancelled,
+    ProgressCallback,
+)
 from securevault.generator import PasswordGenerator
 from securevault.health import PasswordHealthAnalyzer
+from securevault.strength import describe_patterns
+from securevault.widgets import VirtualTreeview
 
 
 class App:
@@ -46,6 +55,11 @@ class App:
         self._selected_pwd_id: Optional[str] = None
         self._selected_note_id: Optional[str] = None
         self._notebook: Optional[ttk.Notebook] = None
+        self._vault_refresh_job: Optional[str] = None
+        # Çalışan arka plan işinin iptal bayrağı (kilitleme/çıkışta tetiklenir)
+        self._task_cancel: Optional[threading.Event] = None
+        # Hızlı kilit açma penceresinin bitişinde çalışacak after() işi
+        self._quick_unlock_job: Optional[str] = None
 
         self._setup_window()
 
@@ -68,7 +82,8 @@ class App:
 
     def run(self) -> None:
         """Uygulamayı başlatır."""
-        self._data_mgr = DataManager(self._base_dir)
+        # Kayıtlar arka planda birleştirilir; kilit/çıkışta flush() garanti
+        self._data_mgr = DataManager(self._base_dir, write_behind=True)
         self._show_login()
         self.root.mainloop()
 
@@ -195,10 +210,60 @@ class App:
         self._clipboard_timer.daemon = True
         self._clipboard_timer.start()
 
+    # ==================================================================
+    #  Arka plan işleri
+    # ==================================================================
+    def _run_async(self, work: Callable[[ProgressCallback], object],
+                   on_done: Callable[[object], None],
+                   on_error: Callable[[BaseException], None],
+                   on_progress: Optional[ProgressCallback] = None,
+                   on_cancel: Optional[Callable[[], None]] = None,
+                   ) -> threading.Event:
+        """``work(progress)`` işini arka plan iş parçacığında çalıştırır.
+
+        Tüm geri çağrılar ``root.after`` ile Tk iş parçacığında çalışır.
+        Döndürülen olay set edildiğinde iş bir sonraki aşama sınırında
+        OperationCancelled ile durur ve ``on_cancel`` çağrılır; iş o sınırı
+        çoktan geçmişse sonuç normal şekilde ``on_done``'a iletilir.
+        """
+        cancel = threading.Event()
+        self._task_cancel = cancel
+
+        def post(callback, *args) -> None:
+            try:
+                self.root.after(0, callback, *args)
+            except (RuntimeError, tk.TclError):
+                pass  # pencere kapanmış
+
+        def progress(message: str, fraction: float) -> None:
+            if cancel.is_set():
+                raise OperationCancelled()
+            if on_progress is not None:
+                post(on_progress, message, fraction)
+
+        def finish(callback, *args) -> None:
+            if self._task_cancel is cancel:
+                self._task_cancel = None
+            callback(*args)
+
+        def runner() -> None:
+            try:
+                result = work(progress)
+            except OperationCancelled:
+                if on_cancel is not None:
+                    post(finish, on_cancel)
+            except Exception as exc:
+                post(finish, on_error, exc)
+            else:
+                post(finish, on_done, result)
+
+        threading.Thread(target=runner, name="vault-task", daemon=True).start()
+        return cancel
+
     # ==================================================================
     #  LOGIN EKRANI
     # ==================================================================
-    def _show_login(self) -> None:
+    def _show_login(self, use_pin: Optional[bool] = None) -> None:
         for w in self.root.winfo_children():
             w.destroy()
 
@@ -216,9 +281,15 @@ class App:
                          fg_key="muted").pack(pady=(0, 30))
 
         is_first = self._data_mgr.is_first_run()
+        if use_pin is None:
+            use_pin = self._data_mgr.quick_unlock_available()
 
-        prompt = ("Yeni master parola belirleyin:" if is_first
-                  else "Master parolanızı girin:")
+        if is_first:
+            prompt = "Yeni master parola belirleyin:"
+        elif use_pin:
+            prompt = "Hızlı kilit açma PIN'inizi girin:"
+        else:
+            prompt = "Master parolanızı girin:"
         self._make_label(frame, prompt, font_size=11).pack(anchor="w", padx=5)
 
         pw_var = tk.StringVar()
@@ -240,7 +311,75 @@ class App:
         tk.Label(frame, textvariable=status_var, bg=t["bg"],
                  fg=t["error"], font=(FONT_FAMILY, 10)).pack(pady=(0, 10))
 
+        progress_bar = ttk.Progressbar(frame, mode="determinate",
+                                       maximum=1.0, length=260)
+        inputs = [w for w in (pw_entry, confirm_entry) if w is not None]
+        submit_btn: Optional[tk.Button] = None
+        cancel_btn: Optional[tk.Button] = None
+        task: Optional[threading.Event] = None
+
+        def set_busy(busy: bool) -> None:
+            state = "disabled" if busy else "normal"
+            for widget in (*inputs, submit_btn):
+                widget.configure(state=state)
+            if busy:
+                progress_bar["value"] = 0.0
+                progress_bar.pack(pady=(0, 8))
+                cancel_btn.pack(pady=(8, 0))
+            else:
+                progress_bar.pack_forget()
+                cancel_btn.pack_forget()
+
+        def on_progress(message: str, fraction: float) -> None:
+            status_var.set(message)
+            progress_bar["value"] = fraction
+
+        def on_done(success) -> None:
+            nonlocal task
+            task = None
+            if not success:
+                if use_pin and not self._data_mgr.quick_unlock_available():
+                    # Deneme hakkı bitti ya da süre doldu — master parola gerekir
+                    self._cancel_quick_unlock_timer()
+                    self._show_login(use_pin=False)
+                    return
+                set_busy(False)
+                status_var.set("Yanlış PIN!" if use_pin else "Yanlış parola!")
+                pw_entry.focus_set()
+                return
+            self._cancel_quick_unlock_timer()
+            self._current_theme = self._data_mgr.get_theme()
+            self._show_main()
+
+        def on_error(exc: BaseException) -> None:
+            nonlocal task
+            task = None
+            set_busy(False)
+            if isinstance(exc, KdfUnavailableError):
+                # Kasa bu kurulumda açılamaz; ayrıntı uyarı penceresinde
+                status_var.set("Anahtar türetme yöntemi desteklenmiyor.")
+                messagebox.showerror("Kasa açılamıyor", str(exc),
+                                     parent=self.root)
+            else:
+                status_var.set(f"Hata: {exc}")
+
+        def on_cancelled() -> None:
+            nonlocal task
+            task = None
+            set_busy(False)
+            status_var.set("İptal edildi.")
+            cancel_btn.configure(state="normal")
+
+        def on_cancel_click() -> None:
+            if task is not None:
+                task.set()
+                status_var.set("İptal ediliyor…")
+                cancel_btn.configure(state="disabled")
+
         def on_submit(_event=None):
+            nonlocal task
+            if task is not None:
+                return
             pw = pw_var.get()
             if not pw:
                 status_var.set("Parola boş olamaz.")
@@ -256,30 +395,40 @@ class App:
                 if pw != confirm_var.get():
                     status_var.set("Parolalar eşleşmiyor.")
                     return
-                status_var.set("Vault oluşturuluyor…")
-                self.root.update_idletasks()
-                try:
-                    self._data_mgr.create_master_password(pw)
-                except Exception as exc:
-                    status_var.set(f"Hata: {exc}")
-                    return
+
+                def work(progress):
+                    self._data_mgr.create_master_password(pw, progress)
+                    return True
+            elif use_pin:
+                def work(progress):
+                    return self._data_mgr.quick_unlock(pw, progress)
             else:
-                status_var.set("Doğrulanıyor…")
-                self.root.update_idletasks()
-                if not self._data_mgr.authenticate(pw):
-                    status_var.set("Yanlış parola!")
-                    return
+                def work(progress):
+                    return self._data_mgr.authenticate(pw, progress)
 
-            self._current_theme = self._data_mgr.get_theme()
-            self._show_main()
+            set_busy(True)
+            task = self._run_async(work, on_done, on_error,
+                                   on_progress=on_progress,
+                                   on_cancel=on_cancelled)
 
         pw_entry.bind("<Return>", on_submit)
         if confirm_entry:
             confirm_entry.bind("<Return>", on_submit)
 
         btn_text = "Oluştur ve Giriş Yap" if is_first else "Giriş Yap"
-        self._make_button(frame, btn_text, on_submit).pack(
-            pady=(5, 0), ipadx=10)
+        submit_btn = self._make_button(frame, btn_text, on_submit)
+        submit_btn.pack(pady=(5, 0), ipadx=10)
+        cancel_btn = self._make_secondary_button(frame, "İptal",
+                                                 on_cancel_click)
+
+        if not is_first and self._data_mgr.quick_unlock_available():
+            switch_text = ("Master parola ile giriş" if use_pin
+                           else "PIN ile giriş")
+            switch_btn = self._make_secondary_button(
+                frame, switch_text,
+                lambda: self._show_login(use_pin=not use_pin))
+            switch_btn.pack(pady=(8, 0))
+            inputs.append(switch_btn)
 
     # ==================================================================
     #  ANA EKRAN
@@ -306,6 +455,8 @@ class App:
                                     self._toggle_theme).pack(side="left", padx=3)
         self._make_secondary_button(right_frame, "🔑 Parola Değiştir",
                                     self._show_change_password).pack(side="left", padx=3)
+        self._make_secondary_button(right_frame, "⚡ Hızlı Kilit",
+                                    self._show_quick_unlock).pack(side="left", padx=3)
         self._make_secondary_button(right_frame, "🔒 Kilitle",
                                     self._lock_app).pack(side="left", padx=3)
 
@@ -350,8 +501,25 @@ class App:
         self._make_label(container, "Kriptografik olarak güvenli şifre üretin",
                          font_size=9, fg_key="muted").pack(anchor="w", pady=(0, 15))
 
+        # Mod: karakter tabanlı şifre veya kelime tabanlı parola cümlesi
+        mode_frame = self._make_frame(container)
+        mode_frame.pack(fill="x", pady=(0, 5))
+        self._gen_mode_var = tk.StringVar(value="password")
+        for label, value in [("Şifre", "password"),
+                             ("Parola Cümlesi", "passphrase")]:
+            ttk.Radiobutton(mode_frame, text=label, value=value,
+                            variable=self._gen_mode_var,
+                            command=self._on_gen_mode_change).pack(
+                side="left", padx=(0, 15))
+
+        options_holder = self._make_frame(container)
+        options_holder.pack(fill="x")
+        self._gen_password_opts = self._make_frame(options_holder)
+        self._gen_password_opts.pack(fill="x")
+        self._gen_passphrase_opts = self._make_frame(options_holder)
+
         # Uzunluk
-        len_frame = self._make_frame(container)
+        len_frame = self._make_frame(self._gen_password_opts)
         len_frame.pack(fill="x", pady=5)
 
         self._make_label(len_frame, "Uzunluk:", font_size=10).pack(side="left")
@@ -367,7 +535,7 @@ class App:
         ).pack(side="left", fill="x", expand=True, padx=10)
 
         # Karakter seçenekleri
-        opts = self._make_frame(container)
+        opts = self._make_frame(self._gen_password_opts)
         opts.pack(fill="x", pady=10)
 
         self._gen_upper = tk.BooleanVar(value=True)
@@ -382,6 +550,32 @@ class App:
             ttk.Checkbutton(opts, text=label, variable=var).pack(
                 side="left", padx=(0, 15))
 
+        # Parola cümlesi seçenekleri
+        words_frame = self._make_frame(self._gen_passphrase_opts)
+        words_frame.pack(fill="x", pady=5)
+        self._make_label(words_frame, "Kelime sayısı:",
+                         font_size=10).pack(side="left")
+        self._gen_words_var = tk.IntVar(value=6)
+        words_val = self._make_label(words_frame, "6", font_size=11,
+                                     bold=True, fg_key="accent")
+        words_val.pack(side="right")
+        ttk.Scale(
+            words_frame, from_=4, to=12, variable=self._gen_words_var,
+            orient="horizontal",
+            command=lambda v: words_val.configure(text=str(int(float(v)))),
+        ).pack(side="left", fill="x", expand=True, padx=10)
+
+        phrase_opts = self._make_frame(self._gen_passphrase_opts)
+        phrase_opts.pack(fill="x", pady=10)
+        self._make_label(phrase_opts, "Ayırıcı:", font_size=10).pack(side="left")
+        self._gen_separator_var = tk.StringVar(value="-")
+        ttk.Combobox(phrase_opts, textvariable=self._gen_separator_var,
+                     values=["-", ".", "_", " "], width=4,
+                     state="readonly").pack(side="left", padx=(8, 15))
+        self._gen_capitalize = tk.BooleanVar(value=False)
+        ttk.Checkbutton(phrase_opts, text="Baş Harfler Büyük",
+                        variable=self._gen_capitalize).pack(side="left")
+
         self._make_button(container, "🎲  Şifre Üret",
                           self._generate_password).pack(pady=15)
 
@@ -419,23 +613,42 @@ class App:
                                                 fg_key="muted")
         self._gen_info_label.pack(side="right")
 
+    def _on_gen_mode_change(self) -> None:
+        if self._gen_mode_var.get() == "passphrase":
+            self._gen_password_opts.pack_forget()
+            self._gen_passphrase_opts.pack(fill="x")
+        else:
+            self._gen_passphrase_opts.pack_forget()
+            self._gen_password_opts.pack(fill="x")
+
     def _generate_password(self) -> None:
         t = self.theme
         try:
-            password = self._pass_gen.generate(
-                length=self._gen_length_var.get(),
-                uppercase=self._gen_upper.get(),
-                lowercase=self._gen_lower.get(),
-                digits=self._gen_digits.get(),
-                special=self._gen_special.get(),
-            )
-        except ValueError as exc:
+            if self._gen_mode_var.get() == "passphrase":
+                words = int(self._gen_words_var.get())
+                password = self._pass_gen.generate_passphrase(
+                    words=words,
+                    separator=self._gen_separator_var.get(),
+                    capitalize=self._gen_capitalize.get(),
+                )
+                # Karakter havuzu tahmini kelimeleri abartır; kesin değer kullanılır
+                strength = self._pass_gen.strength_from_entropy(
+                    self._pass_gen.passphrase_entropy(words))
+            else:
+                password = self._pass_gen.generate(
+                    length=self._gen_length_var.get(),
+                    uppercase=self._gen_upper.get(),
+                    lowercase=self._gen_lower.get(),
+                    digits=self._gen_digits.get(),
+                    special=self._gen_special.get(),
+                )
+                strength = self._pass_gen.calculate_strength(password)
+        except (ValueError, OSError) as exc:
             messagebox.showwarning("Uyarı", str(exc), parent=self.root)
             return
 
         self._gen_result_var.set(password)
 
-        strength = self._pass_gen.calculate_strength(password)
         canvas = self._gen_strength_canvas
         canvas.delete("all")
         cw = canvas.winfo_width() or 400
@@ -444,10 +657,11 @@ class App:
         canvas.create_rectangle(0, 0, cw, 8, fill=t["entry_bg"], outline="")
         canvas.create_rectangle(0, 0, fill_w, 8, fill=color, outline="")
 
-        self._gen_strength_label.configure(
-            text=f"{strength['label']}  —  {strength['entropy']:.0f} bit entropi",
-            fg=color,
-        )
+        text = f"{strength['label']}  —  {strength['entropy']:.0f} bit entropi"
+        found = describe_patterns(strength.get("patterns", []))
+        if found:
+            text += f"  ({found})"
+        self._gen_strength_label.configure(text=text, fg=color)
 
     def _copy_generated(self) -> None:
         pw = self._gen_result_var.get()
@@ -485,7 +699,7 @@ class App:
         search_fr.pack(side="right")
         self._vault_search_var = tk.StringVar()
         self._vault_search_var.trace_add(
-            "write", lambda *_: self._refresh_vault_tree())
+            "write", lambda *_: self._schedule_vault_refresh())
         self._make_entry(search_fr, textvariable=self._vault_search_var,
                          width=20).pack(side="left", padx=(0, 8))
         self._make_label(search_fr, "Ara:", font_size=10).pack(side="left")
@@ -503,12 +717,10 @@ class App:
         self._vault_cat_filter.bind(
             "<<ComboboxSelected>>", lambda _: self._refresh_vault_tree())
 
-        # Treeview
-        tree_fr = self._make_frame(container)
-        tree_fr.pack(fill="both", expand=True)
+        # Sanal liste — yalnızca görünen satırlar Tk öğesi olur
         cols = ("site", "user", "category", "date")
-        self._vault_tree = ttk.Treeview(tree_fr, columns=cols,
-                                        show="headings", selectmode="browse")
+        self._vault_tree = VirtualTreeview(container, cols, bg=t["bg"],
+                                           on_select=self._on_vault_select)
         self._vault_tree.heading("site", text="Site Adı")
         self._vault_tree.heading("user", text="Kullanıcı Adı")
         self._vault_tree.heading("category", text="Kategori")
@@ -517,12 +729,7 @@ class App:
         self._vault_tree.column("user", width=180)
         self._vault_tree.column("category", width=120)
         self._vault_tree.column("date", width=100)
-        vsb = ttk.Scrollbar(tree_fr, orient="vertical",
-                            command=self._vault_tree.yview)
-        self._vault_tree.configure(yscrollcommand=vsb.set)
-        self._vault_tree.pack(side="left", fill="both", expand=True)
-        vsb.pack(side="right", fill="y")
-        self._vault_tree.bind("<<TreeviewSelect>>", self._on_vault_select)
+        self._vault_tree.pack(fill="both", expand=True)
 
         # Form alanı
         form_fr = self._make_frame(container)
@@ -593,17 +800,27 @@ class App:
 
     # --- Vault yardımcıları ---
 
+    def _schedule_vault_refresh(self) -> None:
+        """Arama yazılırken yenilemeyi son tuştan SEARCH_DEBOUNCE_MS sonrasına erteler."""
+        if self._vault_refresh_job is not None:
+            self.root.after_cancel(self._vault_refresh_job)
+        self._vault_refresh_job = self.root.after(
+            SEARCH_DEBOUNCE_MS, self._refresh_vault_tree)
+
     def _refresh_vault_tree(self) -> None:
-        tree = self._vault_tree
-        tree.delete(*tree.get_children())
+        if self._vault_refresh_job is not None:
+            self.root.after_cancel(self._vault_refresh_job)
+            self._vault_refresh_job = None
         query = self._vault_search_var.get().strip()
         category = self._vault_cat_filter_var.get()
-        for pwd in self._data_mgr.search_passwords(query, category):
-            tree.insert("", tk.END, iid=pwd["id"],
-                        values=(pwd.get("site_name", ""),
-                                pwd.get("username", ""),
-                                pwd.get("category", ""),
-                                pwd.get("created_at", "")[:10]))
+        rows = [
+            (pwd["id"], (pwd.get("site_name", ""),
+                         pwd.get("username", ""),
+                         pwd.get("category", ""),
+                         pwd.get("created_at", "")[:10]))
+            for pwd in self._data_mgr.search_passwords(query, category)
+        ]
+        self._vault_tree.set_rows(rows)
 
     def _on_vault_select(self, _event=None) -> None:
         sel = self._vault_tree.selection()
@@ -698,8 +915,7 @@ class App:
         self._vault_notes_text.delete("1.0", tk.END)
         self._vault_pass_visible = False
         self._vault_pass_entry.configure(show="●")
-        for item in self._vault_tree.selection():
-            self._vault_tree.selection_remove(item)
+        self._vault_tree.selection_remove()
 
     # ==================================================================
     #  SEKME 3 — Not Defteri
@@ -722,12 +938,10 @@ class App:
         left = self._make_frame(paned)
         paned.add(left, width=250)
 
-        self._notes_listbox = tk.Listbox(
-            left, bg=t["entry_bg"], fg=t["fg"], font=(FONT_FAMILY, 10),
-            selectbackground=t["select_bg"], selectforeground=t["select_fg"],
-            relief="flat", bd=4, activestyle="none")
-        self._notes_listbox.pack(fill="both", expand=True)
-        self._notes_listbox.bind("<<ListboxSelect>>", self._on_note_select)
+        self._notes_tree = VirtualTreeview(left, ("title",), bg=t["bg"],
+                                           on_select=self._on_note_select)
+        self._notes_tree.heading("title", text="Notlar")
+        self._notes_tree.pack(fill="both", expand=True)
 
         btn_row = self._make_frame(left)
         btn_row.pack(fill="x", pady=(5, 0))
@@ -762,22 +976,17 @@ class App:
     # --- Not yardımcıları ---
 
     def _refresh_notes_list(self) -> None:
-        self._notes_listbox.delete(0, tk.END)
-        self._notes_ids: list[str] = []
-        for note in self._data_mgr.get_notes():
-            self._notes_ids.append(note["id"])
-            self._notes_listbox.insert(tk.END,
-                                       note.get("title", "(Başlıksız)"))
+        self._notes_tree.set_rows([
+            (note["id"], (note.get("title", "(Başlıksız)"),))
+            for note in self._data_mgr.get_notes()
+        ])
 
     def _on_note_select(self, _event=None) -> None:
-        sel = self._notes_listbox.curselection()
+        sel = self._notes_tree.selection()
         if not sel:
             self._selected_note_id = None
             return
-        idx = sel[0]
-        if idx >= len(self._notes_ids):
-            return
-        self._selected_note_id = self._notes_ids[idx]
+        self._selected_note_id = sel[0]
         note = self._data_mgr.get_note(self._selected_note_id)
         if not note:
             return
@@ -794,7 +1003,7 @@ class App:
         self._note_title_var.set("")
         self._note_content_text.delete("1.0", tk.END)
         self._note_date_label.configure(text="")
-        self._notes_listbox.selection_clear(0, tk.END)
+        self._notes_tree.selection_remove()
 
     def _save_note(self) -> None:
         title = self._note_title_var.get().strip()
@@ -813,9 +1022,8 @@ class App:
             self._selected_note_id = new_id
 
         self._refresh_notes_list()
-        if self._selected_note_id in self._notes_ids:
-            idx = self._notes_ids.index(self._selected_note_id)
-            self._notes_listbox.selection_set(idx)
+        self._notes_tree.selection_set(self._selected_note_id)
+        if self._notes_tree.selection():
             self._on_note_select()
 
     def _delete_note(self) -> None:
@@ -869,11 +1077,8 @@ class App:
         self._health_info_label.pack(anchor="w")
 
         # Detay tablosu
-        detail_fr = self._make_frame(container)
-        detail_fr.pack(fill="both", expand=True, pady=(10, 0))
         cols = ("site", "user", "strength", "entropy")
-        self._health_tree = ttk.Treeview(detail_fr, columns=cols,
-                                         show="headings", selectmode="browse")
+        self._health_tree = VirtualTreeview(container, cols, bg=t["bg"])
         self._health_tree.heading("site", text="Site")
         self._health_tree.heading("user", text="Kullanıcı")
         self._health_tree.heading("strength", text="Güç")
@@ -882,11 +1087,7 @@ class App:
         self._health_tree.column("user", width=160)
         self._health_tree.column("strength", width=100)
         self._health_tree.column("entropy", width=100)
-        hsb = ttk.Scrollbar(detail_fr, orient="vertical",
-                            command=self._health_tree.yview)
-        self._health_tree.configure(yscrollcommand=hsb.set)
-        self._health_tree.pack(side="left", fill="both", expand=True)
-        hsb.pack(side="right", fill="y")
+        self._health_tree.pack(fill="both", expand=True, pady=(10, 0))
 
         self._health_dup_label = self._make_label(container, "",
                                                   font_size=10,
@@ -916,19 +1117,22 @@ class App:
                   f"Zayıf: {report['weak_count']}"))
 
         tree = self._health_tree
-        tree.delete(*tree.get_children())
         tree.tag_configure("strong", foreground=t["success"])
         tree.tag_configure("medium", foreground=t["warning"])
         tree.tag_configure("weak", foreground=t["error"])
 
+        rows = []
         for a in report["analysis"]:
             tag = ("weak" if a["score"] <= 25
                    else "medium" if a["score"] <= 50
                    else "strong")
-            tree.insert("", tk.END, values=(
+            found = describe_patterns(a["patterns"])
+            label = f"{a['label']} ({found})" if found else a["label"]
+            rows.append((a["id"], (
                 a["site_name"], a["username"],
-                a["label"], f"{a['entropy']:.0f}",
-            ), tags=(tag,))
+                label, f"{a['entropy']:.0f}",
+            ), (tag,)))
+        tree.set_rows(rows)
 
         dups = report["duplicates"]
         if dups:
@@ -999,7 +1203,53 @@ class App:
         tk.Label(frame, textvariable=status_var, bg=t["bg"],
                  fg=t["error"], font=(FONT_FAMILY, 10)).pack(pady=(5, 5))
 
+        task: Optional[threading.Event] = None
+
+        def on_progress(message: str, _fraction: float) -> None:
+            if dialog.winfo_exists():
+                status_var.set(message)
+
+        def on_done(success) -> None:
+            nonlocal task
+            task = None
+            if not dialog.winfo_exists():
+                return
+            if success:
+                dialog.destroy()
+                messagebox.showinfo(
+                    "Başarılı",
+                    "Master parola başarıyla değiştirildi.",
+                    parent=self.root,
+                )
+            else:
+                change_btn.configure(state="normal")
+                status_var.set("Mevcut parola yanlış!")
+
+        def on_error(exc: BaseException) -> None:
+            nonlocal task
+            task = None
+            if dialog.winfo_exists():
+                change_btn.configure(state="normal")
+                status_var.set(f"Hata: {exc}")
+
+        def on_cancelled() -> None:
+            nonlocal task
+            task = None
+            if dialog.winfo_exists():
+                change_btn.configure(state="normal")
+                status_var.set("İptal edildi.")
+
+        def on_dismiss() -> None:
+            if task is None:
+                dialog.destroy()
+            else:
+                task.set()
+                status_var.set("İptal ediliyor…")
+
         def on_change():
+            nonlocal task
+            if task is not None:
+                return
             old_pw = old_pw_var.get()
             new_pw = new_pw_var.get()
             confirm_pw = confirm_pw_var.get()
@@ -1021,33 +1271,149 @@ class App:
                 return
 
             status_var.set("Değiştiriliyor…")
-            dialog.update_idletasks()
-
-            success = self._data_mgr.change_master_password(old_pw, new_pw)
-            if success:
-                dialog.destroy()
-                messagebox.showinfo(
-                    "Başarılı",
-                    "Master parola başarıyla değiştirildi.",
-                    parent=self.root,
-                )
-            else:
-                status_var.set("Mevcut parola yanlış!")
+            change_btn.configure(state="disabled")
+            task = self._run_async(
+                lambda progress: self._data_mgr.change_master_password(
+                    old_pw, new_pw, progress),
+                on_done, on_error,
+                on_progress=on_progress, on_cancel=on_cancelled)
 
         btn_frame = tk.Frame(frame, bg=t["bg"])
         btn_frame.pack(fill="x", pady=(5, 0))
 
-        tk.Button(btn_frame, text="Değiştir", command=on_change,
+        change_btn = tk.Button(btn_frame, text="Değiştir", command=on_change,
+                               bg=t["accent"], fg=t["accent_fg"],
+                               activebackground=t["button_active"],
+                               font=(FONT_FAMILY, 10, "bold"), relief="flat",
+                               bd=0, cursor="hand2", padx=14, pady=6)
+        change_btn.pack(side="left")
+        dialog.protocol("WM_DELETE_WINDOW", on_dismiss)
+
+        tk.Button(btn_frame, text="İptal", command=on_dismiss,
+                  bg=t["button_bg"], fg=t["button_fg"],
+                  activebackground=t["button_active"],
+                  font=(FONT_FAMILY, 10, "bold"), relief="flat",
+                  bd=0, cursor="hand2", padx=14, pady=6).pack(side="left", padx=(8, 0))
+
+    # ==================================================================
+    #  Hızlı Kilit Açma (PIN) Dialogu
+    # ==================================================================
+    def _show_quick_unlock(self) -> None:
+        """Kilitlemeden sonra PIN ile hızlı açmayı etkinleştiren pencere."""
+        t = self.theme
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Hızlı Kilit Açma")
+        dialog.geometry("440x330")
+        dialog.resizable(False, False)
+        dialog.configure(bg=t["bg"])
+        dialog.transient(self.root)
+        dialog.grab_set()
+
+        dialog.update_idletasks()
+        x = self.root.winfo_x() + (self.root.winfo_width() // 2) - 220
+        y = self.root.winfo_y() + (self.root.winfo_height() // 2) - 165
+        dialog.geometry(f"+{x}+{y}")
+
+        frame = tk.Frame(dialog, bg=t["bg"])
+        frame.pack(fill="both", expand=True, padx=30, pady=20)
+
+        tk.Label(frame, text="⚡ Hızlı Kilit Açma", bg=t["bg"], fg=t["accent"],
+                 font=(FONT_FAMILY, 16, "bold")).pack(pady=(0, 8))
+        tk.Label(frame, text="Kilitledikten sonra belirtilen süre boyunca\n"
+                             "master parola yerine PIN ile açılır.",
+                 bg=t["bg"], fg=t["muted"], font=(FONT_FAMILY, 9),
+                 justify="left").pack(anchor="w", pady=(0, 10))
+
+        tk.Label(frame, text="PIN (en az 4 karakter):", bg=t["bg"], fg=t["fg"],
+                 font=(FONT_FAMILY, 10), anchor="w").pack(fill="x")
+        pin_var = tk.StringVar()
+        pin_entry = tk.Entry(frame, textvariable=pin_var, show="●",
+                             bg=t["entry_bg"], fg=t["entry_fg"],
+                             insertbackground=t["fg"], font=(FONT_FAMILY, 11),
+                             relief="flat", bd=4)
+        pin_entry.pack(fill="x", pady=(2, 8), ipady=3)
+        pin_entry.focus_set()
+
+        tk.Label(frame, text="Süre (dakika):", bg=t["bg"], fg=t["fg"],
+                 font=(FONT_FAMILY, 10), anchor="w").pack(fill="x")
+        minutes_var = tk.IntVar(value=QUICK_UNLOCK_WINDOW_SECONDS // 60)
+        tk.Spinbox(frame, from_=1, to=60, textvariable=minutes_var, width=6,
+                   bg=t["entry_bg"], fg=t["entry_fg"],
+                   font=(FONT_FAMILY, 11)).pack(anchor="w", pady=(2, 8))
+
+        status_var = tk.StringVar()
+        if self._data_mgr.quick_unlock_available():
+            status_var.set("Hızlı kilit açma zaten etkin.")
+        tk.Label(frame, textvariable=status_var, bg=t["bg"],
+                 fg=t["error"], font=(FONT_FAMILY, 10)).pack(pady=(5, 5))
+
+        def on_enable(_event=None):
+            try:
+                minutes = int(minutes_var.get())
+            except (tk.TclError, ValueError):
+                status_var.set("Geçerli bir süre girin.")
+                return
+            if not 1 <= minutes <= 60:
+                status_var.set("Süre 1–60 dakika olmalıdır.")
+                return
+            try:
+                self._data_mgr.enable_quick_unlock(pin_var.get(), minutes * 60)
+            except ValueError as exc:
+                status_var.set(str(exc))
+                return
+            dialog.destroy()
+
+        def on_disable():
+            self._data_mgr.clear_quick_unlock()
+            dialog.destroy()
+
+        pin_entry.bind("<Return>", on_enable)
+        dialog.bind("<Escape>", lambda _e: dialog.destroy())
+
+        btn_frame = tk.Frame(frame, bg=t["bg"])
+        btn_frame.pack(fill="x", pady=(5, 0))
+        tk.Button(btn_frame, text="Etkinleştir", command=on_enable,
                   bg=t["accent"], fg=t["accent_fg"],
                   activebackground=t["button_active"],
                   font=(FONT_FAMILY, 10, "bold"), relief="flat",
                   bd=0, cursor="hand2", padx=14, pady=6).pack(side="left")
-
+        # Mevcut PIN'i silen düğme yalnızca hızlı açma etkinken kullanılabilir
+        tk.Button(btn_frame, text="Devre Dışı Bırak", command=on_disable,
+                  state="normal" if self._data_mgr.quick_unlock_available()
+                  else "disabled",
+                  bg=t["button_bg"], fg=t["error"],
+                  activebackground=t["button_active"],
+                  font=(FONT_FAMILY, 10, "bold"), relief="flat",
+                  bd=0, cursor="hand2", padx=14, pady=6).pack(side="left", padx=(8, 0))
         tk.Button(btn_frame, text="İptal", command=dialog.destroy,
                   bg=t["button_bg"], fg=t["button_fg"],
                   activebackground=t["button_active"],
                   font=(FONT_FAMILY, 10, "bold"), relief="flat",
-                  bd=0, cursor="hand2", padx=14, pady=6).pack(side="left", padx=(8, 0))
+                  bd=0, cursor="hand2", padx=14, pady=6).pack(side="right")
+
+    def _schedule_quick_unlock_expiry(self) -> None:
+        """Kilitliyken PIN penceresi dolunca anahtarı silip ekranı yeniler."""
+        self._cancel_quick_unlock_timer()
+        remaining = self._data_mgr.quick_unlock_remaining()
+        if remaining > 0:
+            self._quick_unlock_job = self.root.after(
+                int(remaining * 1000) + 50, self._on_quick_unlock_expired)
+
+    def _cancel_quick_unlock_timer(self) -> None:
+        if self._quick_unlock_job is not None:
+            self.root.after_cancel(self._quick_unlock_job)
+            self._quick_unlock_job = None
+
+    def _on_quick_unlock_expired(self) -> None:
+        self._quick_unlock_job = None
+        if self._data_mgr.is_authenticated:
+            return
+        if self._task_cancel is not None:
+            # PIN doğrulaması sürüyor — sonucunu bekle
+            self._schedule_quick_unlock_expiry()
+            return
+        self._data_mgr.clear_quick_unlock()
+        self._show_login(use_pin=False)
 
     # ==================================================================
     #  Sistem tepsisi (pystray)
@@ -1097,16 +1463,37 @@ class App:
         else:
             self._quit_app()
 
+    def _wait_for_task(self, then: Callable[[], None]) -> bool:
+        """Arka plan işi sürüyorsa iptal ister ve ``then``'i sonraya erteler."""
+        if self._task_cancel is None:
+            return False
+        self._task_cancel.set()
+        self.root.after(100, then)
+        return True
+
     def _lock_app(self) -> None:
+        # Parola değişimi gibi bir iş yarıda kesilirse vault.key/vault.png
+        # farklı anahtarlarla kalabilir — önce işin bitmesi beklenir
+        if self._wait_for_task(self._lock_app):
+            return
+        if self._vault_refresh_job is not None:
+            self.root.after_cancel(self._vault_refresh_job)
+            self._vault_refresh_job = None
         if self._data_mgr:
             self._data_mgr.lock()
         self._selected_pwd_id = None
         self._selected_note_id = None
         self._show_login()
+        self._schedule_quick_unlock_expiry()
 
     def _quit_app(self) -> None:
+        if self._wait_for_task(self._quit_app):
+            return
         if self._data_mgr and self._data_mgr.is_authenticated:
-            self._data_mgr.save()
+            # Kilit, bekleyen değişiklikleri "compact" profille yazar
+            self._data_mgr.lock()
+        if self._data_mgr:
+            self._data_mgr.clear_quick_unlock()
         if self._clipboard_timer:
             self._clipboard_timer.cancel()
         if self._tray:
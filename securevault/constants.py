@@ -56,3 +56,20 @@ THEMES: dict[str, dict[str, str]] = {
 }
 
 FONT_FAMILY = "Segoe UI"
+
+# vault.png kayıt profilleri (Pillow PNG seçenekleri).
+# Etkileşimli düzenlemeler vault'taki profil ile, kilit/çıkış "compact" ile yazılır.
+PNG_SAVE_PROFILES: dict[str, dict] = {
+    "fast": {"compress_level": 1, "optimize": False},
+    "balanced": {"compress_level": 6, "optimize": False},
+    "compact": {"compress_level": 9, "optimize": False},
+}
+DEFAULT_PNG_PROFILE = "fast"
+
+# Arama kutusunda son tuştan sonra listeyi yenilemeden önce beklenecek süre (ms)
+SEARCH_DEBOUNCE_MS = 150
+
+# Hızlı kilit açma (PIN): sarmalanmış anahtarın bellekte tutulacağı varsayılan
+# süre ve pencere silinmeden önce izin verilen hatalı PIN denemesi
+QUICK_UNLOCK_WINDOW_SECONDS = 300
+QUICK_UNLOCK_MAX_ATTEMPTS = 3
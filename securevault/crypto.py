@@ -1,48 +1,262 @@
-"""AES-256-GCM authenticated encryption ve PBKDF2 anahtar türetme."""
+"""AES-256-GCM authenticated encryption ve değiştirilebilir anahtar türetme.
+
+Desteklenen KDF'ler: PBKDF2-HMAC-SHA256, scrypt ve (kuruluysa) Argon2id.
+Kullanılan KDF ve parametreleri vault.key içinde saklanır; "kdf" alanı
+olmayan eski kayıtlar 600.000 turluk PBKDF2 olarak okunur.
+"""
 
 import base64
+import functools
 import hashlib
 import secrets
+import time
 from typing import Optional
 
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 from cryptography.hazmat.primitives import hashes
 
+# Argon2id: önce cryptography (OpenSSL 3.2+), yoksa argon2-cffi
+try:
+    from cryptography.hazmat.primitives.kdf.argon2 import Argon2id as _Argon2id
+except ImportError:
+    _Argon2id = None
+
+try:
+    from argon2.low_level import Type as _Argon2Type
+    from argon2.low_level import hash_secret_raw as _argon2_hash_raw
+except ImportError:
+    _argon2_hash_raw = None
+
+
+class KdfUnavailableError(ValueError):
+    """vault.key'deki KDF bu kurulumda kullanılamıyor (ör. Argon2 desteği yok)."""
+
+    def __init__(self, kdf: str) -> None:
+        hint = (" Argon2 destekli 'cryptography' (OpenSSL 3.2+) veya "
+                "'argon2-cffi' kurun." if kdf == "argon2id" else "")
+        super().__init__(
+            f"Bu kasa '{kdf}' anahtar türetmesiyle oluşturulmuş; bu kurulumda "
+            f"desteklenmiyor.{hint}")
+        self.kdf = kdf
+
+
+class Pbkdf2Kdf:
+    """PBKDF2-HMAC-SHA256. Parametre: ``iterations``."""
+
+    name = "pbkdf2"
+    MIN_ITERATIONS = 600_000   # OWASP 2023 alt sınırı
+    MIN_PARAMS = {"iterations": MIN_ITERATIONS}
+    _PROBE = {"iterations": 100_000}
+
+    @staticmethod
+    def derive(password: bytes, salt: bytes, params: dict, length: int) -> bytes:
+        return PBKDF2HMAC(algorithm=hashes.SHA256(), length=length, salt=salt,
+                          iterations=params["iterations"]).derive(password)
+
+    @staticmethod
+    def scale(probe_seconds: float, target_seconds: float) -> dict:
+        iterations = int(Pbkdf2Kdf._PROBE["iterations"]
+                         * target_seconds / probe_seconds) // 10_000 * 10_000
+        return {"iterations": max(Pbkdf2Kdf.MIN_ITERATIONS, iterations)}
+
+    @staticmethod
+    def cost(params: dict) -> int:
+        return params["iterations"]
+
+
+class ScryptKdf:
+    """scrypt (bellek-zor). Parametreler: ``n`` (2'nin kuvveti), ``r``, ``p``."""
+
+    name = "scrypt"
+    MIN_LOG_N = 15     # 32 MiB (r=8)
+    MAX_LOG_N = 20     # 1 GiB (r=8)
+    MIN_PARAMS = {"n": 2 ** MIN_LOG_N, "r": 8, "p": 1}
+    _PROBE = {"n": 2 ** 14, "r": 8, "p": 1}
+
+    @staticmethod
+    def derive(password: bytes, salt: bytes, params: dict, length: int) -> bytes:
+        return Scrypt(salt=salt, length=length, n=params["n"],
+                      r=params["r"], p=params["p"]).derive(password)
+
+    @staticmethod
+    def scale(probe_seconds: float, target_seconds: float) -> dict:
+        # Süre n ile doğrusal: hedefi aşmayan en büyük 2'nin kuvveti
+        log_n = 14
+        while (log_n < ScryptKdf.MAX_LOG_N
+               and probe_seconds * 2 ** (log_n + 1 - 14) <= target_seconds):
+            log_n += 1
+        log_n = max(ScryptKdf.MIN_LOG_N, log_n)
+        return {"n": 2 ** log_n, "r": 8, "p": 1}
+
+    @staticmethod
+    def cost(params: dict) -> int:
+        return params["n"] * params["r"] * params["p"]
+
+
+class Argon2idKdf:
+    """Argon2id (bellek-zor). Parametreler: ``time_cost``, ``memory_cost`` (KiB),
+    ``parallelism``."""
+
+    name = "argon2id"
+    MEMORY_KIB = 64 * 1024
+    MIN_TIME_COST = 2
+    MAX_TIME_COST = 20
+    MIN_PARAMS = {"time_cost": MIN_TIME_COST, "memory_cost": MEMORY_KIB,
+                  "parallelism": 1}
+    _PROBE = {"time_cost": 1, "memory_cost": MEMORY_KIB, "parallelism": 1}
+
+    @staticmethod
+    def available() -> bool:
+        if _Argon2id is not None:
+            try:
+                Argon2idKdf.derive(b"x", b"0" * 16, {
+                    "time_cost": 1, "memory_cost": 8, "parallelism": 1}, 16)
+                return True
+            except Exception:
+                pass
+        return _argon2_hash_raw is not None
+
+    @staticmethod
+    def derive(password: bytes, salt: bytes, params: dict, length: int) -> bytes:
+        if _Argon2id is not None:
+            try:
+                return _Argon2id(salt=salt, length=length,
+                                 iterations=params["time_cost"],
+                                 lanes=params["parallelism"],
+                                 memory_cost=params["memory_cost"]).derive(password)
+            except Exception:
+                # OpenSSL'de Argon2 yok — argon2-cffi varsa onunla devam et
+                if _argon2_hash_raw is None:
+                    raise
+        return _argon2_hash_raw(password, salt, params["time_cost"],
+                                params["memory_cost"], params["parallelism"],
+                                length, _Argon2Type.ID)
+
+    @staticmethod
+    def scale(probe_seconds: float, target_seconds: float) -> dict:
+        time_cost = int(target_seconds / probe_seconds)
+        time_cost = max(Argon2idKdf.MIN_TIME_COST,
+                        min(Argon2idKdf.MAX_TIME_COST, time_cost))
+        return {"time_cost": time_cost, "memory_cost": Argon2idKdf.MEMORY_KIB,
+                "parallelism": 1}
+
+    @staticmethod
+    def cost(params: dict) -> int:
+        return params["time_cost"] * params["memory_cost"] * params["parallelism"]
+
+
+# Tercih sırasına göre (en güçlüden) kullanılabilir KDF'ler
+KDF_BACKENDS: dict[str, type] = {
+    backend.name: backend
+    for backend in (Argon2idKdf, ScryptKdf, Pbkdf2Kdf)
+    if getattr(backend, "available", lambda: True)()
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _calibrated_params(kdf: str, target_seconds: float) -> tuple:
+    backend = KDF_BACKENDS[kdf]
+    probe = backend._PROBE
+    t0 = time.perf_counter()
+    backend.derive(b"calibration", b"\0" * 16, probe, 32)
+    elapsed = max(time.perf_counter() - t0, 1e-4)
+    return tuple(sorted(backend.scale(elapsed, target_seconds).items()))
+
 
 class CryptoManager:
-    """AES-256-GCM authenticated encryption ve PBKDF2 anahtar türetme."""
+    """AES-256-GCM authenticated encryption ve anahtar türetme."""
 
     ITERATIONS = 600_000
     SALT_SIZE = 32
     KEY_SIZE = 32   # 256 bit
     NONCE_SIZE = 12  # GCM standart nonce
+    KDF_TARGET_SECONDS = 0.3  # kalibrasyonda hedeflenen kilit açma süresi
 
     # --- Anahtar türetme ------------------------------------------------
 
     @staticmethod
-    def derive_key(password: str, salt: bytes) -> bytes:
-        """Master paroladan AES-256 anahtarı türetir (PBKDF2-HMAC-SHA256)."""
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=CryptoManager.KEY_SIZE,
-            salt=salt,
-            iterations=CryptoManager.ITERATIONS,
-        )
-        return kdf.derive(password.encode("utf-8"))
+    def derive_key(password: str, salt: bytes, kdf: str = "pbkdf2",
+                   params: Optional[dict] = None) -> bytes:
+        """Master paroladan AES-256 anahtarı türetir.
+
+        Varsayılan: 600.000 turluk PBKDF2-HMAC-SHA256 (eski vault.key biçimi).
+        """
+        if params is None:
+            params = {"iterations": CryptoManager.ITERATIONS}
+        backend = KDF_BACKENDS.get(kdf)
+        if backend is None:
+            raise KdfUnavailableError(kdf)
+        return backend.derive(password.encode("utf-8"), salt, params,
+                              CryptoManager.KEY_SIZE)
+
+    @staticmethod
+    def preferred_kdf() -> str:
+        """Bu kurulumdaki en güçlü KDF (Argon2id > scrypt > PBKDF2)."""
+        return next(iter(KDF_BACKENDS))
+
+    @staticmethod
+    def calibrate_kdf(kdf: Optional[str] = None,
+                      target_seconds: Optional[float] = None) -> dict:
+        """Makinede kısa bir ölçüm yapıp hedef süreye uyan parametreleri seçer.
+
+        Sonuç süreç boyunca önbelleklenir; güvenlik alt sınırlarının altına
+        inilmez (yavaş makinede türetme hedeften uzun sürebilir).
+        """
+        kdf = kdf or CryptoManager.preferred_kdf()
+        target = target_seconds or CryptoManager.KDF_TARGET_SECONDS
+        return dict(_calibrated_params(kdf, target))
+
+    @staticmethod
+    def kdf_needs_upgrade(stored: dict) -> bool:
+        """Kayıt eski biçimde, daha zayıf bir KDF'le ya da arka ucun sabit
+        alt sınırının (``MIN_PARAMS``) altındaki parametrelerle mi oluşturulmuş?
+
+        Süre ölçümü yapılmaz: kilit açma sırasında kalibrasyon hem gecikme
+        ekler hem de yük altında değişen sonuçlar verir.
+        """
+        kdf = stored.get("kdf")
+        if kdf is None or kdf != CryptoManager.preferred_kdf():
+            return True
+        backend = KDF_BACKENDS[kdf]
+        return backend.cost(stored["params"]) < backend.cost(backend.MIN_PARAMS)
+
+    @staticmethod
+    def _stored_kdf(stored: dict) -> tuple[str, dict]:
+        if "kdf" not in stored:
+            return "pbkdf2", {"iterations": CryptoManager.ITERATIONS}
+        return stored["kdf"], stored["params"]
 
     # --- Master parola hash / doğrulama ----------------------------------
 
     @staticmethod
-    def hash_master_password(password: str) -> dict:
-        """Master parolayı hash'ler; salt ve doğrulama hash'i döndürür."""
+    def create_master_key(password: str, kdf: Optional[str] = None,
+                          params: Optional[dict] = None) -> tuple[dict, bytes]:
+        """Yeni salt ile tek türetmede (doğrulama kaydı, AES anahtarı) üretir.
+
+        ``hash_master_password`` + ``verify_master_password`` çiftinin
+        yaptığını KDF'yi iki kez çalıştırmadan yapar. ``kdf``/``params``
+        verilmezse tercih edilen KDF kalibre edilmiş parametrelerle kullanılır.
+        """
+        kdf = kdf or CryptoManager.preferred_kdf()
+        if params is None:
+            params = CryptoManager.calibrate_kdf(kdf)
         salt = secrets.token_bytes(CryptoManager.SALT_SIZE)
-        key = CryptoManager.derive_key(password, salt)
-        verification_hash = hashlib.sha256(key).hexdigest()
-        return {
+        key = CryptoManager.derive_key(password, salt, kdf, params)
+        stored = {
+            "kdf": kdf,
+            "params": params,
             "salt": base64.b64encode(salt).decode("ascii"),
-            "hash": verification_hash,
+            "hash": hashlib.sha256(key).hexdigest(),
         }
+        return stored, key
+
+    @staticmethod
+    def hash_master_password(password: str) -> dict:
+        """Master parolayı hash'ler; salt ve doğrulama hash'i döndürür."""
+        return CryptoManager.create_master_key(password)[0]
 
     @staticmethod
     def verify_master_password(password: str, stored: dict) -> Optional[bytes]:
@@ -51,28 +265,99 @@ class CryptoManager:
         Zamanlama saldırılarına karşı ``secrets.compare_digest`` kullanır.
         """
         salt = base64.b64decode(stored["salt"])
-        key = CryptoManager.derive_key(password, salt)
+        kdf, params = CryptoManager._stored_kdf(stored)
+        key = CryptoManager.derive_key(password, salt, kdf, params)
         verification_hash = hashlib.sha256(key).hexdigest()
         if secrets.compare_digest(verification_hash, stored["hash"]):
             return key
         return None
 
+    # --- Hızlı kilit açma: PIN ile sarmalanmış anahtar --------------------
+
+    # PIN için bilinçli olarak ucuz KDF: sarmalanmış anahtar yalnızca bellekte
+    # durur, süre penceresi ve deneme sınırı ile korunur
+    PIN_KDF = "scrypt"
+    PIN_KDF_PARAMS = {"n": 2 ** 14, "r": 8, "p": 1}
+
+    @staticmethod
+    def wrap_key(key: bytes, pin: str) -> dict:
+        """Vault anahtarını PIN'den türetilen anahtarla AES-GCM ile sarmalar.
+
+        Sarmalanmış veri ``bytearray`` olarak döner; ``wipe_wrapped_key``
+        ile yerinde sıfırlanabilir.
+        """
+        salt = secrets.token_bytes(16)
+        pin_key = CryptoManager.derive_key(pin, salt, CryptoManager.PIN_KDF,
+                                           CryptoManager.PIN_KDF_PARAMS)
+        return {"salt": salt,
+                "blob": bytearray(CryptoManager.encrypt(key, pin_key))}
+
+    @staticmethod
+    def unwrap_key(wrapped: dict, pin: str) -> Optional[bytes]:
+        """PIN doğruysa vault anahtarını, aksi hâlde None döndürür."""
+        pin_key = CryptoManager.derive_key(pin, wrapped["salt"],
+                                           CryptoManager.PIN_KDF,
+                                           CryptoManager.PIN_KDF_PARAMS)
+        try:
+            return CryptoManager.decrypt(bytes(wrapped["blob"]), pin_key)
+        except InvalidTag:
+            return None
+
+    @staticmethod
+    def wipe_wrapped_key(wrapped: dict) -> None:
+        blob = wrapped["blob"]
+        blob[:] = bytes(len(blob))
+
     # --- AES-256-GCM şifreleme / çözme -----------------------------------
 
     @staticmethod
     def encrypt(plaintext: bytes, key: bytes) -> bytes:
         """AES-256-GCM şifrele.  Çıktı: nonce(12) || ciphertext || tag."""
-        nonce = secrets.token_bytes(CryptoManager.NONCE_SIZE)
-        aesgcm = AESGCM(key)
-        ciphertext = aesgcm.encrypt(nonce, plaintext, None)
-        return nonce + ciphertext
+        return bytes(CipherSession(key).encrypt(plaintext))
 
     @staticmethod
     def decrypt(encrypted: bytes, key: bytes) -> bytes:
         """AES-256-GCM çöz.  Girdi: nonce(12) || ciphertext || tag."""
-        if len(encrypted) < CryptoManager.NONCE_SIZE + 16:
+        return bytes(CipherSession(key).decrypt(encrypted))
+
+
+class CipherSession:
+    """Bir kilit açma oturumu boyunca kullanılan AES-256-GCM şifreleyici.
+
+    ``AESGCM`` örneği bir kez kurulur. Girdi ``memoryview`` ile dilimlenir;
+    backend ``encrypt_into``/``decrypt_into`` destekliyorsa (cryptography
+    44+) çıktı önceden ayrılmış tampona yazılır. Böylece büyük vault'larda
+    nonce/ciphertext ayırma ve birleştirme kopyaları oluşmaz. Biçim
+    ``CryptoManager.encrypt``/``decrypt`` ile aynıdır.
+    """
+
+    TAG_SIZE = 16
+    _HAS_INTO = hasattr(AESGCM, "encrypt_into") and hasattr(AESGCM, "decrypt_into")
+
+    def __init__(self, key: bytes) -> None:
+        self._aead = AESGCM(key)
+
+    def encrypt(self, plaintext: bytes) -> bytearray:
+        """Çıktı: nonce(12) || ciphertext || tag."""
+        nonce_size = CryptoManager.NONCE_SIZE
+        nonce = secrets.token_bytes(nonce_size)
+        if not self._HAS_INTO:
+            return bytearray(nonce + self._aead.encrypt(nonce, plaintext, None))
+        out = bytearray(nonce_size + len(plaintext) + self.TAG_SIZE)
+        out[:nonce_size] = nonce
+        self._aead.encrypt_into(nonce, plaintext, None,
+                                memoryview(out)[nonce_size:])
+        return out
+
+    def decrypt(self, encrypted: bytes) -> bytearray:
+        """Girdi: nonce(12) || ciphertext || tag. Doğrulama başarısızsa InvalidTag."""
+        nonce_size = CryptoManager.NONCE_SIZE
+        if len(encrypted) < nonce_size + self.TAG_SIZE:
             raise ValueError("Şifreli veri çok kısa, bozulmuş olabilir.")
-        nonce = encrypted[: CryptoManager.NONCE_SIZE]
-        ciphertext = encrypted[CryptoManager.NONCE_SIZE:]
-        aesgcm = AESGCM(key)
-        return aesgcm.decrypt(nonce, ciphertext, None)
+        view = memoryview(encrypted)
+        nonce, ciphertext = view[:nonce_size], view[nonce_size:]
+        if not self._HAS_INTO:
+            return bytearray(self._aead.decrypt(nonce, ciphertext, None))
+        out = bytearray(len(ciphertext) - self.TAG_SIZE)
+        self._aead.decrypt_into(nonce, ciphertext, None, out)
+        return out
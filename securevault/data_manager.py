@@ -8,17 +8,30 @@ Veri akışı (yükleme):
 """
 
 import base64
+import contextlib
+import copy
 import json
 import os
 import shutil
 import subprocess
+import threading
+import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
-
-from securevault.constants import DEFAULT_CATEGORIES, VERSION
-from securevault.crypto import CryptoManager
-from securevault.steganography import SteganographyManager
+from typing import Callable, Iterable, Iterator, Optional
+
+from securevault.constants import (
+    DEFAULT_CATEGORIES,
+    DEFAULT_PNG_PROFILE,
+    PNG_SAVE_PROFILES,
+    QUICK_UNLOCK_MAX_ATTEMPTS,
+    QUICK_UNLOCK_WINDOW_SECONDS,
+    VERSION,
+)
+from securevault.crypto import CipherSession, CryptoManager
+from securevault.search import FuzzySearchEngine, SearchIndex
+from securevault.steganography import CarrierBuffer
 
 # Güvenlik limitleri
 MAX_FIELD_LENGTH = 512          # site adı, kullanıcı adı, kategori
@@ -26,16 +39,69 @@ MAX_PASSWORD_LENGTH = 256       # şifre alanı
 MAX_NOTE_LENGTH = 65_536        # not içeriği (64 KB)
 MAX_MASTER_PASSWORD_LENGTH = 128
 
+# Uzun işlemlerin ilerleme bildirimi: (aşama mesajı, 0..1 arası oran).
+# Geri çağrı OperationCancelled fırlatarak işlemi aşama sınırında durdurabilir;
+# vault durumu yalnızca son aşamadan sonra değiştiği için iptal güvenlidir.
+ProgressCallback = Callable[[str, float], None]
+
+
+class OperationCancelled(Exception):
+    """İlerleme geri çağrısı tarafından iptal edilen işlem."""
+
+
+def _report(progress: Optional[ProgressCallback], message: str,
+            fraction: float) -> None:
+    if progress is not None:
+        progress(message, fraction)
+
 
 class DataManager:
     """Vault verilerini yönetir: kimlik doğrulama, CRUD, ayarlar."""
 
-    def __init__(self, base_dir: str):
+    def __init__(self, base_dir: str, write_behind: bool = False,
+                 upgrade_kdf: bool = True):
         self._base_dir = base_dir
         self._key_file = os.path.join(base_dir, "vault.key")
+        # Anahtar değişimi sürerken eski doğrulama kaydı (bkz. _rekey)
+        self._key_backup = self._key_file + ".bak"
         self._vault_image = os.path.join(base_dir, "vault.png")
         self._key: Optional[bytes] = None
+        # Kilit açık olduğu sürece kullanılan AES-GCM örneği (save/_load_data)
+        self._cipher: Optional[CipherSession] = None
         self._data: Optional[dict] = None
+        # Kilit açılırken eski/zayıf KDF kayıtları güncel KDF'ye taşınır
+        self._upgrade_kdf = upgrade_kdf
+        # Hızlı kilit açma: PIN ile sarmalanmış anahtar (yalnızca bellekte)
+        self._quick: Optional[dict] = None
+        # id → kayıt eşlemeleri; ekleme sırasını korur. Kilit açıkken
+        # "passwords"/"notes" listeleri _data yerine burada tutulur ve
+        # yalnızca kayıtta listeye dönüştürülür.
+        self._passwords: dict[str, dict] = {}
+        self._notes: dict[str, dict] = {}
+        # site/kullanıcı/kategori arama indeksi (şifreler için) ve ilk
+        # bulanık aramada kurulan trigram indeksi
+        self._search = SearchIndex()
+        self._fuzzy: Optional[FuzzySearchEngine] = None
+        # Kilit açıkken çözülmüş taşıyıcı pikseller (PNG her kayıtta yeniden okunmaz)
+        self._carrier: Optional[CarrierBuffer] = None
+        # Son kayıt "compact" dışı bir profille yapıldıysa kilitte yeniden sıkıştırılır
+        self._needs_compact = False
+
+        # Write-behind: değişiklikler kirli işaretlenir, arka plan işçisi
+        # birikenleri tek kayıtta birleştirir. _lock veri erişimini,
+        # _io_lock tek seferde tek kaydı, _save_cond işçi durumunu korur.
+        self._write_behind = write_behind
+        self._lock = threading.RLock()
+        self._io_lock = threading.Lock()
+        self._save_cond = threading.Condition()
+        self._dirty = False
+        self._saving = False
+        self._save_error: Optional[BaseException] = None
+        self._worker: Optional[threading.Thread] = None
+        # batch() içindeyken kayıtlar ertelenir
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._batch_owner: Optional[int] = None
 
     # --- Durum sorguları -------------------------------------------------
 
@@ -48,36 +114,73 @@ class DataManager:
 
     # --- Kimlik doğrulama ------------------------------------------------
 
-    def create_master_password(self, password: str) -> None:
+    def create_master_password(self, password: str,
+                               progress: Optional[ProgressCallback] = None) -> None:
         """İlk çalıştırmada master parola oluşturur ve boş vault başlatır."""
-        stored = CryptoManager.hash_master_password(password)
-        with open(self._key_file, "w", encoding="utf-8") as fh:
-            json.dump(stored, fh)
-        self._restrict_file_permissions(self._key_file)
+        _report(progress, "Anahtar türetiliyor…", 0.0)
+        stored, key = CryptoManager.create_master_key(password)
 
-        self._key = CryptoManager.verify_master_password(password, stored)
-        self._data = self._empty_vault()
+        _report(progress, "Vault oluşturuluyor…", 0.8)
+        self._write_key_file(stored)
 
-        SteganographyManager.create_carrier_image(self._vault_image)
+        self._set_key(key)
+        self._set_data(self._empty_vault())
+
+        self._carrier = CarrierBuffer.blank()
         self.save()
 
-    def authenticate(self, password: str) -> bool:
-        """Master parolayı doğrular ve vault verisini yükler."""
+    def authenticate(self, password: str,
+                     progress: Optional[ProgressCallback] = None) -> bool:
+        """Master parolayı doğrular ve vault verisini yükler.
+
+        vault.key'deki KDF bu kurulumda yoksa ``KdfUnavailableError`` fırlar.
+        """
         if not os.path.exists(self._key_file):
             return False
 
         with open(self._key_file, "r", encoding="utf-8") as fh:
             stored = json.load(fh)
 
+        # PNG çözme ve LSB okuma anahtardan bağımsızdır: KDF ile paralel
+        # yürütülür (ikisi de GIL'i C kodunda bırakır), decrypt öncesi birleşir
+        pending: Optional[Future] = None
+        if os.path.exists(self._vault_image):
+            pool = ThreadPoolExecutor(max_workers=1,
+                                      thread_name_prefix="vault-decode")
+            pending = pool.submit(self._read_vault)
+            pool.shutdown(wait=False)
+
+        _report(progress, "Anahtar türetiliyor…", 0.0)
         key = CryptoManager.verify_master_password(password, stored)
+        if os.path.exists(self._key_backup):
+            key, stored = self._settle_interrupted_rekey(password, stored,
+                                                         key, pending)
         if key is None:
             return False
 
-        self._key = key
-        self._load_data()
+        # Eski biçim/zayıf KDF: parola elimizdeyken güncel KDF ile yeni anahtar
+        # türetilir; vault yüklendikten sonra yeni anahtarla yeniden yazılır
+        upgrade = None
+        if self._upgrade_kdf and CryptoManager.kdf_needs_upgrade(stored):
+            _report(progress, "Anahtar türetme yükseltiliyor…", 0.45)
+            upgrade = CryptoManager.create_master_key(password)
+
+        _report(progress, "Vault çözülüyor…", 0.8)
+        self._set_key(key)
+        self._load_data(pending)
+        if self.quick_unlock_available():
+            # Açık oturumda PIN süresi işlemez; sonraki lock() yeniden başlatır
+            self._quick["expires"] = None
+        if upgrade is not None:
+            try:
+                self._rekey(*upgrade)
+            except Exception:
+                # _rekey eski kaydı geri yükledi; yükseltme sonraki girişte denenir
+                pass
         return True
 
-    def change_master_password(self, old_password: str, new_password: str) -> bool:
+    def change_master_password(self, old_password: str, new_password: str,
+                               progress: Optional[ProgressCallback] = None) -> bool:
         """Master parolayı değiştirir; mevcut verileri yeni anahtarla yeniden şifreler.
 
         Süreç:
@@ -93,26 +196,171 @@ class DataManager:
         with open(self._key_file, "r", encoding="utf-8") as fh:
             stored = json.load(fh)
 
+        _report(progress, "Mevcut parola doğrulanıyor…", 0.0)
         old_key = CryptoManager.verify_master_password(old_password, stored)
         if old_key is None:
             return False
 
         # Yeni parola hash/salt üret
-        new_stored = CryptoManager.hash_master_password(new_password)
-        new_key = CryptoManager.verify_master_password(new_password, new_stored)
-        if new_key is None:
-            return False
+        _report(progress, "Yeni anahtar türetiliyor…", 0.35)
+        new_stored, new_key = CryptoManager.create_master_key(new_password)
 
-        # vault.key güncelle
-        with open(self._key_file, "w", encoding="utf-8") as fh:
-            json.dump(new_stored, fh)
+        _report(progress, "Veri yeniden şifreleniyor…", 0.8)
+        self._rekey(new_stored, new_key)
+        return True
+
+    def _rekey(self, new_stored: dict, new_key: bytes) -> None:
+        """vault.key'i yeni doğrulama kaydıyla değiştirir ve veriyi yeniden şifreler."""
+        self._ensure_not_in_batch("rekey")
+        # Eski anahtarın sarmalanmış kopyası artık geçersiz
+        self.clear_quick_unlock()
+        # Eski anahtarla bekleyen arka plan kaydı yeni vault.key'den önce bitmeli
+        self.flush()
+
+        # Eski kayıt, vault.png yeni anahtarla yazılana kadar saklanır: kayıt
+        # hata verirse geri yüklenir, süreç arada ölürse bir sonraki
+        # authenticate hangi kaydın vault.png ile eşleştiğine bakar
+        old_key = self._key
+        shutil.copy2(self._key_file, self._key_backup)
+        self._write_key_file(new_stored)
 
         # Aktif anahtarı değiştir ve veriyi yeniden şifrele
-        self._key = new_key
-        self.save()
+        try:
+            with self._lock:
+                self._set_key(new_key)
+            self.save()
+        except BaseException:
+            with self._lock:
+                self._set_key(old_key)
+            os.replace(self._key_backup, self._key_file)
+            raise
+        os.remove(self._key_backup)
+
+    def _settle_interrupted_rekey(self, password: str, stored: dict,
+                                  key: Optional[bytes],
+                                  pending: Optional[Future],
+                                  ) -> tuple[Optional[bytes], dict]:
+        """Yarıda kalmış anahtar değişiminden sonra geçerli kaydı seçer.
+
+        vault.key ya da vault.key.bak'tan hangisinin anahtarı vault.png'yi
+        çözebiliyorsa o vault.key olarak bırakılır ve yedek silinir. Parola
+        iki kayda da uymuyorsa dosyalara dokunulmaz.
+        """
+        try:
+            with open(self._key_backup, "r", encoding="utf-8") as fh:
+                previous = json.load(fh)
+            previous_key = CryptoManager.verify_master_password(password, previous)
+        except (OSError, ValueError, KeyError):
+            previous, previous_key = None, None
+        candidates = [(k, s) for k, s in ((key, stored), (previous_key, previous))
+                      if k is not None]
+        if not candidates:
+            return None, stored
+
+        try:
+            _, encrypted = (pending.result() if pending is not None
+                            else self._read_vault())
+        except Exception:
+            # vault.png okunamıyor — karar verilemez, yedek yerinde kalır
+            return candidates[0]
+        for candidate_key, candidate in candidates:
+            try:
+                CipherSession(candidate_key).decrypt(encrypted)
+            except Exception:
+                continue
+            if candidate is previous:
+                os.replace(self._key_backup, self._key_file)
+            else:
+                os.remove(self._key_backup)
+            return candidate_key, candidate
+        return candidates[0]
+
+    def _write_key_file(self, stored: dict) -> None:
+        with open(self._key_file, "w", encoding="utf-8") as fh:
+            json.dump(stored, fh)
+        self._restrict_file_permissions(self._key_file)
+
+    def _set_key(self, key: Optional[bytes]) -> None:
+        """Aktif anahtarı ve ona bağlı şifreleme oturumunu birlikte değiştirir."""
+        self._key = key
+        self._cipher = CipherSession(key) if key is not None else None
+
+    # --- Hızlı kilit açma (PIN) -------------------------------------------
 
+    def enable_quick_unlock(self, pin: str,
+                            window_seconds: float = QUICK_UNLOCK_WINDOW_SECONDS) -> None:
+        """Kilitlemeden sonra ``window_seconds`` boyunca PIN ile açmayı etkinleştirir.
+
+        Anahtar, PIN'den ucuz bir KDF ile türetilen anahtarla sarmalanıp
+        yalnızca bellekte tutulur; diske hiçbir şey yazılmaz. İlk kilit açma
+        her zaman master parola ile yapılır.
+
+        Süre ``lock()`` anında başlar, etkinleştirme anında değil. PIN ya da
+        master parola ile başarılı açılış pencereyi kapatmaz: PIN geçerli
+        kalır ve bir sonraki kilitlemede süre yeniden başlar.
+        """
+        if self._key is None:
+            raise ValueError("Hızlı kilit açma için kasa açık olmalıdır.")
+        if len(pin) < 4:
+            raise ValueError("PIN en az 4 karakter olmalıdır.")
+        wrapped = CryptoManager.wrap_key(self._key, pin)
+        self.clear_quick_unlock()
+        self._quick = {
+            "wrapped": wrapped,
+            "window": window_seconds,
+            # Kasa açıkken None; lock() süreyi başlatır
+            "expires": None,
+            "attempts": 0,
+        }
+
+    def quick_unlock_available(self) -> bool:
+        """PIN ile açma penceresi hâlâ geçerli mi? Süresi dolduysa siler."""
+        if (self._quick is not None and self._quick["expires"] is not None
+                and time.monotonic() >= self._quick["expires"]):
+            self.clear_quick_unlock()
+        return self._quick is not None
+
+    def quick_unlock_remaining(self) -> float:
+        """Pencerenin kapanmasına kalan süre (saniye); yoksa 0.
+
+        Kasa açıkken süre henüz başlamadığından pencerenin tamamı döner.
+        """
+        if not self.quick_unlock_available():
+            return 0.0
+        if self._quick["expires"] is None:
+            return float(self._quick["window"])
+        return self._quick["expires"] - time.monotonic()
+
+    def quick_unlock(self, pin: str,
+                     progress: Optional[ProgressCallback] = None) -> bool:
+        """PIN ile anahtarı çözer ve vault'u yükler.
+
+        QUICK_UNLOCK_MAX_ATTEMPTS hatalı denemeden sonra pencere silinir ve
+        master parola gerekir.
+        """
+        if not self.quick_unlock_available():
+            return False
+        _report(progress, "PIN doğrulanıyor…", 0.0)
+        key = CryptoManager.unwrap_key(self._quick["wrapped"], pin)
+        if key is None:
+            self._quick["attempts"] += 1
+            if self._quick["attempts"] >= QUICK_UNLOCK_MAX_ATTEMPTS:
+                self.clear_quick_unlock()
+            return False
+
+        _report(progress, "Vault çözülüyor…", 0.5)
+        self._quick["attempts"] = 0
+        self._quick["expires"] = None
+        self._set_key(key)
+        self._load_data()
         return True
 
+    def clear_quick_unlock(self) -> None:
+        """Sarmalanmış anahtarı bellekte sıfırlar ve pencereyi kapatır."""
+        if self._quick is not None:
+            CryptoManager.wipe_wrapped_key(self._quick["wrapped"])
+            self._quick = None
+
     @staticmethod
     def _restrict_file_permissions(path: str) -> None:
         """Dosya izinlerini sadece sahibine okuma/yazma olarak kısıtlar."""
@@ -129,11 +377,28 @@ class DataManager:
             pass
 
     def lock(self) -> None:
-        """Vault'u kaydeder ve anahtarı bellekten temizler."""
-        if self._key and self._data:
-            self.save()
-        self._key = None
+        """Bekleyen kayıtları boşaltır, "compact" profille yazar, anahtarı temizler.
+
+        Hızlı kilit açma etkinse PIN penceresi burada başlar.
+        """
+        self._ensure_not_in_batch("lock")
+        was_unlocked = self._key is not None
+        try:
+            self.flush()
+        except Exception:
+            # Arka plan kaydı başarısız oldu — aşağıda eşzamanlı olarak yeniden denenir
+            self._needs_compact = True
+        if self._key and self._data and self._needs_compact:
+            self.save(profile="compact")
+        self._set_key(None)
         self._data = None
+        self._passwords = {}
+        self._notes = {}
+        self._reindex()
+        self._carrier = None
+        self._needs_compact = False
+        if was_unlocked and self._quick is not None:
+            self._quick["expires"] = time.monotonic() + self._quick["window"]
 
     # --- Veri yükleme / kaydetme -----------------------------------------
 
@@ -141,35 +406,60 @@ class DataManager:
         return {
             "version": VERSION,
             "theme": "dark",
+            "png_profile": DEFAULT_PNG_PROFILE,
             "custom_categories": [],
             "passwords": [],
             "notes": [],
         }
 
-    def _load_data(self) -> None:
-        """vault.png'den veri yükler; hata olursa yedek alıp boş vault oluşturur."""
-        if not os.path.exists(self._vault_image):
-            self._data = self._empty_vault()
-            SteganographyManager.create_carrier_image(self._vault_image)
+    def _set_data(self, data: dict) -> None:
+        """Yüklenen vault sözlüğünü etkinleştirir ve id eşlemelerini kurar."""
+        with self._lock:
+            self._passwords = {p["id"]: p for p in data.pop("passwords", [])}
+            self._notes = {n["id"]: n for n in data.pop("notes", [])}
+            self._data = data
+            self._reindex()
+
+    def _serializable(self) -> dict:
+        """Kayıt için listeleri yeniden oluşturulmuş vault sözlüğü."""
+        return {**self._data,
+                "passwords": list(self._passwords.values()),
+                "notes": list(self._notes.values())}
+
+    def _read_vault(self) -> tuple[CarrierBuffer, bytes]:
+        """vault.png'yi çözer: (taşıyıcı, şifreli veri). Anahtar gerektirmez."""
+        carrier = CarrierBuffer.from_file(self._vault_image)
+        return carrier, base64.b64decode(carrier.extract())
+
+    def _load_data(self, pending: Optional[Future] = None) -> None:
+        """vault.png'den veri yükler; hata olursa yedek alıp boş vault oluşturur.
+
+        ``pending`` verilirse ``_read_vault`` sonucu ondan alınır (önceden
+        başlatılmış paralel okuma).
+        """
+        if pending is None and not os.path.exists(self._vault_image):
+            self._set_data(self._empty_vault())
+            self._carrier = CarrierBuffer.blank()
             self.save()
             return
 
         try:
-            encoded_data = SteganographyManager.decode(self._vault_image)
-            encrypted = base64.b64decode(encoded_data)
-            decrypted = CryptoManager.decrypt(encrypted, self._key)
-            self._data = json.loads(decrypted.decode("utf-8"))
+            carrier, encrypted = (pending.result() if pending is not None
+                                  else self._read_vault())
+            decrypted = self._cipher.decrypt(encrypted)
+            self._set_data(json.loads(decrypted))
+            self._carrier = carrier
         except (ValueError, KeyError, json.JSONDecodeError) as exc:
             # Bozuk veri — yedek al, sonra sıfırla
             self._backup_corrupt_vault()
-            self._data = self._empty_vault()
-            SteganographyManager.create_carrier_image(self._vault_image)
+            self._set_data(self._empty_vault())
+            self._carrier = CarrierBuffer.blank()
             self.save()
         except Exception as exc:
             # Beklenmeyen hata — veriyi silmeden boş vault ile devam et
             self._backup_corrupt_vault()
-            self._data = self._empty_vault()
-            SteganographyManager.create_carrier_image(self._vault_image)
+            self._set_data(self._empty_vault())
+            self._carrier = CarrierBuffer.blank()
             self.save()
 
     def _backup_corrupt_vault(self) -> None:
@@ -184,38 +474,203 @@ class DataManager:
                 except OSError:
                     pass
 
-    def save(self) -> None:
-        """Vault verisini şifreler ve görüntüye gömer."""
-        if self._key is None or self._data is None:
-            return
+    def save(self, profile: Optional[str] = None) -> None:
+        """Vault verisini şifreler ve görüntüye gömer.
 
-        json_bytes = json.dumps(self._data, ensure_ascii=False).encode("utf-8")
-        encrypted = CryptoManager.encrypt(json_bytes, self._key)
+        ``profile`` verilmezse vault'taki PNG kayıt profili kullanılır.
+        """
+        self._ensure_not_in_batch("save")
+        with self._io_lock:
+            self._save_locked(profile)
+
+    def _save_locked(self, profile: Optional[str]) -> None:
+        # JSON anlık görüntüsü kilit altında alınır; şifreleme ve PNG dışarıda
+        with self._lock:
+            if self._key is None or self._data is None:
+                return
+            if profile is None:
+                profile = self.get_png_profile()
+            cipher = self._cipher
+            json_bytes = json.dumps(self._serializable(),
+                                    ensure_ascii=False).encode("utf-8")
+
+        encrypted = cipher.encrypt(json_bytes)
         encoded = base64.b64encode(encrypted)
 
+        if self._carrier is None:
+            self._carrier = (CarrierBuffer.from_file(self._vault_image)
+                             if os.path.exists(self._vault_image)
+                             else CarrierBuffer.blank())
+
         # Kapasite kontrolü — gerekirse daha büyük taşıyıcı oluştur
-        capacity = SteganographyManager.get_capacity(self._vault_image)
-        if len(encoded) + 36 > capacity:
+        if len(encoded) + 36 > self._carrier.capacity:
             side = 1024
             while True:
                 side += 512
                 potential = ((side * side * 3) // 8) - 36
                 if potential >= len(encoded):
                     break
-            SteganographyManager.create_carrier_image(self._vault_image, side, side)
+            self._carrier = CarrierBuffer.blank(side, side)
+
+        # Yalnızca LSB'ler yeniden yazılır ve PNG sıkıştırılır
+        self._carrier.embed(encoded)
+        self._carrier.save(self._vault_image, **PNG_SAVE_PROFILES[profile])
+        self._needs_compact = profile != "compact"
+
+    # --- Write-behind kayıt ----------------------------------------------
 
-        SteganographyManager.encode(self._vault_image, encoded)
+    def _schedule_save(self) -> None:
+        """Değişiklik sonrası kayıt: eşzamanlı veya arka plan işçisine devredilir."""
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        if not self._write_behind:
+            self.save()
+            return
+        with self._save_cond:
+            self._dirty = True
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._save_worker, name="vault-saver", daemon=True)
+                self._worker.start()
+            self._save_cond.notify_all()
+
+    def _save_worker(self) -> None:
+        while True:
+            with self._save_cond:
+                while not self._dirty:
+                    self._save_cond.wait()
+                self._dirty = False
+                self._saving = True
+            try:
+                self.save()
+            except Exception as exc:
+                self._save_error = exc
+            finally:
+                with self._save_cond:
+                    self._saving = False
+                    self._save_cond.notify_all()
+
+    def flush(self) -> None:
+        """Bekleyen arka plan kaydının diske yazılmasını bekler.
+
+        Arka plandaki son kayıt hata verdiyse hata burada yeniden fırlatılır.
+        """
+        self._ensure_not_in_batch("flush")
+        with self._save_cond:
+            while self._dirty or self._saving:
+                self._save_cond.wait()
+            error, self._save_error = self._save_error, None
+        if error is not None:
+            raise error
+
+    # --- Toplu işlemler ---------------------------------------------------
+
+    def _ensure_not_in_batch(self, operation: str) -> None:
+        """batch() bloğu içinden kayıt/boşaltma çağrılarını reddeder.
+
+        Blok veri kilidini tutarken arka plan işçisi ``_io_lock``'u alıp
+        veri kilidini bekliyor olabilir; burada beklemek kilitlenmeye yol
+        açacağından çağrı açık bir hatayla durdurulur.
+        """
+        if self._batch_owner == threading.get_ident():
+            raise RuntimeError(
+                f"{operation}() batch() bloğu içinde çağrılamaz; "
+                "kayıt blok bitince otomatik yapılır.")
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["DataManager"]:
+        """Blok içindeki tüm değişiklikleri tek kayıtta toplar.
+
+        Blok hata ile biterse veri bloğa girmeden önceki hâline döner ve
+        hiçbir şey kaydedilmez. İç içe kullanımda kaydı en dıştaki blok yapar.
+        Blok süresince veri kilidi tutulur; arka plan işçisi yarım kalmış
+        bir durumu diske yazamaz. Bu yüzden blok içinden ``save()``,
+        ``flush()``, ``lock()`` ve ana parola değişikliği çağrılamaz
+        (``RuntimeError``); kayıt bloktan çıkınca yapılır.
+        """
+        with self._lock:
+            if self._batch_depth:
+                self._batch_depth += 1
+                try:
+                    yield self
+                finally:
+                    self._batch_depth -= 1
+                return
+
+            snapshot = copy.deepcopy((self._data, self._passwords, self._notes))
+            self._batch_depth = 1
+            self._batch_dirty = False
+            self._batch_owner = threading.get_ident()
+            try:
+                yield self
+            except BaseException:
+                self._data, self._passwords, self._notes = snapshot
+                self._reindex()
+                raise
+            finally:
+                self._batch_depth = 0
+                self._batch_owner = None
+                dirty, self._batch_dirty = self._batch_dirty, False
+        if dirty:
+            self._schedule_save()
+
+    def add_passwords(self, entries: list[dict]) -> list[str]:
+        """Birden çok kaydı doğrular ve tek kayıtla ekler; id listesini döndürür."""
+        for entry in entries:
+            self._validate_entry(entry)
+        with self.batch():
+            return [self.add_password(entry) for entry in entries]
+
+    def update_passwords(self, updates: dict[str, dict]) -> int:
+        """``{id: değişiklikler}`` eşlemesini tek kayıtla uygular; güncellenen sayısı."""
+        for changes in updates.values():
+            self._validate_entry(changes)
+        with self.batch():
+            return sum(1 for pwd_id, changes in updates.items()
+                       if self.update_password(pwd_id, changes))
+
+    def delete_passwords(self, pwd_ids: Iterable[str]) -> int:
+        """Verilen id'leri siler ve bir kez kaydeder; silinen sayısı."""
+        removed = 0
+        with self._lock:
+            for pwd_id in set(pwd_ids):
+                if self._passwords.pop(pwd_id, None) is not None:
+                    self._index_remove(pwd_id)
+                    removed += 1
+        if removed:
+            self._schedule_save()
+        return removed
+
+    # --- Arama indeksleri ------------------------------------------------
+
+    def _reindex(self) -> None:
+        """Arama indeksini yeniden kurar; bulanık indeks ilk aramaya ertelenir."""
+        self._search.rebuild(self._passwords.values())
+        self._fuzzy = None
+
+    def _index_add(self, record: dict) -> None:
+        self._search.add(record)
+        if self._fuzzy is not None:
+            self._fuzzy.add(record)
+
+    def _index_update(self, record: dict) -> None:
+        self._search.update(record)
+        if self._fuzzy is not None:
+            self._fuzzy.update(record)
+
+    def _index_remove(self, pwd_id: str) -> None:
+        self._search.remove(pwd_id)
+        if self._fuzzy is not None:
+            self._fuzzy.remove(pwd_id)
 
     # --- Şifre CRUD ------------------------------------------------------
 
     def get_passwords(self) -> list[dict]:
-        return list(self._data.get("passwords", []))
+        return list(self._passwords.values())
 
     def get_password(self, pwd_id: str) -> Optional[dict]:
-        for p in self._data.get("passwords", []):
-            if p["id"] == pwd_id:
-                return p
-        return None
+        return self._passwords.get(pwd_id)
 
     @staticmethod
     def _validate_entry(entry: dict) -> None:
@@ -239,53 +694,63 @@ class DataManager:
         record["id"] = uuid.uuid4().hex
         record["created_at"] = now
         record["updated_at"] = now
-        self._data.setdefault("passwords", []).append(record)
-        self.save()
+        with self._lock:
+            self._passwords[record["id"]] = record
+            self._index_add(record)
+        self._schedule_save()
         return record["id"]
 
     def update_password(self, pwd_id: str, updates: dict) -> bool:
         protected = {"id", "created_at"}
         safe = {k: v for k, v in updates.items() if k not in protected}
-        for p in self._data.get("passwords", []):
-            if p["id"] == pwd_id:
-                p.update(safe)
-                p["updated_at"] = datetime.now().isoformat()
-                self.save()
-                return True
-        return False
+        p = self._passwords.get(pwd_id)
+        if p is None:
+            return False
+        with self._lock:
+            p.update(safe)
+            p["updated_at"] = datetime.now().isoformat()
+            self._index_update(p)
+        self._schedule_save()
+        return True
 
     def delete_password(self, pwd_id: str) -> bool:
-        passwords = self._data.get("passwords", [])
-        before = len(passwords)
-        self._data["passwords"] = [p for p in passwords if p["id"] != pwd_id]
-        if len(self._data["passwords"]) < before:
-            self.save()
-            return True
-        return False
+        with self._lock:
+            removed = self._passwords.pop(pwd_id, None)
+            self._index_remove(pwd_id)
+        if removed is None:
+            return False
+        self._schedule_save()
+        return True
 
     def search_passwords(self, query: str = "", category: str = "") -> list[dict]:
-        results = self._data.get("passwords", [])
-        if category and category != "Tümü":
-            results = [p for p in results if p.get("category") == category]
-        if query:
-            q = query.lower()
-            results = [
-                p for p in results
-                if q in p.get("site_name", "").lower()
-                or q in p.get("username", "").lower()
-            ]
-        return results
+        """Site/kullanıcı adında alt dize ve kategori ile arar (indeks üzerinden)."""
+        if category == "Tümü":
+            category = ""
+        if not query and not category:
+            return list(self._passwords.values())
+        return [self._passwords[pid]
+                for pid in self._search.search(query, category)]
+
+    def fuzzy_search_passwords(self, query: str,
+                               limit: int = 10) -> list[tuple[dict, float]]:
+        """Yazım hatasına dayanıklı, skora göre sıralı arama: ``(kayıt, skor)``.
+
+        Site, kullanıcı adı, URL, kategori ve notlar alanlarında arar.
+        """
+        with self._lock:
+            if self._fuzzy is None:
+                self._fuzzy = FuzzySearchEngine()
+                self._fuzzy.rebuild(self._passwords.values())
+            hits = self._fuzzy.search(query, limit)
+        return [(self._passwords[pid], score) for pid, score in hits]
 
     # --- Not CRUD --------------------------------------------------------
 
     def get_notes(self) -> list[dict]:
-        return list(self._data.get("notes", []))
+        return list(self._notes.values())
 
     def get_note(self, note_id: str) -> Optional[dict]:
-        for n in self._data.get("notes", []):
-            if n["id"] == note_id:
-                return n
-        return None
+        return self._notes.get(note_id)
 
     def add_note(self, note: dict) -> str:
         now = datetime.now().isoformat()
@@ -293,29 +758,30 @@ class DataManager:
         record["id"] = uuid.uuid4().hex
         record["created_at"] = now
         record["updated_at"] = now
-        self._data.setdefault("notes", []).append(record)
-        self.save()
+        with self._lock:
+            self._notes[record["id"]] = record
+        self._schedule_save()
         return record["id"]
 
     def update_note(self, note_id: str, updates: dict) -> bool:
         protected = {"id", "created_at"}
         safe = {k: v for k, v in updates.items() if k not in protected}
-        for n in self._data.get("notes", []):
-            if n["id"] == note_id:
-                n.update(safe)
-                n["updated_at"] = datetime.now().isoformat()
-                self.save()
-                return True
-        return False
+        n = self._notes.get(note_id)
+        if n is None:
+            return False
+        with self._lock:
+            n.update(safe)
+            n["updated_at"] = datetime.now().isoformat()
+        self._schedule_save()
+        return True
 
     def delete_note(self, note_id: str) -> bool:
-        notes = self._data.get("notes", [])
-        before = len(notes)
-        self._data["notes"] = [n for n in notes if n["id"] != note_id]
-        if len(self._data["notes"]) < before:
-            self.save()
-            return True
-        return False
+        with self._lock:
+            removed = self._notes.pop(note_id, None)
+        if removed is None:
+            return False
+        self._schedule_save()
+        return True
 
     # --- Ayarlar ---------------------------------------------------------
 
@@ -324,8 +790,21 @@ class DataManager:
 
     def set_theme(self, theme: str) -> None:
         if self._data is not None:
-            self._data["theme"] = theme
-            self.save()
+            with self._lock:
+                self._data["theme"] = theme
+            self._schedule_save()
+
+    def get_png_profile(self) -> str:
+        profile = self._data.get("png_profile") if self._data else None
+        return profile if profile in PNG_SAVE_PROFILES else DEFAULT_PNG_PROFILE
+
+    def set_png_profile(self, profile: str) -> None:
+        if profile not in PNG_SAVE_PROFILES:
+            raise ValueError(f"Bilinmeyen PNG profili: {profile}")
+        if self._data is not None:
+            with self._lock:
+                self._data["png_profile"] = profile
+            self._schedule_save()
 
     def get_all_categories(self) -> list[str]:
         custom = self._data.get("custom_categories", []) if self._data else []
@@ -334,7 +813,9 @@ class DataManager:
     def add_custom_category(self, name: str) -> None:
         if self._data is None:
             return
-        cats = self._data.setdefault("custom_categories", [])
-        if name not in cats and name not in DEFAULT_CATEGORIES:
+        with self._lock:
+            cats = self._data.setdefault("custom_categories", [])
+            if name in cats or name in DEFAULT_CATEGORIES:
+                return
             cats.append(name)
-            self.save()
+        self._schedule_save()
@@ -1,8 +1,126 @@
 """Kriptografik olarak güvenli rastgele şifre üretimi ve güç analizi."""
 
+import functools
 import math
 import secrets
 import string
+from typing import Optional
+
+from securevault.wordlist import Wordlist, default_wordlist
+
+
+@functools.lru_cache(maxsize=None)
+def _alphabet_table(alphabet: str) -> tuple[bytes, bytes]:
+    """Bayt → karakter çeviri tablosu ve reddedilecek baytlar.
+
+    256'yı alfabe boyuna tam bölen en büyük sınırın altındaki baytlar
+    ``alfabe[b % m]`` ile eşlenir, üstündekiler silinir (rejection
+    sampling). Böylece her karakter eşit olasılıkla seçilir ve tüm eşleme
+    tek bir ``bytes.translate`` çağrısıyla C düzeyinde yapılır.
+    """
+    size = len(alphabet)
+    if not 0 < size <= 256 or not alphabet.isascii():
+        raise ValueError("Alfabe 1–256 ASCII karakter olmalıdır.")
+    limit = 256 - 256 % size
+    table = bytes(ord(alphabet[b % size]) if b < limit else 0
+                  for b in range(256))
+    return table, bytes(range(limit, 256))
+
+
+# Karakter sınıfları ve get_entropy'deki havuz katkıları
+CHAR_CLASS_POOLS: dict[str, int] = {
+    "lower": 26,
+    "upper": 26,
+    "digits": 10,
+    "special": 32,
+    "non_ascii": 128,
+    "other": 0,       # boşluk ve ASCII kontrol karakterleri
+}
+
+
+# Sınıf adı → translate çıktısındaki tek harflik kod
+_CLASS_CODES: dict[str, str] = {
+    "lower": "l",
+    "upper": "u",
+    "digits": "d",
+    "special": "s",
+    "non_ascii": "n",
+    "other": "o",
+}
+_CODE_POOLS: dict[str, int] = {
+    _CLASS_CODES[name]: pool for name, pool in CHAR_CLASS_POOLS.items()}
+
+
+class _ClassTable(dict):
+    """Kod noktası (0–255) → sınıf kodu; 255 üstü her karakter "non_ascii"."""
+
+    def __missing__(self, codepoint: int) -> str:
+        return "n"
+
+
+def _build_class_table() -> _ClassTable:
+    codes = dict.fromkeys(string.ascii_lowercase, "l")
+    codes.update(dict.fromkeys(string.ascii_uppercase, "u"))
+    codes.update(dict.fromkeys(string.digits, "d"))
+    codes.update(dict.fromkeys(string.punctuation, "s"))
+    return _ClassTable(
+        (cp, codes.get(chr(cp), "n" if cp > 127 else "o")) for cp in range(256))
+
+
+_CLASS_TABLE = _build_class_table()
+
+
+def classify_chars(password: str) -> dict[str, int]:
+    """Şifredeki karakterleri tek geçişte sınıflandırıp sınıf başına sayar.
+
+    Python düzeyinde karakter döngüsü yoktur: ``str.translate`` her
+    karakteri 256 girişlik tabloyla tek harflik sınıf koduna çevirir,
+    sayımlar C düzeyindeki ``str.count`` ile yapılır. Anahtarlar
+    ``CHAR_CLASS_POOLS`` ile aynıdır.
+    """
+    codes = password.translate(_CLASS_TABLE)
+    return {name: codes.count(code) for name, code in _CLASS_CODES.items()}
+
+
+class _EntropyPool:
+    """``secrets.token_bytes`` ile büyük parçalar hâlinde doldurulan bayt kaynağı."""
+
+    def __init__(self, chunk: int = 4096) -> None:
+        self._chunk = chunk
+        self._buf = b""
+        self._pos = 0
+
+    def take(self, count: int) -> bytes:
+        if self._pos + count > len(self._buf):
+            rest = self._buf[self._pos:]
+            self._buf = rest + secrets.token_bytes(max(self._chunk, count))
+            self._pos = 0
+        data = self._buf[self._pos:self._pos + count]
+        self._pos += count
+        return data
+
+    def below(self, n: int) -> int:
+        """[0, n) aralığında yansız tam sayı (``secrets.randbelow`` karşılığı)."""
+        width = max(1, (n - 1).bit_length() + 7 >> 3)
+        span = 1 << (8 * width)
+        limit = span - span % n
+        while True:
+            value = int.from_bytes(self.take(width), "big")
+            if value < limit:
+                return value % n
+
+    def choices(self, alphabet: str, count: int) -> str:
+        """Alfabeden bağımsız ve eşit olasılıklı ``count`` karakter."""
+        table, reject = _alphabet_table(alphabet)
+        accept_ratio = (256 - len(reject)) / 256
+        parts: list[bytes] = []
+        need = count
+        while need > 0:
+            raw = self.take(int(need / accept_ratio) + 16)
+            accepted = raw.translate(table, reject)
+            parts.append(accepted[:need])
+            need -= len(parts[-1])
+        return b"".join(parts).decode("ascii")
 
 
 class PasswordGenerator:
@@ -17,9 +135,100 @@ class PasswordGenerator:
         special: bool = True,
     ) -> str:
         """
-        ``secrets.choice`` ile şifre üretir.
-        Seçili her karakter kümesinden en az 1 karakter içerir.
+        Seçili her karakter kümesinden en az 1 karakter içeren şifre üretir.
+
+        Kapsama yapı gereği sağlanır (yeniden deneme döngüsü yoktur); maliyet
+        uzunlukla doğrusaldır. Dağılım ``generate_many`` ile aynıdır.
         """
+        return PasswordGenerator.generate_many(
+            1, length, uppercase, lowercase, digits, special)[0]
+
+    @staticmethod
+    def generate_many(
+        n: int,
+        length: int = 16,
+        uppercase: bool = True,
+        lowercase: bool = True,
+        digits: bool = True,
+        special: bool = True,
+    ) -> list[str]:
+        """``generate`` kurallarıyla ``n`` şifre üretir.
+
+        Rastgelelik karakter başına çağrı yerine toplu ``token_bytes`` ile
+        alınır ve önceden hesaplanmış alfabe tablosuyla yansız biçimde
+        karakterlere çevrilir. Her kümeden bir zorunlu karakter rastgele
+        farklı konumlara yerleştirilir; bu, tüm listeyi karıştırmakla aynı
+        dağılımı verir (diğer karakterler zaten bağımsız ve eşit dağılımlıdır).
+        """
+        if n < 0:
+            raise ValueError("Şifre sayısı negatif olamaz.")
+        pools = PasswordGenerator._select_pools(
+            length, uppercase, lowercase, digits, special)
+        combined = "".join(pools)
+        free = length - len(pools)
+
+        # Beklenen bayt ihtiyacı: karakterler (ret oranıyla) + konum seçimleri
+        reject = len(_alphabet_table(combined)[1])
+        estimate = n * free * 256 // (256 - reject) + n * len(pools) * 4 + 64
+        rng = _EntropyPool(chunk=estimate)
+
+        rest = rng.choices(combined, n * free)
+        required = [rng.choices(pool, n) for pool in pools]
+
+        passwords: list[str] = []
+        for i in range(n):
+            chars = list(rest[i * free:(i + 1) * free])
+            placed: dict[int, str] = {}
+            for pool_chars in required:
+                pos = rng.below(length)
+                while pos in placed:
+                    pos = rng.below(length)
+                placed[pos] = pool_chars[i]
+            # Artan konum sırasıyla eklenen karakter tam o konuma oturur
+            for pos in sorted(placed):
+                chars.insert(pos, placed[pos])
+            password = "".join(chars)
+            if len(set(password.translate(_CLASS_TABLE))) < len(pools):
+                raise RuntimeError("Şifre seçili kümelerin hepsini içermiyor.")
+            passwords.append(password)
+        return passwords
+
+    @staticmethod
+    def generate_passphrase(
+        words: int = 6,
+        separator: str = "-",
+        capitalize: bool = False,
+        wordlist: Optional[Wordlist] = None,
+    ) -> str:
+        """Kelime listesinden bağımsız ve eşit olasılıkla seçilen kelimeler.
+
+        ``wordlist`` verilmezse paketle gelen (veya klasöre konmuş EFF)
+        liste kullanılır. Entropi için ``passphrase_entropy``'ye bakın.
+        """
+        if words < 1:
+            raise ValueError("Kelime sayısı en az 1 olmalıdır.")
+        wl = wordlist if wordlist is not None else default_wordlist()
+        size = len(wl)
+        rng = _EntropyPool(chunk=words * 4 + 16)
+        chosen = [wl[rng.below(size)] for _ in range(words)]
+        if capitalize:
+            chosen = [w.capitalize() for w in chosen]
+        return separator.join(chosen)
+
+    @staticmethod
+    def passphrase_entropy(words: int,
+                           wordlist: Optional[Wordlist] = None) -> float:
+        """Kesin entropi: ``kelime sayısı × log2(liste boyutu)`` bit.
+
+        Ayırıcı ve büyük harf seçimi sabit olduğundan entropi eklemez.
+        """
+        wl = wordlist if wordlist is not None else default_wordlist()
+        return words * math.log2(len(wl))
+
+    @staticmethod
+    def _select_pools(length: int, uppercase: bool, lowercase: bool,
+                      digits: bool, special: bool) -> list[str]:
+        """Seçili karakter kümelerini doğrulayıp sırayla döndürür."""
         if length < 1:
             raise ValueError("Şifre uzunluğu en az 1 olmalıdır.")
 
@@ -40,24 +249,7 @@ class PasswordGenerator:
             raise ValueError(
                 f"Uzunluk ({length}), seçili küme sayısından ({len(pools)}) az olamaz."
             )
-
-        combined = "".join(pools)
-        while True:
-            # Her kümeden 1 zorunlu karakter + geri kalanı rastgele
-            password_chars = [secrets.choice(pool) for pool in pools]
-            remaining = length - len(pools)
-            password_chars.extend(secrets.choice(combined) for _ in range(remaining))
-
-            # Fisher-Yates shuffle (secrets tabanlı)
-            for i in range(len(password_chars) - 1, 0, -1):
-                j = secrets.randbelow(i + 1)
-                password_chars[i], password_chars[j] = password_chars[j], password_chars[i]
-
-            password = "".join(password_chars)
-
-            # Doğrulama: her kümeden gerçekten karakter var mı?
-            if all(any(c in pool for c in password) for pool in pools):
-                return password
+        return pools
 
     @staticmethod
     def get_entropy(password: str) -> float:
@@ -65,18 +257,9 @@ class PasswordGenerator:
         if not password:
             return 0.0
 
-        pool_size = 0
-        if any(c in string.ascii_lowercase for c in password):
-            pool_size += 26
-        if any(c in string.ascii_uppercase for c in password):
-            pool_size += 26
-        if any(c in string.digits for c in password):
-            pool_size += 10
-        if any(c in string.punctuation for c in password):
-            pool_size += 32
-        if any(ord(c) > 127 for c in password):
-            pool_size += 128
-
+        # Yalnızca hangi sınıfların bulunduğu gerekir: sayım yerine küme
+        present = set(password.translate(_CLASS_TABLE))
+        pool_size = sum(_CODE_POOLS[code] for code in present)
         if pool_size == 0:
             pool_size = 256
 
@@ -84,12 +267,27 @@ class PasswordGenerator:
 
     @staticmethod
     def calculate_strength(password: str) -> dict:
-        """Şifre gücünü analiz eder; skor, etiket ve renk anahtarı döndürür."""
+        """Şifre gücünü analiz eder; skor, etiket ve renk anahtarı döndürür.
+
+        Entropi, desen tabanlı tahminden (sözlük, klavye, tekrar, dizi,
+        tarih) gelir ve karakter havuzu entropisini aşmaz; bulunan desenler
+        ``patterns`` altında ``(desen, parça)`` olarak döner.
+        """
         if not password:
-            return {"entropy": 0, "score": 0, "label": "Boş", "color": "muted"}
+            return {"entropy": 0, "score": 0, "label": "Boş", "color": "muted",
+                    "patterns": []}
+
+        # strength modülü bu modülü içe aktardığı için burada yüklenir
+        from securevault.strength import estimate_bits
 
-        entropy = PasswordGenerator.get_entropy(password)
+        estimate = estimate_bits(password)
+        result = PasswordGenerator.strength_from_entropy(estimate["bits"])
+        result["patterns"] = estimate["patterns"]
+        return result
 
+    @staticmethod
+    def strength_from_entropy(entropy: float) -> dict:
+        """Entropi (bit) değerini skor, etiket ve renk anahtarına çevirir."""
         if entropy < 28:
             return {"entropy": entropy, "score": 10, "label": "Çok Zayıf", "color": "error"}
         if entropy < 36:
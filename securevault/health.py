@@ -23,6 +23,7 @@ class PasswordHealthAnalyzer:
                 "score": strength["score"],
                 "label": strength["label"],
                 "color": strength["color"],
+                "patterns": strength["patterns"],
             })
         return results
 
@@ -0,0 +1,323 @@
+"""Şifre kayıtları için artımlı, bellek içi arama indeksleri.
+
+Site adı ve kullanıcı adının küçük harfli 1–3 karakterlik n-gram'ları
+kayıt sıra numaralarına eşlenir. Sorgu en fazla 3 karakterse doğrudan
+eşleşen küme, daha uzunsa tüm trigram kümelerinin kesişimi alınır ve
+adaylar alt dize kontrolü ile doğrulanır. Böylece arama maliyeti kasa
+boyutuyla değil, aday/sonuç sayısıyla ölçeklenir.
+
+FuzzySearchEngine ise trigram benzerliğiyle yazım hatalarına dayanıklı,
+skora göre sıralı arama yapar ("gthub" → GitHub).
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Iterable, Optional
+
+MAX_GRAM = 3
+
+
+def _grams(text: str) -> set[str]:
+    """Metnin 1..MAX_GRAM uzunluğundaki tüm alt dizeleri."""
+    return {
+        text[i:i + n]
+        for n in range(1, MAX_GRAM + 1)
+        for i in range(len(text) - n + 1)
+    }
+
+
+class SearchIndex:
+    """site_name/username n-gram indeksi ve kategori → kayıt eşlemesi.
+
+    Kayıtlar eklenme sırasına göre artan bir sıra numarası alır; sonuçlar
+    bu sırayla döndürülür (DataManager'daki kayıt sırası ile aynı).
+    Güncellemede sıra numarası korunur.
+    """
+
+    def __init__(self) -> None:
+        self._grams: dict[str, set[int]] = {}
+        self._categories: dict[str, set[int]] = {}
+        # sıra no → (id, küçük harfli site, küçük harfli kullanıcı, kategori)
+        self._docs: dict[int, tuple[str, str, str, str]] = {}
+        self._seq_of: dict[str, int] = {}
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def clear(self) -> None:
+        self._grams.clear()
+        self._categories.clear()
+        self._docs.clear()
+        self._seq_of.clear()
+        self._next_seq = 0
+
+    def rebuild(self, records: Iterable[dict]) -> None:
+        """İndeksi verilen kayıtlardan sıfırdan kurar."""
+        self.clear()
+        for record in records:
+            self.add(record)
+
+    # --- Artımlı güncelleme ----------------------------------------------
+
+    def add(self, record: dict) -> None:
+        if record["id"] in self._seq_of:
+            self.update(record)
+            return
+        self._insert(record, self._next_seq)
+        self._next_seq += 1
+
+    def _insert(self, record: dict, seq: int) -> None:
+        pwd_id = record["id"]
+        site = record.get("site_name", "").lower()
+        user = record.get("username", "").lower()
+        category = record.get("category", "")
+
+        self._seq_of[pwd_id] = seq
+        self._docs[seq] = (pwd_id, site, user, category)
+        for gram in _grams(site) | _grams(user):
+            self._grams.setdefault(gram, set()).add(seq)
+        self._categories.setdefault(category, set()).add(seq)
+
+    def remove(self, pwd_id: str) -> Optional[int]:
+        """Kaydı indeksten çıkarır; sıra numarasını (yoksa None) döndürür."""
+        seq = self._seq_of.pop(pwd_id, None)
+        if seq is None:
+            return None
+        _, site, user, category = self._docs.pop(seq)
+        for gram in _grams(site) | _grams(user):
+            posting = self._grams[gram]
+            posting.discard(seq)
+            if not posting:
+                del self._grams[gram]
+        members = self._categories[category]
+        members.discard(seq)
+        if not members:
+            del self._categories[category]
+        return seq
+
+    def update(self, record: dict) -> None:
+        """Aranan alanlar değiştiyse kaydı sırasını koruyarak yeniden indeksler."""
+        seq = self._seq_of.get(record["id"])
+        if seq is None:
+            self.add(record)
+            return
+        _, site, user, category = self._docs[seq]
+        if (site == record.get("site_name", "").lower()
+                and user == record.get("username", "").lower()
+                and category == record.get("category", "")):
+            return
+        self.remove(record["id"])
+        self._insert(record, seq)
+
+    # --- Sorgu -----------------------------------------------------------
+
+    def search(self, query: str = "", category: str = "") -> list[str]:
+        """Eşleşen kayıt id'lerini eklenme sırasıyla döndürür.
+
+        ``query`` site adı veya kullanıcı adında (büyük/küçük harf duyarsız)
+        alt dize olarak aranır; ``category`` boşsa filtre uygulanmaz.
+        """
+        q = query.lower()
+        if q:
+            candidates = self._candidates(q)
+        elif category:
+            candidates = self._categories.get(category, set())
+        else:
+            return [self._docs[seq][0] for seq in sorted(self._docs)]
+
+        if category and q:
+            members = self._categories.get(category, set())
+            if len(members) < len(candidates):
+                candidates = {s for s in members if s in candidates}
+            else:
+                candidates = {s for s in candidates if s in members}
+
+        if len(q) > MAX_GRAM:
+            candidates = [
+                s for s in candidates
+                if q in self._docs[s][1] or q in self._docs[s][2]
+            ]
+        return [self._docs[seq][0] for seq in sorted(candidates)]
+
+    def _candidates(self, q: str) -> set[int]:
+        if len(q) <= MAX_GRAM:
+            return self._grams.get(q, set())
+        postings = []
+        for i in range(len(q) - MAX_GRAM + 1):
+            posting = self._grams.get(q[i:i + MAX_GRAM])
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        return result
+
+
+# --- Bulanık (yazım hatasına dayanıklı) arama ----------------------------
+
+# Aranan alanlar ve skor ağırlıkları
+FUZZY_FIELDS: dict[str, float] = {
+    "site_name": 1.0,
+    "username": 0.8,
+    "url": 0.7,
+    "category": 0.5,
+    "notes": 0.4,
+}
+# Uzun serbest metin: benzerlik yerine sorgu trigram'larının kapsanma oranı
+_CONTAINMENT_FIELDS = frozenset({"notes"})
+# Alanda olup sorguda olmayan trigram'ların benzerliği düşürme katsayısı
+_EXTRA_PENALTY = 0.25
+# Trigram kümeleri tekrarları yok sayar ("s1999" ≈ "s19999"); 1.0 yalnızca
+# alanın sorguyla birebir aynı olduğu kayda verilir
+_MAX_TRIGRAM_SCORE = 0.95
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _trigrams(text: str) -> set[str]:
+    """pg_trgm tarzı trigram'lar: her kelime "  kelime " olarak doldurulur."""
+    grams: set[str] = set()
+    for word in _WORD_RE.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class FuzzySearchEngine:
+    """Trigram benzerliğiyle sıralı, yazım hatasına dayanıklı arama.
+
+    Her alan için trigram → kayıt kümesi indeksi tutulur. Sorguda yalnızca
+    sorgunun trigram'larını içeren kayıtlar sayılır (ortak trigram sayısı
+    C düzeyinde ``Counter.update`` ile toplanır). Benzerlik
+    ``ortak / (|Q| + 0.25 × alandaki fazla trigram)`` biçimindedir: alandaki
+    ek kelimeler ("GitHub 2" gibi) eşleşmeyi öldürmez, yalnızca sıralamayı
+    aşağı çeker. Sorgu alanda alt dize olarak geçiyorsa skor yükseltilir.
+    Kaydın skoru, alan ağırlığı × benzerliğin alanlar üzerindeki en yükseğidir.
+    """
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[str, set[int]]] = {
+            f: {} for f in FUZZY_FIELDS}
+        # alan → sıra no → trigram sayısı
+        self._sizes: dict[str, dict[int, int]] = {f: {} for f in FUZZY_FIELDS}
+        # sıra no → (id, küçük harfli alan metinleri)
+        self._docs: dict[int, tuple[str, tuple[str, ...]]] = {}
+        self._seq_of: dict[str, int] = {}
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def clear(self) -> None:
+        for field in FUZZY_FIELDS:
+            self._postings[field].clear()
+            self._sizes[field].clear()
+        self._docs.clear()
+        self._seq_of.clear()
+        self._next_seq = 0
+
+    def rebuild(self, records: Iterable[dict]) -> None:
+        self.clear()
+        for record in records:
+            self.add(record)
+
+    # --- Artımlı güncelleme ----------------------------------------------
+
+    def add(self, record: dict) -> None:
+        if record["id"] in self._seq_of:
+            self.update(record)
+            return
+        self._insert(record, self._next_seq)
+        self._next_seq += 1
+
+    def _insert(self, record: dict, seq: int) -> None:
+        texts = tuple(str(record.get(f) or "").lower() for f in FUZZY_FIELDS)
+        self._seq_of[record["id"]] = seq
+        self._docs[seq] = (record["id"], texts)
+        for field, text in zip(FUZZY_FIELDS, texts):
+            grams = _trigrams(text)
+            if not grams:
+                continue
+            postings = self._postings[field]
+            for gram in grams:
+                postings.setdefault(gram, set()).add(seq)
+            self._sizes[field][seq] = len(grams)
+
+    def remove(self, record_id: str) -> None:
+        seq = self._seq_of.pop(record_id, None)
+        if seq is None:
+            return
+        _, texts = self._docs.pop(seq)
+        for field, text in zip(FUZZY_FIELDS, texts):
+            postings = self._postings[field]
+            for gram in _trigrams(text):
+                posting = postings[gram]
+                posting.discard(seq)
+                if not posting:
+                    del postings[gram]
+            self._sizes[field].pop(seq, None)
+
+    def update(self, record: dict) -> None:
+        seq = self._seq_of.get(record["id"])
+        if seq is None:
+            self.add(record)
+            return
+        self.remove(record["id"])
+        self._insert(record, seq)
+
+    # --- Sorgu -----------------------------------------------------------
+
+    def search(self, query: str, limit: int = 10,
+               min_score: float = 0.3) -> list[tuple[str, float]]:
+        """En iyi ``limit`` sonucu ``(id, skor)`` olarak, skora göre azalan döndürür.
+
+        Skor 0–1 aralığındadır; ``min_score`` altındaki kayıtlar elenir.
+        """
+        q = query.strip().lower()
+        q_grams = _trigrams(q)
+        if not q_grams or limit <= 0:
+            return []
+        n_q = len(q_grams)
+        # Benzerlik ≤ ortak / |Q| olduğundan daha az ortak trigram'lı kayıt eşiği geçemez
+        need = max(1, math.ceil(min_score * n_q))
+
+        best: dict[int, float] = {}
+        for f_idx, (field, weight) in enumerate(FUZZY_FIELDS.items()):
+            if weight < min_score:
+                continue
+            postings = self._postings[field]
+            hits: Counter = Counter()
+            for gram in q_grams:
+                posting = postings.get(gram)
+                if posting:
+                    hits.update(posting)
+            sizes = self._sizes[field]
+            containment = field in _CONTAINMENT_FIELDS
+            for seq, common in hits.items():
+                if common < need:
+                    continue
+                if containment:
+                    score = common / n_q
+                else:
+                    score = min(_MAX_TRIGRAM_SCORE,
+                                common / (n_q + _EXTRA_PENALTY * (sizes[seq] - common)))
+                    text = self._docs[seq][1][f_idx]
+                    if q in text:
+                        score = max(score, 0.6 + 0.4 * len(q) / len(text))
+                score *= weight
+                if score > best.get(seq, 0.0):
+                    best[seq] = score
+
+        top = heapq.nlargest(
+            limit,
+            ((score, -seq) for seq, score in best.items() if score >= min_score),
+        )
+        return [(self._docs[-neg_seq][0], round(score, 4))
+                for score, neg_seq in top]
@@ -4,45 +4,142 @@ Veri formatı (bit düzeyinde):
     [4 byte uzunluk (big-endian)] [veri] [32 byte SHA-256 checksum]
 
 Her bit, görüntü piksellerinin renk kanallarının en düşük bitine yazılır.
+Bit düzlemi işlemleri NumPy varsa dizi işlemleriyle, yoksa bayt düzeyinde
+arama tablolarıyla toplu olarak yapılır.
 """
 
+import functools
 import hashlib
+import io
+import math
 import os
 import struct
+import sys
+import threading
+from collections import OrderedDict
+from typing import Optional
 
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Saf Python yolu için arama tabloları
+_LSB_CLEAR = bytes(i & 0xFE for i in range(256))
+# Her bayt → 8 adet 0/1 baytı (MSB önce)
+_BIT_SPREAD = tuple(
+    bytes((b >> shift) & 1 for shift in range(7, -1, -1)) for b in range(256)
+)
+_LSB_ONLY = bytes(i & 1 for i in range(256))
+# 8 adet 0/1 baytının yerel bayt sıralı 64-bit değeri → paketlenmiş bayt
+_BIT_PACK = {
+    int.from_bytes(spread, sys.byteorder): b for b, spread in enumerate(_BIT_SPREAD)
+}
+
 
 class SteganographyManager:
     """PNG görüntüsüne veri gizleme / çıkarma (LSB yöntemi)."""
 
+    # Taşıyıcı şablon önbelleği: (genişlik, yükseklik) → PNG baytları
+    CARRIER_CACHE_SIZE = 4
+    _carrier_cache: "OrderedDict[tuple[int, int], bytes]" = OrderedDict()
+    _carrier_lock = threading.Lock()
+    _template_dir: Optional[str] = None
+
+    @staticmethod
+    def set_template_dir(path: Optional[str]) -> None:
+        """Taşıyıcı şablonlarının diskte saklanacağı dizini ayarlar (None: kapalı)."""
+        SteganographyManager._template_dir = path
+
+    @staticmethod
+    def clear_carrier_cache() -> None:
+        """Bellekteki taşıyıcı şablonlarını temizler."""
+        with SteganographyManager._carrier_lock:
+            SteganographyManager._carrier_cache.clear()
+
     @staticmethod
     def create_carrier_image(path: str, width: int = 1024, height: int = 1024) -> None:
         """Güzel gradyanlı ve kilit ikonlu taşıyıcı PNG görüntüsü oluşturur.
 
+        Aynı boyut için şablon bir kez çizilir; sonraki çağrılar önbellekteki
+        (veya şablon dizinindeki) PNG baytlarının kopyasıdır.
+        """
+        png = SteganographyManager._carrier_template(width, height)
+        with open(path, "wb") as fh:
+            fh.write(png)
+
+    @staticmethod
+    def _carrier_template(width: int, height: int) -> bytes:
+        """Boyuta göre taşıyıcı PNG baytlarını önbellekten veya diskten döndürür."""
+        cls = SteganographyManager
+        size = (width, height)
+        with cls._carrier_lock:
+            png = cls._carrier_cache.get(size)
+            if png is not None:
+                cls._carrier_cache.move_to_end(size)
+                return png
+
+        template_dir = cls._template_dir
+        template_path = (
+            os.path.join(template_dir, f"carrier_{width}x{height}.png")
+            if template_dir else None
+        )
+        if template_path and os.path.exists(template_path):
+            with open(template_path, "rb") as fh:
+                png = fh.read()
+        else:
+            buf = io.BytesIO()
+            cls._render_carrier(width, height).save(buf, "PNG")
+            png = buf.getvalue()
+            if template_path:
+                try:
+                    os.makedirs(template_dir, exist_ok=True)
+                    tmp_path = f"{template_path}.tmp"
+                    with open(tmp_path, "wb") as fh:
+                        fh.write(png)
+                    os.replace(tmp_path, template_path)
+                except OSError:
+                    pass
+
+        with cls._carrier_lock:
+            cls._carrier_cache[size] = png
+            cls._carrier_cache.move_to_end(size)
+            while len(cls._carrier_cache) > cls.CARRIER_CACHE_SIZE:
+                cls._carrier_cache.popitem(last=False)
+        return png
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+        """Yazı tipini boyut başına süreçte bir kez çözer (segoeui → arial → varsayılan)."""
+        for name in ("segoeui.ttf", "arial.ttf"):
+            try:
+                return ImageFont.truetype(name, size)
+            except (OSError, IOError):
+                continue
+        return ImageFont.load_default()
+
+    @staticmethod
+    def _render_carrier(width: int, height: int) -> Image.Image:
+        """Taşıyıcı görüntüyü çizer.
+
         Görsel GitHub'da paylaşılabilecek kalitede üretilir.
         LSB steganografi yine sorunsuz çalışır.
         """
-        img = Image.new("RGB", (width, height))
+        # --- Çapraz gradyan arka plan (koyu lacivert → mor → mavi) ---
+        img = SteganographyManager._diagonal_gradient(width, height)
         draw = ImageDraw.Draw(img)
 
         # Çok küçük görsellerde (< 64px) sadece gradyan uygula, detay çizme
         min_side = min(width, height)
         simple_mode = min_side < 64
 
-        # --- Çapraz gradyan arka plan (koyu lacivert → mor → mavi) ---
-        for y in range(height):
-            for x in range(width):
-                # Çapraz mesafe (0..1)
-                t = ((x / width) + (y / height)) / 2.0
-                r = int(30 * (1 - t) + 40 * t)
-                g = int(30 * (1 - t) + 60 * t)
-                b = int(60 * (1 - t) + 180 * t)
-                img.putpixel((x, y), (r, g, b))
-
         if simple_mode:
-            img.save(path, "PNG")
-            return
+            return img
 
         cx, cy = width // 2, height // 2
         scale = min(width, height) / 1024.0
@@ -110,14 +207,7 @@ class SteganographyManager:
 
         # --- "SecureVault" yazısı ---
         text = "SecureVault"
-        font_size = int(48 * scale)
-        try:
-            font = ImageFont.truetype("segoeui.ttf", font_size)
-        except (OSError, IOError):
-            try:
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except (OSError, IOError):
-                font = ImageFont.load_default()
+        font = SteganographyManager._load_font(int(48 * scale))
 
         bbox = draw.textbbox((0, 0), text, font=font)
         tw = bbox[2] - bbox[0]
@@ -130,14 +220,7 @@ class SteganographyManager:
 
         # --- Alt yazı ---
         sub_text = "Encrypted Password Manager"
-        sub_size = int(20 * scale)
-        try:
-            sub_font = ImageFont.truetype("segoeui.ttf", sub_size)
-        except (OSError, IOError):
-            try:
-                sub_font = ImageFont.truetype("arial.ttf", sub_size)
-            except (OSError, IOError):
-                sub_font = ImageFont.load_default()
+        sub_font = SteganographyManager._load_font(int(20 * scale))
 
         sub_bbox = draw.textbbox((0, 0), sub_text, font=sub_font)
         stw = sub_bbox[2] - sub_bbox[0]
@@ -158,7 +241,79 @@ class SteganographyManager:
                 fill=(brightness, brightness, brightness),
             )
 
-        img.save(path, "PNG")
+        return img
+
+    # Çapraz gradyan renkleri: kanal başına (t=0, t=1) değerleri
+    _GRADIENT_STOPS = ((30, 40), (30, 60), (60, 180))
+
+    @staticmethod
+    def _diagonal_gradient(width: int, height: int) -> Image.Image:
+        """Çapraz gradyanı kanal başına tek boyutlu şeritlerden üretir.
+
+        Renk yalnızca ``x/width + y/height`` toplamına, yani ``x*h' + y*w'``
+        tamsayısına bağlıdır (``w'``, ``h'``: gcd ile sadeleşmiş boyutlar).
+        Bu tamsayı için şerit bir kez hesaplanır; her satır şeritten adımlı
+        bir dilimdir ve kanallar ``Image.merge`` ile birleştirilir.
+
+        gcd küçükse (ör. 1537×1531) şerit ``w*h`` uzunluğuna yaklaşır; bu
+        durumda satırlar ``_gradient_rows`` ile değer aralıklarından kurulur.
+        """
+        g = math.gcd(width, height)
+        x_step, y_step = height // g, width // g
+        span = (width - 1) * x_step + (height - 1) * y_step + 1
+        if span > 16 * (width + height):
+            return SteganographyManager._gradient_rows(width, height)
+        denom = 2 * g * x_step * y_step
+
+        channels = []
+        for start, stop in SteganographyManager._GRADIENT_STOPS:
+            # Çapraz mesafe t (0..1) → kanal değeri
+            strip = bytes(
+                int(start * (1 - t) + stop * t)
+                for t in (k / denom for k in range(span))
+            )
+            rows = b"".join(
+                strip[y * y_step: y * y_step + width * x_step: x_step]
+                for y in range(height)
+            )
+            channels.append(Image.frombytes("L", (width, height), rows))
+        return Image.merge("RGB", channels)
+
+    @staticmethod
+    def _gradient_rows(width: int, height: int) -> Image.Image:
+        """Gradyanı satır satır, sabit değerli aralıklar (run) olarak üretir.
+
+        Bir satırda kanal değeri x ile azalmadan artar ve en fazla
+        ``stop - start + 1`` farklı değer alır. Her değerin başladığı sütun
+        formülden tahmin edilip aynı ifadeyle bir iki adımda düzeltilir;
+        maliyet piksel sayısıyla değil, satır × değer sayısıyla ölçeklenir.
+        """
+        channels = []
+        for start, stop in SteganographyManager._GRADIENT_STOPS:
+            rows = []
+            for y in range(height):
+                y_part = y / height
+
+                def value(x: int) -> int:
+                    t = ((x / width) + y_part) / 2.0
+                    return int(start * (1 - t) + stop * t)
+
+                parts = []
+                x = 0
+                while x < width:
+                    v = value(x)
+                    # Bir sonraki değerin (v+1) başladığı ilk sütun
+                    t_next = (v + 1 - start) / (stop - start)
+                    nxt = min(width, max(x + 1, math.ceil((2 * t_next - y_part) * width)))
+                    while nxt > x + 1 and value(nxt - 1) > v:
+                        nxt -= 1
+                    while nxt < width and value(nxt) == v:
+                        nxt += 1
+                    parts.append(bytes((v,)) * (nxt - x))
+                    x = nxt
+                rows.append(b"".join(parts))
+            channels.append(Image.frombytes("L", (width, height), b"".join(rows)))
+        return Image.merge("RGB", channels)
 
     @staticmethod
     def get_capacity(image_path: str) -> int:
@@ -170,66 +325,186 @@ class SteganographyManager:
         return (total_bits // 8) - overhead
 
     @staticmethod
-    def encode(image_path: str, data: bytes) -> None:
-        """Veriyi görüntüye LSB yöntemiyle gömer."""
+    def encode(image_path: str, data: bytes, diff: bool = False) -> int:
+        """Veriyi görüntüye LSB yöntemiyle gömer.
+
+        ``diff=True`` ise yalnızca LSB'si değişen kanallar yeniden yazılır.
+        Dokunulan piksel sayısını döndürür.
+        """
+        carrier = CarrierBuffer.from_file(image_path)
+        touched = carrier.embed(data, diff=diff)
+        carrier.save(image_path)
+        return touched
+
+    @staticmethod
+    def _write_lsb(raw: bytearray, payload: bytes, start: int = 0) -> None:
+        """``payload`` bitlerini ``raw[start:]`` kanallarının LSB'sine toplu yazar."""
+        end = start + len(payload) * 8
+        if HAS_NUMPY:
+            region = np.frombuffer(raw, dtype=np.uint8)[start:end]
+            bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
+            np.bitwise_and(region, 0xFE, out=region)
+            np.bitwise_or(region, bits, out=region)
+            return
+
+        # LSB'leri sıfırla, bitleri yay ve tek bir büyük tamsayı OR'u ile birleştir
+        cleared = raw[start:end].translate(_LSB_CLEAR)
+        bits = b"".join(map(_BIT_SPREAD.__getitem__, payload))
+        merged = int.from_bytes(cleared, "big") | int.from_bytes(bits, "big")
+        raw[start:end] = merged.to_bytes(end - start, "big")
+
+    @staticmethod
+    def _write_lsb_diff(raw: bytearray, payload: bytes, start: int = 0) -> int:
+        """Yalnızca farklı olan LSB'leri çevirir; değişen piksel sayısını döndürür."""
+        end = start + len(payload) * 8
+        if HAS_NUMPY:
+            region = np.frombuffer(raw, dtype=np.uint8)[start:end]
+            bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
+            changed = np.flatnonzero((region & 1) ^ bits)
+            if changed.size == 0:
+                return 0
+            region[changed] ^= 1
+            return int(np.unique((changed + start) // 3).size)
+
+        current = SteganographyManager._read_lsb(raw, start, len(payload))
+        if current == payload:
+            return 0
+        diff = int.from_bytes(current, "big") ^ int.from_bytes(payload, "big")
+        # Kanal başına 0/1 çevirme bayrakları
+        flips = b"".join(map(_BIT_SPREAD.__getitem__, diff.to_bytes(len(payload), "big")))
+
+        # Yalnızca değişiklik içeren blokları yeniden yaz
+        block = 4096
+        zero = bytes(block)
+        for off in range(0, len(flips), block):
+            chunk = flips[off:off + block]
+            if chunk == zero[:len(chunk)]:
+                continue
+            lo, hi = start + off, start + off + len(chunk)
+            merged = int.from_bytes(raw[lo:hi], "big") ^ int.from_bytes(chunk, "big")
+            raw[lo:hi] = merged.to_bytes(hi - lo, "big")
+
+        # Bayrakları piksel sınırlarına hizala; R|G|B bayrağı olan pikselleri say
+        padded = bytes(start % 3) + flips
+        padded += bytes(-len(padded) % 3)
+        per_pixel = (int.from_bytes(padded[0::3], "big")
+                     | int.from_bytes(padded[1::3], "big")
+                     | int.from_bytes(padded[2::3], "big"))
+        return per_pixel.to_bytes(len(padded) // 3, "big").count(1)
+
+    @staticmethod
+    def _read_lsb(raw: bytes, start: int, count: int) -> bytes:
+        """``raw[start:]`` kanallarının LSB'lerinden ``count`` bayt toplar."""
+        end = start + count * 8
+        if HAS_NUMPY:
+            bits = np.frombuffer(raw, dtype=np.uint8)[start:end] & 1
+            return np.packbits(bits).tobytes()
+
+        # LSB'leri ayıkla, her 8'li grubu tek tablo aramasıyla bayta çevir
+        lsb = raw[start:end].translate(_LSB_ONLY)
+        return bytes(map(_BIT_PACK.__getitem__, memoryview(lsb).cast("Q")))
+
+    @staticmethod
+    def decode(image_path: str) -> bytes:
+        """Görüntüden LSB yöntemiyle veri çıkarır ve bütünlüğünü doğrular."""
+        return CarrierBuffer.from_file(image_path).extract()
+
+
+class CarrierBuffer:
+    """Çözülmüş taşıyıcı pikselleri (ham RGB baytları) bellekte tutar.
+
+    Kilit açıldıktan sonra ``DataManager`` tarafından saklanır; böylece her
+    kayıtta PNG yeniden okunup çözülmez, yalnızca LSB'ler yeniden yazılıp
+    görüntü sıkıştırılır.
+    """
+
+    OVERHEAD = 4 + 32  # uzunluk + checksum
+
+    def __init__(self, size: tuple[int, int], raw: bytearray):
+        self.size = size
+        self.raw = raw
+
+    @classmethod
+    def from_image(cls, img: Image.Image) -> "CarrierBuffer":
+        rgb = img if img.mode == "RGB" else img.convert("RGB")
+        return cls(rgb.size, bytearray(rgb.tobytes()))
+
+    @classmethod
+    def from_file(cls, image_path: str) -> "CarrierBuffer":
+        """PNG dosyasını bir kez çözerek tampon oluşturur."""
         with Image.open(image_path) as src:
-            rgb = src.convert("RGB")
-            size = rgb.size
-            raw = bytearray(rgb.tobytes())
+            return cls.from_image(src)
+
+    @classmethod
+    def blank(cls, width: int = 1024, height: int = 1024) -> "CarrierBuffer":
+        """Önbellekteki taşıyıcı şablonundan yeni bir tampon oluşturur."""
+        png = SteganographyManager._carrier_template(width, height)
+        with Image.open(io.BytesIO(png)) as src:
+            return cls.from_image(src)
 
+    @property
+    def capacity(self) -> int:
+        """Tamponun saklayabileceği maksimum veri baytı."""
+        return (len(self.raw) // 8) - self.OVERHEAD
+
+    def embed(self, data: bytes, diff: bool = False) -> int:
+        """Veriyi uzunluk başlığı ve checksum ile birlikte LSB'lere yazar.
+
+        ``diff=True`` ise mevcut LSB düzlemiyle karşılaştırıp yalnızca değişen
+        blokları yeniden yazar. Dokunulan piksel sayısını döndürür.
+        """
         checksum = hashlib.sha256(data).digest()
         payload = struct.pack(">I", len(data)) + data + checksum
 
-        max_bytes = len(raw) // 8
+        max_bytes = len(self.raw) // 8
         if len(payload) > max_bytes:
             raise ValueError(
                 f"Veri çok büyük ({len(payload)} bayt). "
                 f"Görüntü kapasitesi: {max_bytes} bayt."
             )
 
-        bit_idx = 0
-        for byte_val in payload:
-            for shift in range(7, -1, -1):
-                raw[bit_idx] = (raw[bit_idx] & 0xFE) | ((byte_val >> shift) & 1)
-                bit_idx += 1
+        if diff:
+            return SteganographyManager._write_lsb_diff(self.raw, payload)
+        SteganographyManager._write_lsb(self.raw, payload)
+        return -(-len(payload) * 8 // 3)
 
-        new_img = Image.frombytes("RGB", size, bytes(raw))
-        new_img.save(image_path, "PNG")
-        new_img.close()
+    def extract(self) -> bytes:
+        """LSB'lerden veriyi çıkarır ve bütünlüğünü doğrular."""
+        raw = self.raw
 
-    @staticmethod
-    def decode(image_path: str) -> bytes:
-        """Görüntüden LSB yöntemiyle veri çıkarır ve bütünlüğünü doğrular."""
-        with Image.open(image_path) as src:
-            rgb = src.convert("RGB")
-            raw = rgb.tobytes()
-
-        def _read_bytes(start_bit: int, count: int) -> tuple[bytes, int]:
-            result = bytearray(count)
-            idx = start_bit
-            for i in range(count):
-                val = 0
-                for _ in range(8):
-                    val = (val << 1) | (raw[idx] & 1)
-                    idx += 1
-                result[i] = val
-            return bytes(result), idx
-
-        # Uzunluk (4 bayt)
-        length_bytes, next_bit = _read_bytes(0, 4)
-        length = struct.unpack(">I", length_bytes)[0]
-
-        max_data = (len(raw) // 8) - 4 - 32
-        if length > max_data:
-            raise ValueError("Geçersiz veri uzunluğu; görüntü bozulmuş olabilir.")
+        # Önce uzunluk başlığı (4 bayt) okunur; sonra yalnızca gereken önek
+        length = struct.unpack(">I", SteganographyManager._read_lsb(raw, 0, 4))[0]
 
-        # Veri
-        data, next_bit = _read_bytes(next_bit, length)
+        if length > self.capacity:
+            raise ValueError("Geçersiz veri uzunluğu; görüntü bozulmuş olabilir.")
 
-        # Checksum (32 bayt SHA-256)
-        stored_checksum, _ = _read_bytes(next_bit, 32)
+        # Veri + checksum (32 bayt SHA-256) tek seferde
+        body = SteganographyManager._read_lsb(raw, 32, length + 32)
+        data, stored_checksum = body[:length], body[length:]
         calculated_checksum = hashlib.sha256(data).digest()
         if stored_checksum != calculated_checksum:
             raise ValueError("Veri bütünlüğü doğrulaması başarısız; veri bozulmuş.")
 
         return data
+
+    def save(self, image_path: str, compress_level: int = 6,
+             optimize: bool = False) -> None:
+        """Tamponu PNG olarak yazar (zlib seviyesi 0-9).
+
+        Önce yanına geçici dosyaya yazılır, sonra ``os.replace`` ile yerine
+        konur; yazma yarıda kalırsa eski görüntü bozulmadan kalır.
+        """
+        img = Image.frombytes("RGB", self.size, self.raw)
+        tmp_path = f"{image_path}.tmp"
+        try:
+            img.save(tmp_path, "PNG", compress_level=compress_level,
+                     optimize=optimize)
+            os.replace(tmp_path, image_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        finally:
+            img.close()
@@ -0,0 +1,580 @@
+"""Desen tabanlı (zxcvbn tarzı) şifre gücü tahmini.
+
+Karakter havuzu entropisi "Password1!Password1!" gibi şifreleri güçlü
+sayar. Burada şifre bilinen desenlere ayrılır ve her parça için saldırganın
+deneme sayısı (log2, bit) tahmin edilir:
+
+    sözlük   — sık şifreler, kelime listesi (ters yazım ve l33t dahil)
+    klavye   — QWERTY / tuş takımı yürüyüşleri ("qwerty", "zxcvbn", "7896")
+    tekrar   — tekrar eden parçalar ("aaaa", "abcabc", "Şifre1Şifre1")
+    dizi     — sabit adımlı diziler ("abcd", "9753", "ZYX")
+    tarih    — tarih ve yıllar ("1987", "12.05.1990", "250399")
+
+Eşleşmeyen karakterler kaba kuvvet (şifredeki sınıfların havuzu) sayılır.
+Dinamik programlama en ucuz ayrıştırmayı seçer; sonuç hiçbir zaman karakter
+havuzu entropisinden büyük olmaz. Sözlükler ve klavye grafları ilk
+kullanımda bir kez kurulur ve değiştirilmez.
+"""
+
+import functools
+import math
+import operator
+import os
+import re
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from datetime import date
+from typing import Iterable, Optional
+
+from securevault.generator import PasswordGenerator
+from securevault.wordlist import WORDLIST_DIR, Wordlist, default_wordlist
+
+COMMON_PASSWORDS_FILE = os.path.join(WORDLIST_DIR, "common_passwords.txt")
+
+MIN_MATCH_LENGTH = 3
+# Her desen parçası için ek maliyet (zxcvbn'deki parça sayısı faktöriyeli yerine)
+PATTERN_PENALTY_BITS = 1.0
+REFERENCE_YEAR = date.today().year
+MIN_YEAR_SPACE = 20
+# Desenler yalnızca ilk bu kadar karakterde aranır (üreteç üst sınırı);
+# fazlası kaba kuvvetle sayılır, böylece çok uzun girdide süre sınırlı kalır
+MAX_ANALYSIS_LENGTH = 128
+
+# Desen adları (arayüzde gösterilir)
+PATTERN_LABELS: dict[str, str] = {
+    "dictionary": "sözlük kelimesi",
+    "spatial": "klavye deseni",
+    "repeat": "tekrar",
+    "sequence": "dizi",
+    "date": "tarih",
+}
+
+# l33t karakteri → harf. "1" ve "|" hem i hem l olabilir: ikinci tabloda l
+_L33T_PRIMARY = str.maketrans({
+    "4": "a", "@": "a", "8": "b", "(": "c", "{": "c", "3": "e", "6": "g",
+    "9": "g", "1": "i", "!": "i", "|": "i", "0": "o", "$": "s", "5": "s",
+    "7": "t", "+": "t", "2": "z",
+})
+_L33T_ALTERNATE = str.maketrans({"1": "l", "|": "l", "!": "l"})
+_L33T_PRIMARY_RE = re.compile("[%s]" % re.escape("".join(map(chr, _L33T_PRIMARY))))
+_L33T_ALTERNATE_RE = re.compile("[%s]" % re.escape("".join(map(chr, _L33T_ALTERNATE))))
+# str.lower() "İ"yi iki karaktere ("i̇") çevirir; eşleşme indeksleri şifredeki
+# konumlarla hizalı kalsın diye önce tek "i"ye indirilir
+_SINGLE_CHAR_LOWER = str.maketrans({"İ": "i"})
+
+_KEYBOARD_ROWS = ("`1234567890-=", "qwertyuiop[]\\", "asdfghjkl;'", "zxcvbnm,./")
+_KEYBOARD_SHIFTED = ('~!@#$%^&*()_+', "QWERTYUIOP{}|", 'ASDFGHJKL:"', "ZXCVBNM<>?")
+_KEYPAD_ROWS = ("789", "456", "123", " 0.")
+_UNSHIFT = str.maketrans("".join(_KEYBOARD_SHIFTED), "".join(_KEYBOARD_ROWS))
+# Dizi adımı (kod noktası farkı, |fark| ≤ 5) → tek karakterlik kod
+_SEQUENCE_STEPS = {delta: chr(ord("f") + delta)
+                   for delta in range(-5, 6) if delta}
+# Aynı adımın en az iki kez art arda gelmesi = en az üç karakterlik dizi
+_SEQUENCE_RUN_RE = re.compile(r"([^.])\1+")
+# En az iki ardışık komşu adım = en az MIN_MATCH_LENGTH tuşluk yürüyüş
+_WALK_RE = re.compile(r"[^.]{%d,}" % (MIN_MATCH_LENGTH - 1))
+
+_YEAR_RE = re.compile(r"19\d\d|20\d\d")
+_SEPARATED_DATE_RE = re.compile(r"(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})")
+_DIGIT_RE = re.compile(r"\d")
+_DIGIT_RUN_RE = re.compile(r"\d{4,}")
+# Ayırıcısız tarihler için (gün/ay/yıl parçalarının) bölme noktaları
+_DATE_SPLITS: dict[int, tuple[tuple[int, int], ...]] = {
+    4: ((1, 2), (2, 3)),
+    5: ((1, 3), (2, 3)),
+    6: ((1, 2), (2, 4), (4, 5)),
+    7: ((1, 3), (2, 3), (4, 5), (4, 6)),
+    8: ((2, 4), (4, 6)),
+}
+_GREEDY_REPEAT_RE = re.compile(r"(.+)\1+")
+_LAZY_REPEAT_RE = re.compile(r"(.+?)\1+")
+_LAZY_ANCHORED_RE = re.compile(r"^(.+?)\1+$")
+
+# Eşleşme: (başlangıç, bitiş, bit, desen adı)
+Match = tuple[int, int, float, str]
+
+
+# --- Tembel kurulan, değişmeyen yapılar ----------------------------------
+
+# Kelime listeleri bulunamazsa (ör. eksik paketlenmiş derleme) kullanılan
+# en sık şifreler; güç tahmini çalışmaya devam eder, yalnızca kapsam daralır
+_FALLBACK_COMMON = (
+    "123456", "password", "123456789", "12345678", "12345", "qwerty",
+    "1234567", "111111", "1234567890", "123123", "abc123", "password1",
+    "iloveyou", "000000", "sifre", "qwerty123", "admin", "welcome",
+    "monkey", "dragon", "letmein", "football", "galatasaray", "fenerbahce",
+    "besiktas", "trabzonspor", "istanbul", "ankara", "izmir", "turkiye",
+)
+
+
+def _read_words(load, close: bool = False) -> list[str]:
+    """Liste dosyasındaki kelimeler; dosya yok/boş/okunamazsa boş liste."""
+    try:
+        words = load()
+        result = [words[i] for i in range(len(words))]
+    except (OSError, ValueError):
+        return []
+    if close:
+        words.close()
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _ranked_dictionary() -> tuple[list[str], array, dict[str, tuple[int, int]]]:
+    """Sıralı kelime dizisi, paralel tahmin sayısı dizisi ve 3 harflik önek aralıkları.
+
+    Sık şifreler dosya sırasıyla, kelime listesi (sırasız olduğundan) tek
+    tip liste boyutuyla sıralanır. Ters yazılmış kelimeler iki katı
+    tahminle aynı diziye eklenir; böylece şifre tek geçişte taranır.
+    Önek araması ``bisect`` ile yapılır; ilk üç harfin aralığı (``grams``)
+    eşleşme imkânı olmayan başlangıçları tek sözlük bakışıyla eler.
+    Liste dosyaları yoksa ``_FALLBACK_COMMON`` kullanılır.
+    """
+    ranks: dict[str, int] = {}
+    words = _read_words(default_wordlist)
+    for word in map(_lower, words):
+        if len(word) >= MIN_MATCH_LENGTH:
+            ranks[word] = len(words)
+    del words
+
+    common = (_read_words(lambda: Wordlist(COMMON_PASSWORDS_FILE), close=True)
+              or list(_FALLBACK_COMMON))
+    for i, word in enumerate(map(_lower, common)):
+        if len(word) >= MIN_MATCH_LENGTH:
+            ranks[word] = min(ranks.get(word, i + 1), i + 1)
+
+    for word, rank in list(ranks.items()):
+        backwards = word[::-1]
+        if backwards not in ranks:
+            ranks[backwards] = rank * 2
+
+    ordered = sorted(ranks)
+    guesses = array("Q", map(ranks.__getitem__, ordered))
+    grams: dict[str, tuple[int, int]] = {}
+    for index, word in enumerate(ordered):
+        gram = word[:MIN_MATCH_LENGTH]
+        lo, _ = grams.get(gram, (index, index))
+        grams[gram] = (lo, index + 1)
+    return ordered, guesses, grams
+
+
+def _grid_graph(rows: tuple[str, ...], staggered: bool) -> dict[str, dict[str, tuple]]:
+    """Tuş → {komşu tuş: yön}. Kaydırmalı klavyede alt satır yarım tuş sağdadır."""
+    pos = {ch: (r, c) for r, row in enumerate(rows)
+           for c, ch in enumerate(row) if ch != " "}
+    graph: dict[str, dict[str, tuple]] = {}
+    for ch, (r, c) in pos.items():
+        if staggered:
+            deltas = ((0, -1), (0, 1), (-1, 0), (-1, 1), (1, -1), (1, 0))
+        else:
+            deltas = tuple((dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                           if dr or dc)
+        neighbours = {}
+        for dr, dc in deltas:
+            rr, cc = r + dr, c + dc
+            if 0 <= rr < len(rows) and 0 <= cc < len(rows[rr]) and rows[rr][cc] != " ":
+                neighbours[rows[rr][cc]] = (dr, dc)
+        graph[ch] = neighbours
+    return graph
+
+
+@functools.lru_cache(maxsize=None)
+def _keyboard_graphs() -> tuple[tuple[dict[str, str], int, float,
+                                       Optional[re.Pattern]], ...]:
+    """(komşu tuş çifti → yön kodu, tuş sayısı, ortalama komşu sayısı, ön süzgeç).
+
+    Çiftler "qw" gibi iki harflik dizelerdir ve yön tek karakterle
+    kodlanır; böylece şifredeki adımlar tek bir dizeye çevrilip
+    yürüyüşler düzenli ifadeyle bulunur (bkz. ``_spatial_matches``).
+    Tuş takımında yürüyüş ancak art arda MIN_MATCH_LENGTH tuş takımı
+    karakteriyle mümkündür; ön süzgeç bunu tek aramayla eler.
+    """
+    graphs = []
+    for rows, staggered in ((_KEYBOARD_ROWS, True), (_KEYPAD_ROWS, False)):
+        graph = _grid_graph(rows, staggered)
+        codes: dict[tuple, str] = {}
+        adjacent = {
+            a + b: codes.setdefault(direction, chr(ord("a") + len(codes)))
+            for a, neighbours in graph.items()
+            for b, direction in neighbours.items()
+        }
+        degree = sum(len(n) for n in graph.values()) / len(graph)
+        gate = None if staggered else re.compile(
+            "[%s]{%d,}" % (re.escape("".join(graph)), MIN_MATCH_LENGTH))
+        graphs.append((adjacent, len(graph), degree, gate))
+    return tuple(graphs)
+
+
+def _lower(text: str) -> str:
+    """Uzunluğu koruyan küçük harfe çevirme (tek istisna "İ")."""
+    return text.translate(_SINGLE_CHAR_LOWER).lower()
+
+
+# --- Varyasyon çarpanları ------------------------------------------------
+
+def _variations(changed: int, unchanged: int) -> int:
+    """Büyük harf/shift/l33t gibi karakter değişimlerinin çarpanı (zxcvbn)."""
+    if changed == 0:
+        return 1
+    if unchanged == 0:
+        return 2
+    return sum(math.comb(changed + unchanged, i)
+               for i in range(1, min(changed, unchanged) + 1))
+
+
+def _uppercase_variations(token: str) -> int:
+    if token.islower() or not any(c.isalpha() for c in token):
+        return 1
+    if token.isupper() or (token[0].isupper() and token[1:].islower()) \
+            or (token[-1].isupper() and token[:-1].islower()):
+        return 2
+    upper = sum(c.isupper() for c in token)
+    lower = sum(c.islower() for c in token)
+    return _variations(upper, lower)
+
+
+def _l33t_variations(token: str, word: str) -> int:
+    subs: dict[tuple[str, str], int] = {}
+    for t, w in zip(_lower(token), word):
+        if t != w:
+            subs[(t, w)] = subs.get((t, w), 0) + 1
+    result = 1
+    for (subbed, letter), count in subs.items():
+        plain = word.count(letter) - count
+        result *= _variations(count, plain)
+    return result
+
+
+# --- Eşleştiriciler ------------------------------------------------------
+
+def _dictionary_scan(password: str, lower: str, text: str,
+                     starts: Iterable[tuple[int, int]], l33t: bool,
+                     matches: list[Match]) -> list[int]:
+    """``text`` içinde (i, j) başlangıçlarından sözlük kelimelerini arar.
+
+    i'den başlayan, en az ``j - i`` uzunluktaki kelimeler ``matches``e
+    eklenir. Her başlangıç için önek aramasının koptuğu konum döndürülür.
+    """
+    words, ranks, grams = _ranked_dictionary()
+    get_bounds = grams.get
+    n = len(text)
+    breaks = []
+    for i, j in starts:
+        bounds = get_bounds(text[i:i + MIN_MATCH_LENGTH])
+        if bounds is None:
+            breaks.append(i + MIN_MATCH_LENGTH)
+            continue
+        lo, hi = bounds
+        # words[lo]: text[i:j] ile başlayan en küçük kelime. Bir sonraki
+        # karakter de ona uyuyorsa öneki uzatmak için bisect gerekmez
+        if j > i + MIN_MATCH_LENGTH:
+            prefix = text[i:j]
+            lo = bisect_left(words, prefix, lo, hi)
+            if lo == hi or not words[lo].startswith(prefix):
+                breaks.append(j)
+                continue
+        word = words[lo]
+        while True:
+            if len(word) == j - i and not (l33t and lower[i:j] == word):
+                token = password[i:j]
+                guesses = ranks[lo] * _uppercase_variations(token)
+                if l33t:
+                    guesses *= _l33t_variations(token, word)
+                matches.append((i, j, math.log2(guesses), "dictionary"))
+            if j == n:
+                j += 1
+                break
+            j += 1
+            prefix = text[i:j]
+            if not word.startswith(prefix):
+                lo = bisect_left(words, prefix, lo, hi)
+                if lo == hi:
+                    break
+                word = words[lo]
+                if not word.startswith(prefix):
+                    break
+        breaks.append(j)
+    return breaks
+
+
+def _refined_starts(changes: list[int], starts: list[tuple[int, int]],
+                    breaks: list[int]) -> list[tuple[int, int]]:
+    """Metnin ``changes`` konumları değişince yeniden aranması gereken başlangıçlar.
+
+    Yeni eşleşme, i'den sonraki ilk değişikliği kapsamalıdır. Değişiklik
+    önceki aramanın koptuğu yerden önce değilse arama orada da kopar; bu
+    başlangıçlar atlanır, kalanlarda arama doğrudan değişikliği kapsayan
+    önekten başlar.
+    """
+    # following[i]: i'den sonraki ilk değişiklik (son değişiklikten sonra yok)
+    following: list[int] = []
+    for change in changes:
+        following += [change] * (change + 1 - len(following))
+    last = len(following)
+    return [(i, max(j, following[i] + 1))
+            for (i, j), stop in zip(starts, breaks)
+            if i < last and following[i] < stop]
+
+
+def _dictionary_matches(password: str) -> list[Match]:
+    lower = _lower(password)
+    n = len(lower)
+    matches: list[Match] = []
+    starts = [(i, i + MIN_MATCH_LENGTH) for i in range(n - MIN_MATCH_LENGTH + 1)]
+    breaks = _dictionary_scan(password, lower, lower, starts, False, matches)
+
+    # l33t: önce birincil çeviri sade metne göre, ardından "1|!" → "l"
+    # seçeneği birincil çeviriye göre aranır
+    changes = [m.start() for m in _L33T_PRIMARY_RE.finditer(lower)]
+    starts = _refined_starts(changes, starts, breaks) if changes else []
+    if not starts:
+        return matches
+    primary = lower.translate(_L33T_PRIMARY)
+    breaks = _dictionary_scan(password, lower, primary, starts, True, matches)
+    changes = [m.start() for m in _L33T_ALTERNATE_RE.finditer(lower)]
+    if changes:
+        alternate = lower.translate(_L33T_ALTERNATE).translate(_L33T_PRIMARY)
+        _dictionary_scan(password, lower, alternate,
+                         _refined_starts(changes, starts, breaks), True, matches)
+    return matches
+
+
+@functools.lru_cache(maxsize=1024)
+def _spatial_guesses(starts: int, degree: float, length: int, turns: int) -> float:
+    """``length`` tuşluk, ``turns`` dönüşlü yürüyüş için deneme sayısı (zxcvbn).
+
+    Yalnızca sayılara bağlıdır; önbellekte şifre parçası tutulmaz.
+    """
+    guesses = 0
+    for k in range(2, length + 1):
+        for t in range(1, min(turns, k - 1) + 1):
+            guesses += math.comb(k - 1, t - 1) * starts * degree ** t
+    return guesses
+
+
+def _spatial_matches(password: str) -> list[Match]:
+    matches: list[Match] = []
+    unshifted = password.translate(_UNSHIFT)
+    for adjacent, starts, degree, gate in _keyboard_graphs():
+        if gate is not None and gate.search(unshifted) is None:
+            continue
+        # Adım i: i→i+1 tuşları komşuysa yön kodu, değilse "."
+        steps = "".join(map(adjacent.get,
+                            map(operator.add, unshifted, unshifted[1:]),
+                            repeat(".")))
+        for walk in _WALK_RE.finditer(steps):
+            i, j = walk.start(), walk.end()
+            codes = walk.group(0)
+            turns = 1 + sum(a != b for a, b in zip(codes, codes[1:]))
+            length = j - i + 1
+            guesses = _spatial_guesses(starts, degree, length, turns)
+            token = password[i:j + 1]
+            shifted = sum(1 for a, b in zip(token, unshifted[i:j + 1]) if a != b)
+            guesses *= _variations(shifted, length - shifted)
+            matches.append((i, j + 1, math.log2(guesses), "spatial"))
+    return matches
+
+
+def _sequence_matches(password: str) -> list[Match]:
+    matches: list[Match] = []
+    # Adım i: password[i]→password[i+1] kod noktası farkı (|fark| ≤ 5), yoksa "."
+    steps = "".join(map(_SEQUENCE_STEPS.get,
+                        map(operator.sub, map(ord, password[1:]), map(ord, password)),
+                        repeat(".")))
+    for run in _SEQUENCE_RUN_RE.finditer(steps):
+        end = run.end() + 1
+        # Karışık harf/rakam içeren dizide eşleşme sağdaki en uzun geçerli parçadır
+        for i in range(run.start(), end - MIN_MATCH_LENGTH + 1):
+            token = password[i:end]
+            if token.islower() or token.isupper() or token.isdigit():
+                first = token[0]
+                if first in "aAzZ019":
+                    base = 4
+                elif first.isdigit():
+                    base = 10
+                else:
+                    base = 26
+                delta = ord(run.group(1)) - ord("f")
+                guesses = base * len(token) * (2 if delta < 0 else 1)
+                matches.append((i, end, math.log2(guesses), "sequence"))
+                break
+    return matches
+
+
+def _repeat_matches(password: str) -> list[Match]:
+    matches: list[Match] = []
+    pos = 0
+    n = len(password)
+    while pos < n:
+        greedy = _GREEDY_REPEAT_RE.search(password, pos)
+        if greedy is None:
+            break
+        lazy = _LAZY_REPEAT_RE.search(password, pos)
+        if len(greedy.group(0)) > len(lazy.group(0)):
+            match = greedy
+            anchored = _LAZY_ANCHORED_RE.match(match.group(0))
+            base = anchored.group(1) if anchored else match.group(1)
+        else:
+            match = lazy
+            base = match.group(1)
+        repeats = len(match.group(0)) // len(base)
+        base_bits = _minimum_bits(base)[0]
+        bits = base_bits + math.log2(repeats)
+        matches.append((match.start(), match.end(), bits, "repeat"))
+        pos = match.end()
+    return matches
+
+
+def _year_guesses(year: int) -> int:
+    return max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE)
+
+
+def _as_date(parts: tuple[int, ...], year_first: bool) -> Optional[int]:
+    """Parçalar geçerli bir tarihse yılı döndürür (iki haneli yıllar genişletilir)."""
+    if year_first:
+        year, a, b = parts
+    else:
+        a, b, year = parts
+    if year < 100:
+        year += 1900 if year > 50 else 2000
+    if not 1000 <= year <= 2050:
+        return None
+    for day, month in ((a, b), (b, a)):
+        if 1 <= month <= 12 and 1 <= day <= 31:
+            return year
+    return None
+
+
+def _digit_date_guesses(token: str) -> Optional[int]:
+    """Ayırıcısız 4–8 haneli ``token`` tarih olarak okunabiliyorsa en ucuz tahmin sayısı."""
+    best: Optional[int] = None
+    for k, l in _DATE_SPLITS[len(token)]:
+        parts = (int(token[:k]), int(token[k:l]), int(token[l:]))
+        for year_first in (True, False):
+            year = _as_date(parts, year_first)
+            if year is not None:
+                guesses = _year_guesses(year) * 365
+                best = guesses if best is None else min(best, guesses)
+    return best
+
+
+@functools.lru_cache(maxsize=None)
+def _four_digit_dates() -> tuple[Optional[int], ...]:
+    """Tüm 4 haneli parçalar ("0000"–"9999") için ``_digit_date_guesses`` tablosu.
+
+    Şifrelerdeki rakam grupları çoğunlukla yıl/PIN uzunluğundadır; tablo
+    bu en sık durumda ayrıştırmayı tek indeks erişimine indirir.
+    """
+    return tuple(_digit_date_guesses(f"{value:04d}") for value in range(10_000))
+
+
+def _date_matches(password: str) -> list[Match]:
+    matches: list[Match] = []
+    if _DIGIT_RE.search(password) is None:
+        return matches
+    for m in _YEAR_RE.finditer(password):
+        bits = math.log2(_year_guesses(int(m.group(0))))
+        matches.append((m.start(), m.end(), bits, "date"))
+
+    for m in _SEPARATED_DATE_RE.finditer(password):
+        a, c, b = m.group(1), m.group(3), m.group(4)
+        parts = (int(a), int(c), int(b))
+        if len(a) == 4:
+            orders = (True,)
+        elif len(b) == 4:
+            orders = (False,)
+        else:
+            orders = (True, False)
+        year = None
+        for year_first in orders:
+            year = _as_date(parts, year_first)
+            if year is not None:
+                break
+        if year is not None:
+            guesses = _year_guesses(year) * 365 * 4
+            matches.append((m.start(), m.end(), math.log2(guesses), "date"))
+
+    four_digit = _four_digit_dates()
+    for run in _DIGIT_RUN_RE.finditer(password):
+        digits = run.group(0)
+        for i in range(len(digits) - 3):
+            for j in range(i + 4, min(len(digits), i + 8) + 1):
+                token = digits[i:j]
+                best = (four_digit[int(token)] if len(token) == 4
+                        else _digit_date_guesses(token))
+                if best is not None:
+                    start = run.start() + i
+                    matches.append((start, start + len(token),
+                                    math.log2(best), "date"))
+    return matches
+
+
+_MATCHERS = (_dictionary_matches, _spatial_matches, _sequence_matches,
+             _repeat_matches, _date_matches)
+
+
+# --- Tahmin ---------------------------------------------------------------
+
+def _bruteforce_bits(password: str) -> float:
+    """Eşleşmeyen karakter başına bit: şifrede bulunan sınıfların havuzu."""
+    return PasswordGenerator.get_entropy(password) / len(password)
+
+
+def _minimum_bits(password: str) -> tuple[float, list[tuple[str, str]]]:
+    """En ucuz ayrıştırmanın bit değeri ve (desen, parça) listesi."""
+    n = len(password)
+    if n == 0:
+        return 0.0, []
+    per_char = _bruteforce_bits(password)
+
+    # Tekrar dışındaki desenler en az MIN_MATCH_LENGTH karakter ister
+    matchers = _MATCHERS if n >= MIN_MATCH_LENGTH else (_repeat_matches,)
+    found = [match for matcher in matchers for match in matcher(password)]
+    if not found:
+        return n * per_char, []
+    ending: list[list[Match]] = [[] for _ in range(n + 1)]
+    for match in found:
+        ending[match[1]].append(match)
+
+    best = [0.0] * (n + 1)
+    back: list[Optional[Match]] = [None] * (n + 1)
+    for j in range(1, n + 1):
+        best[j] = best[j - 1] + per_char
+        back[j] = None
+        for match in ending[j]:
+            cost = best[match[0]] + match[2] + PATTERN_PENALTY_BITS
+            if cost < best[j]:
+                best[j] = cost
+                back[j] = match
+
+    patterns: list[tuple[str, str]] = []
+    j = n
+    while j > 0:
+        match = back[j]
+        if match is None:
+            j -= 1
+            continue
+        patterns.append((match[3], password[match[0]:match[1]]))
+        j = match[0]
+    patterns.reverse()
+    return best[n], patterns
+
+
+def estimate_bits(password: str) -> dict:
+    """Desen tabanlı tahmin: ``{"bits": float, "patterns": [(desen, parça)]}``.
+
+    ``bits`` log2(tahmini deneme sayısı)'dır ve karakter havuzu
+    entropisini aşmaz. Desenler ilk MAX_ANALYSIS_LENGTH karakterde aranır.
+    """
+    head = password[:MAX_ANALYSIS_LENGTH]
+    bits, patterns = _minimum_bits(head)
+    if len(password) > len(head):
+        bits += (len(password) - len(head)) * _bruteforce_bits(password)
+    return {"bits": bits, "patterns": patterns}
+
+
+def describe_patterns(patterns: list[tuple[str, str]]) -> str:
+    """Desen listesini arayüz için kısa metne çevirir ("sözlük kelimesi, tarih")."""
+    names = dict.fromkeys(PATTERN_LABELS[name] for name, _ in patterns)
+    return ", ".join(names)
@@ -0,0 +1,228 @@
+"""Büyük listeler için sanal (pencereli) Treeview."""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Optional, Sequence
+
+# Satır: (iid, değerler) veya (iid, değerler, etiketler)
+Row = tuple
+
+
+def sync_tree(tree: ttk.Treeview, rows: Sequence[Row],
+              shown: dict[str, tuple]) -> None:
+    """Ağacı ``rows`` sırasına getirir; yalnızca değişen satırlara dokunur.
+
+    ``shown`` ağaçta şu an bulunan satırların (değerler, etiketler) çiftini
+    tutar ve yerinde güncellenir (Tk'den değer okuyup karşılaştırmak hem
+    yavaş hem de sayısal metinleri int'e çevirdiği için güvenilmezdir).
+    """
+    wanted = {row[0] for row in rows}
+    stale = [iid for iid in shown if iid not in wanted]
+    if stale:
+        tree.delete(*stale)
+        for iid in stale:
+            del shown[iid]
+
+    # Kalan satırlar mevcut sıralarıyla; sırası bozulanlar taşınır
+    current = [iid for iid in tree.get_children() if iid in shown]
+    moved: set[str] = set()
+    pos = 0
+    for index, row in enumerate(rows):
+        iid, values = row[0], row[1]
+        tags = row[2] if len(row) > 2 else ()
+        while pos < len(current) and current[pos] in moved:
+            pos += 1
+        if pos < len(current) and current[pos] == iid:
+            pos += 1
+        elif iid in shown:
+            tree.move(iid, "", index)
+            moved.add(iid)
+        else:
+            tree.insert("", index, iid=iid, values=values, tags=tags)
+            shown[iid] = (values, tags)
+            continue
+        if shown[iid] != (values, tags):
+            tree.item(iid, values=values, tags=tags)
+            shown[iid] = (values, tags)
+
+
+class VirtualTreeview(tk.Frame):
+    """Yalnızca görünen satırları (± tampon) Tk öğesi olarak tutan liste.
+
+    Tüm satırlar Python listesinde durur; kaydırma çubuğu, fare tekerleği
+    ve klavye gezintisi sanal bir üst satır indeksini değiştirir ve ağaç
+    yalnızca o pencere için ``sync_tree`` ile güncellenir. Böylece on
+    binlerce kayıtta da Tk tarafında birkaç düzine öğe bulunur.
+
+    Seçim iid ile tutulur; seçili satır pencere dışına kaysa da korunur.
+    Seçim kullanıcı tarafından değiştiğinde ``on_select()`` çağrılır.
+    """
+
+    BUFFER = 10
+
+    def __init__(self, parent, columns: Sequence[str],
+                 on_select: Optional[Callable[[], None]] = None,
+                 bg: Optional[str] = None) -> None:
+        super().__init__(parent, bg=bg)
+        self.tree = ttk.Treeview(self, columns=tuple(columns),
+                                 show="headings", selectmode="browse")
+        self._vsb = ttk.Scrollbar(self, orient="vertical",
+                                  command=self._on_scrollbar)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self._vsb.pack(side="right", fill="y")
+
+        self._rows: list[Row] = []
+        self._index: dict[str, int] = {}
+        self._shown: dict[str, tuple] = {}
+        self._top = 0
+        self._visible = 20
+        self._selected: Optional[str] = None
+        self._on_select = on_select
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_wheel)
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.tree.bind(key, self._on_key)
+
+    # --- ttk.Treeview'e devredilenler ------------------------------------
+
+    def heading(self, column: str, **kw):
+        return self.tree.heading(column, **kw)
+
+    def column(self, column: str, **kw):
+        return self.tree.column(column, **kw)
+
+    def tag_configure(self, tag: str, **kw):
+        return self.tree.tag_configure(tag, **kw)
+
+    # --- Veri ------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def set_rows(self, rows: Sequence[Row]) -> None:
+        """Tüm satırları değiştirir; seçili satır listede kalmadıysa seçim düşer."""
+        self._rows = list(rows)
+        self._index = {row[0]: i for i, row in enumerate(self._rows)}
+        dropped = self._selected is not None and self._selected not in self._index
+        if dropped:
+            self._selected = None
+        self._render()
+        if dropped and self._on_select:
+            self._on_select()
+
+    # --- Seçim -----------------------------------------------------------
+
+    def selection(self) -> tuple[str, ...]:
+        return (self._selected,) if self._selected is not None else ()
+
+    def selection_set(self, iid: str) -> None:
+        if iid not in self._index:
+            return
+        self._selected = iid
+        self.see(iid)
+
+    def selection_remove(self, *iids: str) -> None:
+        if self._selected is not None and (not iids or self._selected in iids):
+            self._selected = None
+            self.tree.selection_remove(*self.tree.selection())
+
+    def see(self, iid: str) -> None:
+        """Satır pencerede değilse onu görünür kılacak şekilde kaydırır."""
+        idx = self._index.get(iid)
+        if idx is None:
+            return
+        if idx < self._top:
+            self._top = idx
+        elif idx >= self._top + self._visible:
+            self._top = idx - self._visible + 1
+        self._render()
+
+    # --- Çizim -----------------------------------------------------------
+
+    def _render(self) -> None:
+        total = len(self._rows)
+        self._top = max(0, min(self._top, total - self._visible))
+        start = max(0, self._top - self.BUFFER)
+        end = min(total, self._top + self._visible + self.BUFFER)
+        sync_tree(self.tree, self._rows[start:end], self._shown)
+        if end > start:
+            self.tree.yview_moveto((self._top - start) / (end - start))
+
+        if self._selected in self._shown:
+            if self.tree.selection() != (self._selected,):
+                self.tree.selection_set(self._selected)
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+
+        if total:
+            self._vsb.set(self._top / total,
+                          min(1.0, (self._top + self._visible) / total))
+        else:
+            self._vsb.set(0.0, 1.0)
+
+    def _scroll_to(self, top: int) -> None:
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    # --- Olaylar ---------------------------------------------------------
+
+    def _on_resize(self, event) -> None:
+        row_h = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        header_h = row_h
+        if self._rows:
+            bbox = self.tree.bbox(self._rows[self._top][0])
+            if bbox:
+                header_h = bbox[1]
+        visible = max(1, (event.height - header_h) // row_h)
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _on_scrollbar(self, action: str, amount: str, unit: str = "") -> None:
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * len(self._rows)))
+        elif action == "scroll":
+            step = int(amount) * (self._visible if unit == "pages" else 1)
+            self._scroll_to(self._top + step)
+
+    def _on_wheel(self, event) -> str:
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self._scroll_to(self._top + (-3 if up else 3))
+        return "break"
+
+    def _on_key(self, event) -> str:
+        if not self._rows:
+            return "break"
+        last = len(self._rows) - 1
+        current = self._index.get(self._selected, self._top - 1)
+        moves = {
+            "Up": current - 1,
+            "Down": current + 1,
+            "Prior": current - self._visible,
+            "Next": current + self._visible,
+            "Home": 0,
+            "End": last,
+        }
+        idx = max(0, min(last, moves.get(event.keysym, current)))
+        iid = self._rows[idx][0]
+        if iid != self._selected:
+            self.selection_set(iid)
+            if self._on_select:
+                self._on_select()
+        return "break"
+
+    def _on_tree_select(self, _event=None) -> None:
+        sel = self.tree.selection()
+        new = sel[0] if sel else None
+        if new == self._selected:
+            return
+        if new is None and self._selected not in self._shown:
+            # Seçili satır pencereden çıktığı için Tk seçimi boşaldı
+            return
+        self._selected = new
+        if self._on_select:
+            self._on_select()
@@ -0,0 +1,95 @@
+"""Parola cümlesi (diceware) üretimi için bellek eşlemeli kelime listeleri.
+
+Liste dosyası ``mmap`` ile açılır ve yalnızca satır başı/sonu ofsetleri
+``array`` içinde tutulur; 100 binlerce kelimelik listelerde bile Python
+string listesi oluşturulmaz ve rastgele kelime erişimi O(1)'dir. Dosya ilk
+erişimde açılır, böylece uygulama açılışı yavaşlamaz.
+
+Desteklenen biçimler (UTF-8, satır başına bir kelime):
+    - düz liste:            ``kelime``
+    - EFF/diceware biçimi:  ``11111<TAB>kelime``
+Boş satırlar ve ``#`` ile başlayan satırlar atlanır. Entropi hesabı liste
+boyutuna dayandığından kelimeler benzersiz olmalıdır.
+"""
+
+import functools
+import mmap
+import os
+import threading
+from array import array
+from typing import Optional
+
+WORDLIST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "wordlists")
+# Tercih sırası: EFF büyük listesi klasöre konduysa o, yoksa paketle gelen liste
+DEFAULT_WORDLISTS = ("eff_large_wordlist.txt", "common_en.txt")
+
+
+class Wordlist:
+    """Ofset indeksli, tembel yüklenen salt okunur kelime listesi."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._mm: Optional[mmap.mmap] = None
+        # Kelime i: _bounds[2i] .. _bounds[2i+1] bayt aralığı
+        self._bounds: Optional[array] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self) -> None:
+        if self._bounds is not None:
+            return
+        with self._lock:
+            if self._bounds is not None:
+                return
+            with open(self.path, "rb") as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            bounds = array("Q")
+            size = len(mm)
+            pos = 0
+            while pos < size:
+                nl = mm.find(b"\n", pos)
+                if nl == -1:
+                    nl = size
+                tab = mm.find(b"\t", pos, nl)
+                start = tab + 1 if tab != -1 else pos
+                end = nl
+                while end > start and mm[end - 1] in b"\r \t":
+                    end -= 1
+                if end > start and mm[start] != ord("#"):
+                    bounds.append(start)
+                    bounds.append(end)
+                pos = nl + 1
+            if not bounds:
+                mm.close()
+                raise ValueError(f"Kelime listesi boş: {self.path}")
+            self._mm = mm
+            self._bounds = bounds
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._bounds) // 2
+
+    def __getitem__(self, index: int) -> str:
+        self._ensure_loaded()
+        if not 0 <= index < len(self._bounds) // 2:
+            raise IndexError("Kelime indeksi liste dışında.")
+        start = self._bounds[2 * index]
+        end = self._bounds[2 * index + 1]
+        return self._mm[start:end].decode("utf-8")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mm is not None:
+                self._mm.close()
+            self._mm = None
+            self._bounds = None
+
+
+@functools.lru_cache(maxsize=None)
+def default_wordlist() -> Wordlist:
+    """``WORDLIST_DIR`` içindeki ilk mevcut listeyi döndürür (süreç boyunca tek)."""
+    for name in DEFAULT_WORDLISTS:
+        path = os.path.join(WORDLIST_DIR, name)
+        if os.path.exists(path):
+            return Wordlist(path)
+    raise FileNotFoundError(f"Kelime listesi bulunamadı: {WORDLIST_DIR}")
@@ -6,6 +6,7 @@ Tüm modülleri edge case'ler ve performans testleriyle doğrular.
 """
 
 import base64
+import hashlib
 import json
 import math
 import os
@@ -14,16 +15,26 @@ import shutil
 import string
 import sys
 import tempfile
+import threading
 import time
 
 # Proje kök dizinini path'e ekle
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from securevault.crypto import CryptoManager
-from securevault.steganography import SteganographyManager
-from securevault.generator import PasswordGenerator
+from PIL import Image
+
+from securevault.constants import PNG_SAVE_PROFILES
+from securevault.crypto import CipherSession, CryptoManager, KdfUnavailableError
+from securevault.steganography import CarrierBuffer, SteganographyManager
+from securevault.generator import PasswordGenerator, classify_chars
+from securevault.wordlist import Wordlist, default_wordlist
 from securevault.health import PasswordHealthAnalyzer
-from securevault.data_manager import DataManager
+from securevault.data_manager import DataManager, OperationCancelled
+from securevault.search import FuzzySearchEngine, SearchIndex
+from securevault.strength import estimate_bits
+from securevault.widgets import sync_tree
+import securevault.strength as strength_mod
+import securevault.wordlist as wordlist_mod
 
 # ─── Yardımcılar ────────────────────────────────────────────────────────
 passed = 0
@@ -148,6 +159,85 @@ def test_crypto():
     else:
         fail("Nonce benzersizliği — ciphertext'ler aynı")
 
+    # --- 1.12 create_master_key tek türetmede kayıt + anahtar üretir ---
+    calls = []
+    real_derive = CryptoManager.derive_key
+    CryptoManager.derive_key = staticmethod(
+        lambda *args: (calls.append(1), real_derive(*args))[1])
+    try:
+        stored_mk, key_mk = CryptoManager.create_master_key("TekTuretme#1")
+    finally:
+        CryptoManager.derive_key = staticmethod(real_derive)
+    if (len(calls) == 1 and key_mk ==
+            CryptoManager.verify_master_password("TekTuretme#1", stored_mk)):
+        ok("create_master_key: 1 türetme, doğrulanabilir kayıt")
+    else:
+        fail("create_master_key", f"türetme={len(calls)}")
+
+    # --- 1.13 Her KDF arka ucu ile kayıt/doğrulama ---
+    from securevault.crypto import KDF_BACKENDS
+    kdf_results = {}
+    for kdf in KDF_BACKENDS:
+        stored_k, key_k = CryptoManager.create_master_key("KdfTest#1", kdf)
+        kdf_results[kdf] = (
+            stored_k["kdf"] == kdf
+            and CryptoManager.verify_master_password("KdfTest#1", stored_k) == key_k
+            and CryptoManager.verify_master_password("Yanlis", stored_k) is None)
+    if all(kdf_results.values()) and "scrypt" in kdf_results:
+        ok(f"KDF arka uçları: {', '.join(kdf_results)}")
+    else:
+        fail("KDF arka uçları", str(kdf_results))
+
+    # --- 1.14 Kalibrasyon alt sınırları ve eski kayıt biçimi ---
+    pb = CryptoManager.calibrate_kdf("pbkdf2", target_seconds=0.001)
+    sc = CryptoManager.calibrate_kdf("scrypt", target_seconds=0.001)
+    legacy = {"salt": stored["salt"], "hash": stored["hash"]}
+    current = CryptoManager.create_master_key("x")[0]
+    weak = dict(current, params={k: (v // 2 if k != "parallelism" else v)
+                                 for k, v in current["params"].items()})
+    # Yükseltme kararı süre ölçmeden, sabit alt sınırlarla verilmeli
+    def no_calibration(*args, **kwargs):
+        raise AssertionError("kdf_needs_upgrade kalibrasyon yaptı")
+
+    real_calibrate = CryptoManager.calibrate_kdf
+    CryptoManager.calibrate_kdf = staticmethod(no_calibration)
+    try:
+        upgrade_ok = (CryptoManager.kdf_needs_upgrade(legacy)
+                      and not CryptoManager.kdf_needs_upgrade(current)
+                      and CryptoManager.kdf_needs_upgrade(weak))
+    finally:
+        CryptoManager.calibrate_kdf = real_calibrate
+    if (pb["iterations"] >= CryptoManager.ITERATIONS and sc["n"] >= 2 ** 15
+            and upgrade_ok):
+        ok("Kalibrasyon alt sınırları korunuyor; eski/zayıf kayıt yükseltilecek")
+    else:
+        fail("Kalibrasyon", f"{pb}, {sc}, yükseltme={upgrade_ok}")
+
+    # --- 1.15 CipherSession: CryptoManager biçimiyle uyumlu, tamponlu ---
+    session_key = secrets.token_bytes(32)
+    session = CipherSession(session_key)
+    big = secrets.token_bytes(1 << 20)
+    blob = session.encrypt(big)
+    tampered = bytearray(blob)
+    tampered[-1] ^= 1
+    try:
+        session.decrypt(tampered)
+        tamper_caught = False
+    except Exception:
+        tamper_caught = True
+    try:
+        session.decrypt(b"kisa")
+        short_caught = False
+    except ValueError:
+        short_caught = True
+    if (session.decrypt(blob) == big
+            and CryptoManager.decrypt(bytes(blob), session_key) == big
+            and session.decrypt(CryptoManager.encrypt(b"x", session_key)) == b"x"
+            and tamper_caught and short_caught):
+        ok("CipherSession round-trip, eski biçimle uyumlu, bozulma yakalanıyor")
+    else:
+        fail("CipherSession")
+
 
 # ═══════════════════════════════════════════════════════════════
 #  2. SteganographyManager testleri
@@ -203,6 +293,14 @@ def test_steganography():
         except ValueError:
             ok("Kapasite aşımı → ValueError fırlatıldı")
 
+        # --- 2.5b Gradyan köşe renkleri (koyu lacivert → mavi) ---
+        with Image.open(img3) as im:
+            corners = (im.getpixel((0, 0)), im.getpixel((7, 7)))
+        if corners == ((30, 30, 60), (38, 56, 165)):
+            ok("Gradyan köşe renkleri doğru")
+        else:
+            fail("Gradyan köşe renkleri", str(corners))
+
         # --- 2.6 Bozuk görüntü → hata ---
         img4 = os.path.join(tmpdir, "corrupt.png")
         SteganographyManager.create_carrier_image(img4, 128, 128)
@@ -231,6 +329,78 @@ def test_steganography():
         else:
             fail("Maksimum kapasite encode/decode")
 
+        # --- 2.8 Saf Python LSB yolu NumPy yolu ile aynı sonucu üretir ---
+        import securevault.steganography as steg_module
+        payload = secrets.token_bytes(4096)
+        with open(img5, "rb") as f:
+            original_png = f.read()
+        outputs = []
+        saved_flag = steg_module.HAS_NUMPY
+        try:
+            for flag in (saved_flag, False):
+                steg_module.HAS_NUMPY = flag
+                with open(img5, "wb") as f:
+                    f.write(original_png)
+                SteganographyManager.encode(img5, payload)
+                with Image.open(img5) as im:
+                    outputs.append(im.tobytes())
+        finally:
+            steg_module.HAS_NUMPY = saved_flag
+        if len(set(outputs)) == 1 and SteganographyManager.decode(img5) == payload:
+            ok(f"Toplu LSB yazımı tutarlı (numpy={saved_flag})")
+        else:
+            fail("Toplu LSB yazımı", "NumPy ve saf Python çıktıları farklı")
+
+        # --- 2.8b CarrierBuffer: tek çözümle çoklu yazım ---
+        carrier = CarrierBuffer.from_file(img5)
+        for payload in (b"ilk", secrets.token_bytes(1000), b"son kayit"):
+            carrier.embed(payload)
+        carrier.save(img5)
+        if (carrier.extract() == b"son kayit"
+                and SteganographyManager.decode(img5) == b"son kayit"
+                and carrier.capacity == cap5):
+            ok("CarrierBuffer embed/extract/save tutarlı")
+        else:
+            fail("CarrierBuffer embed/extract/save")
+
+        # --- 2.8c Diff modunda yalnızca değişen pikseller yazılır ---
+        # (1 veri baytı + 32 baytlık checksum değişir → en fazla 8 + 256 bit)
+        base_payload = secrets.token_bytes(2000)
+        full_touched = carrier.embed(base_payload)
+        edited = (base_payload[:1000] + bytes([base_payload[1000] ^ 0x81])
+                  + base_payload[1001:])
+        diff_touched = carrier.embed(edited, diff=True)
+        again = carrier.embed(edited, diff=True)
+        reference = CarrierBuffer.from_file(img5)
+        reference.embed(edited)
+        if (carrier.extract() == edited and reference.raw == carrier.raw
+                and 0 < diff_touched <= 8 + 256 < full_touched and again == 0):
+            ok(f"Diff encode: {diff_touched}/{full_touched} piksel değişti")
+        else:
+            fail("Diff encode",
+                 f"diff={diff_touched}, tam={full_touched}, tekrar={again}")
+
+        # --- 2.9 Taşıyıcı şablon önbelleği (bellek + disk) ---
+        tpl_dir = os.path.join(tmpdir, "templates")
+        SteganographyManager.set_template_dir(tpl_dir)
+        SteganographyManager.clear_carrier_cache()
+        try:
+            c1 = os.path.join(tmpdir, "cache1.png")
+            c2 = os.path.join(tmpdir, "cache2.png")
+            SteganographyManager.create_carrier_image(c1, 96, 96)
+            t0 = time.perf_counter()
+            SteganographyManager.create_carrier_image(c2, 96, 96)
+            cached_dt = time.perf_counter() - t0
+            with open(c1, "rb") as f1, open(c2, "rb") as f2:
+                same = f1.read() == f2.read()
+            on_disk = os.path.exists(os.path.join(tpl_dir, "carrier_96x96.png"))
+            if same and on_disk:
+                ok(f"Taşıyıcı önbellekten kopyalandı ({cached_dt*1000:.1f}ms)")
+            else:
+                fail("Taşıyıcı önbelleği", f"aynı={same}, disk={on_disk}")
+        finally:
+            SteganographyManager.set_template_dir(None)
+
     finally:
         shutil.rmtree(tmpdir, ignore_errors=True)
 
@@ -238,6 +408,26 @@ def test_steganography():
 # ═══════════════════════════════════════════════════════════════
 #  3. PasswordGenerator testleri
 # ═══════════════════════════════════════════════════════════════
+def _reference_entropy(password: str) -> float:
+    """get_entropy'nin ilk (beş geçişli) sürümü — eşlik testleri için."""
+    if not password:
+        return 0.0
+    pool_size = 0
+    if any(c in string.ascii_lowercase for c in password):
+        pool_size += 26
+    if any(c in string.ascii_uppercase for c in password):
+        pool_size += 26
+    if any(c in string.digits for c in password):
+        pool_size += 10
+    if any(c in string.punctuation for c in password):
+        pool_size += 32
+    if any(ord(c) > 127 for c in password):
+        pool_size += 128
+    if pool_size == 0:
+        pool_size = 256
+    return math.log2(pool_size) * len(password)
+
+
 def test_generator():
     section("PasswordGenerator")
 
@@ -336,6 +526,169 @@ def test_generator():
     else:
         fail("Benzersizlik", f"{len(passwords)}/1000 benzersiz")
 
+    # --- 3.13 generate_many: kümeler, benzersizlik, toplu entropi ---
+    token_calls = []
+    real_token_bytes = secrets.token_bytes
+    secrets.token_bytes = lambda n=None: (token_calls.append(n),
+                                          real_token_bytes(n))[1]
+    try:
+        batch = PasswordGenerator.generate_many(1000, length=20)
+    finally:
+        secrets.token_bytes = real_token_bytes
+    pools = (string.ascii_uppercase, string.ascii_lowercase,
+             string.digits, string.punctuation)
+    covered = all(any(c in pool for c in pw) for pw in batch for pool in pools)
+    only_digits = PasswordGenerator.generate_many(
+        50, length=6, uppercase=False, lowercase=False, special=False)
+    if (len(batch) == 1000 and len(set(batch)) == 1000 and covered
+            and all(len(pw) == 20 for pw in batch)
+            and all(pw.isdigit() and len(pw) == 6 for pw in only_digits)
+            and len(token_calls) <= 2):
+        ok(f"generate_many: 1000 şifre, {len(token_calls)} token_bytes çağrısı")
+    else:
+        fail("generate_many", f"calls={len(token_calls)} covered={covered}")
+
+    # --- 3.14 Çok uzun şifre: yapı gereği kapsama, doğrusal maliyet ---
+    t0 = time.perf_counter()
+    keys = [PasswordGenerator.generate(length=4096) for _ in range(20)]
+    long_dt = (time.perf_counter() - t0) / 20
+    short_pw = [PasswordGenerator.generate(length=4) for _ in range(200)]
+    if (all(len(k) == 4096 for k in keys)
+            and all(any(c in pool for c in pw) for pw in short_pw for pool in pools)
+            and long_dt < 0.05):
+        ok(f"4096 karakter anahtar: {long_dt * 1000:.2f}ms; length=4 kapsama tam")
+    else:
+        fail("Uzun şifre üretimi", f"{long_dt * 1000:.2f}ms")
+
+    # --- 3.15 Parola cümlesi: paket listesi, kesin entropi ---
+    bundled = default_wordlist()
+    bundled_words = [bundled[i] for i in range(len(bundled))]
+    phrase = PasswordGenerator.generate_passphrase(words=6, separator=" ")
+    parts = phrase.split(" ")
+    expected_bits = 6 * math.log2(len(bundled))
+    if (len(parts) == 6 and set(parts) <= set(bundled_words)
+            and len(set(bundled_words)) == len(bundled_words)
+            and abs(PasswordGenerator.passphrase_entropy(6) - expected_bits) < 1e-9):
+        ok(f"Parola cümlesi: {len(bundled)} kelime, 6 kelime = {expected_bits:.1f} bit")
+    else:
+        fail("Parola cümlesi", phrase)
+
+    # --- 3.16 Kelime listesi: EFF biçimi, tembel mmap indeksi ---
+    wl_dir = tempfile.mkdtemp(prefix="wordlist_")
+    try:
+        eff_path = os.path.join(wl_dir, "eff.txt")
+        with open(eff_path, "wb") as fh:
+            fh.write(b"# yorum\r\n11111\tabacus\r\n11112\tabdomen\r\n\r\n"
+                     b"11113\tabide")
+        eff = Wordlist(eff_path)
+        eff_ok = (eff._bounds is None and len(eff) == 3
+                  and [eff[i] for i in range(3)] == ["abacus", "abdomen", "abide"])
+        eff.close()
+
+        big_path = os.path.join(wl_dir, "big.txt")
+        with open(big_path, "w", encoding="utf-8") as fh:
+            fh.write("\n".join(f"kelime{i}" for i in range(150_000)))
+        big = Wordlist(big_path)
+        t0 = time.perf_counter()
+        big_len = len(big)
+        index_dt = time.perf_counter() - t0
+        caps = PasswordGenerator.generate_passphrase(
+            4, separator=".", capitalize=True, wordlist=big)
+        big_ok = (big_len == 150_000 and big[149_999] == "kelime149999"
+                  and all(w.startswith("Kelime") for w in caps.split(".")))
+        big.close()
+        if eff_ok and big_ok:
+            ok(f"Kelime listesi: EFF biçimi okundu, 150k kelime indeksi {index_dt * 1000:.0f}ms")
+        else:
+            fail("Kelime listesi", f"eff={eff_ok} big={big_ok} {caps}")
+    finally:
+        shutil.rmtree(wl_dir, ignore_errors=True)
+
+    # --- 3.17 Tek geçişli sınıflandırıcı ve eski entropi formülüyle eşlik ---
+    counts = classify_chars("aB3! é€\tğ")
+    expected_counts = {"lower": 1, "upper": 1, "digits": 1, "special": 1,
+                       "other": 2, "non_ascii": 3}
+    samples = ["", " ", "\t\n", "abc", "ABC123", "Şifre!2024", "çok güçlü",
+               "€€€", "pass word", "Xk9#mP2$vL8@qR4!", "\x7f\x80\xff"]
+    samples += [PasswordGenerator.generate(length=12) for _ in range(50)]
+    mismatched = [pw for pw in samples
+                  if abs(PasswordGenerator.get_entropy(pw)
+                         - _reference_entropy(pw)) > 1e-9]
+    if counts == expected_counts and not mismatched:
+        ok(f"classify_chars sayımları doğru; {len(samples)} örnekte entropi aynı")
+    else:
+        fail("classify_chars", f"{counts} / uyuşmayan: {mismatched[:3]}")
+
+    # --- 3.18 Desen tabanlı güç: tahmin edilebilir desenler zayıf ---
+    patterned = {
+        "Password1!Password1!": "repeat",
+        "P@ssw0rd": "dictionary",
+        "drowssap": "dictionary",
+        "qwertyuiop": "dictionary",
+        "zxcvbnm,./": "spatial",
+        "abcdefgh": "sequence",
+        "97531": "sequence",
+        "12.05.1990": "date",
+        "galatasaray": "dictionary",
+    }
+    wrong = []
+    for pw, pattern in patterned.items():
+        strength = PasswordGenerator.calculate_strength(pw)
+        if strength["score"] > 25 or pattern not in {p for p, _ in strength["patterns"]}:
+            wrong.append((pw, strength["label"], strength["patterns"]))
+    random_pw = PasswordGenerator.generate(length=16)
+    random_strength = PasswordGenerator.calculate_strength(random_pw)
+    capped = all(estimate_bits(pw)["bits"] <= PasswordGenerator.get_entropy(pw) + 1e-9
+                 for pw in list(patterned) + [random_pw])
+    if not wrong and capped and random_strength["score"] >= 50:
+        ok(f"Desenli {len(patterned)} şifre zayıf; rastgele 16 karakter: "
+           f"{random_strength['label']}")
+    else:
+        fail("Desen tabanlı güç", f"{wrong} capped={capped} {random_strength}")
+
+    # --- 3.19 "İ".lower() iki karakter olur; eşleşmeler kaymamalı ---
+    dotted = {}
+    try:
+        for pw in ("İpassword", "İzmir35galatasaray", "IPASSWORD",
+                   "p@ssİ0rd", "İİİİİİ"):
+            dotted[pw] = PasswordGenerator.calculate_strength(pw)["patterns"]
+        dotted_report = PasswordHealthAnalyzer.get_report(
+            [{"id": "1", "site_name": "x", "password": "İpassword"}])
+    except Exception as exc:
+        fail("Noktalı İ ile güç tahmini", repr(exc))
+    else:
+        if (("dictionary", "password") in dotted["İpassword"]
+                and ("dictionary", "galatasaray") in dotted["İzmir35galatasaray"]
+                and ("dictionary", "PASSWORD") in dotted["IPASSWORD"]
+                and dotted_report["total"] == 1):
+            ok("Noktalı İ / I içeren şifrelerde desen konumları doğru")
+        else:
+            fail("Noktalı İ ile güç tahmini", str(dotted))
+
+    # --- 3.20 Kelime listeleri yoksa gömülü kısa listeyle devam edilir ---
+    saved = (wordlist_mod.WORDLIST_DIR, strength_mod.COMMON_PASSWORDS_FILE)
+    missing = os.path.join(tempfile.gettempdir(), "securevault_yok")
+    wordlist_mod.WORDLIST_DIR = missing
+    strength_mod.COMMON_PASSWORDS_FILE = os.path.join(missing, "common_passwords.txt")
+    wordlist_mod.default_wordlist.cache_clear()
+    strength_mod._ranked_dictionary.cache_clear()
+    try:
+        fallback = estimate_bits("password123")["patterns"]
+        fallback_report = PasswordHealthAnalyzer.get_report(
+            [{"id": "1", "site_name": "x", "password": "Galatasaray1905"}])
+        fallback_error = None
+    except Exception as exc:
+        fallback_error = exc
+    finally:
+        wordlist_mod.WORDLIST_DIR, strength_mod.COMMON_PASSWORDS_FILE = saved
+        wordlist_mod.default_wordlist.cache_clear()
+        strength_mod._ranked_dictionary.cache_clear()
+    if (fallback_error is None and ("dictionary", "password") in fallback
+            and fallback_report["total"] == 1):
+        ok("Kelime listeleri yokken güç tahmini gömülü listeyle çalışıyor")
+    else:
+        fail("Eksik kelime listeleri", repr(fallback_error))
+
 
 # ═══════════════════════════════════════════════════════════════
 #  4. PasswordHealthAnalyzer testleri
@@ -408,6 +761,189 @@ def test_health():
         fail("Rapor anahtarları", f"Eksik: {required_keys - report2.keys()}")
 
 
+# ═══════════════════════════════════════════════════════════════
+#  4b. SearchIndex testleri
+# ═══════════════════════════════════════════════════════════════
+def _brute_search(records: list[dict], query: str, category: str) -> list[str]:
+    q = query.lower()
+    return [r["id"] for r in records
+            if (not category or r.get("category") == category)
+            and (not q or q in r.get("site_name", "").lower()
+                 or q in r.get("username", "").lower())]
+
+
+def test_search():
+    section("SearchIndex")
+
+    sites = ["GitHub", "GitLab", "Google", "Gmail", "Banka", "Bankası A.Ş.",
+             "Netflix", "x", "", "Ğüşiöç"]
+    records = [
+        {"id": f"r{i}", "site_name": f"{sites[i % len(sites)]} {i}",
+         "username": f"user{i % 7}@örnek.com",
+         "category": ["İş", "Banka", "Sosyal"][i % 3]}
+        for i in range(300)
+    ]
+    idx = SearchIndex()
+    idx.rebuild(records)
+
+    # --- 4b.1 Kaba kuvvet arama ile aynı sonuçlar ---
+    queries = ["", "g", "gi", "git", "github", "hub 1", "USER3", "@örnek",
+               "ş", "bankası a", "yok", "1", "12", "299", " "]
+    mismatches = [
+        (q, c) for q in queries for c in ("", "İş", "Banka", "Yok")
+        if idx.search(q, c) != _brute_search(records, q, c)
+    ]
+    if not mismatches:
+        ok(f"İndeks = kaba kuvvet ({len(queries) * 4} sorgu)")
+    else:
+        fail("İndeks tutarlılığı", str(mismatches[:5]))
+
+    # --- 4b.2 Güncelleme sıra numarasını korur, silme indeksten çıkarır ---
+    records[5] = {**records[5], "site_name": "Yepyeni Site", "category": "Banka"}
+    idx.update(records[5])
+    idx.remove(records[6]["id"])
+    del records[6]
+    same = all(idx.search(q, c) == _brute_search(records, q, c)
+               for q in ("yepyeni", "git", "") for c in ("", "Banka"))
+    if same and idx.search("yepyeni") == ["r5"]:
+        ok("Artımlı güncelleme/silme tutarlı")
+    else:
+        fail("Artımlı güncelleme/silme")
+
+    # --- 4b.3 clear sonrası boş ---
+    idx.clear()
+    if len(idx) == 0 and idx.search("git") == [] and idx.search() == []:
+        ok("clear() indeksi boşaltıyor")
+    else:
+        fail("clear()")
+
+    # --- 4b.4 Bulanık arama: yazım hatası → doğru kayıt ilk sırada ---
+    vault = [
+        {"id": "gh", "site_name": "GitHub", "username": "dev",
+         "url": "https://github.com", "category": "İş"},
+        {"id": "gl", "site_name": "GitLab", "username": "dev",
+         "url": "https://gitlab.com", "category": "İş"},
+        {"id": "gm", "site_name": "Gmail", "username": "ali@gmail.com",
+         "category": "E-posta"},
+        {"id": "bk", "site_name": "Ziraat", "username": "12345",
+         "category": "Banka", "notes": "kurumsal internet bankacılığı"},
+    ]
+    fuzzy = FuzzySearchEngine()
+    fuzzy.rebuild(vault)
+    top = fuzzy.search("gthub")
+    if top and top[0][0] == "gh" and all(0 < sc <= 1 for _, sc in top):
+        ok(f"'gthub' → GitHub (skor={top[0][1]})")
+    else:
+        fail("Bulanık arama 'gthub'", str(top))
+
+    # --- 4b.5 URL, kategori ve not alanları da aranıyor; sıralama azalan ---
+    by_notes = fuzzy.search("bankacılık")
+    by_cat = fuzzy.search("banka")
+    scores = [sc for _, sc in fuzzy.search("git", limit=5)]
+    if (by_notes and by_notes[0][0] == "bk" and by_cat
+            and by_cat[0][0] == "bk" and scores == sorted(scores, reverse=True)
+            and fuzzy.search("zzzz") == []):
+        ok("Not/kategori alanları ve skor sırası doğru")
+    else:
+        fail("Bulanık arama alanları", f"{by_notes}, {by_cat}, {scores}")
+
+    # --- 4b.6 Bulanık indeks artımlı güncelleniyor ---
+    fuzzy.update({**vault[0], "site_name": "Bitbucket",
+                  "url": "https://bitbucket.org"})
+    fuzzy.remove("gl")
+    ids = [rid for rid, _ in fuzzy.search("bitbuckt")]
+    if ids[:1] == ["gh"] and "gl" not in [r for r, _ in fuzzy.search("gitlab")]:
+        ok("Bulanık indeks artımlı güncelleme/silme")
+    else:
+        fail("Bulanık indeks artımlı", str(ids))
+
+
+
+# ═══════════════════════════════════════════════════════════════
+#  4c. sync_tree testleri (Tk gerektirmeyen sahte ağaçla)
+# ═══════════════════════════════════════════════════════════════
+class _RecordingTree:
+    """Treeview'in sync_tree'nin kullandığı kısmını taklit eder, çağrıları kaydeder."""
+
+    def __init__(self):
+        self.order = []
+        self.values = {}
+        self.calls = []
+
+    def get_children(self, item=""):
+        return tuple(self.order)
+
+    def insert(self, parent, index, iid=None, values=(), tags=()):
+        self.calls.append(("insert", iid))
+        self.order.insert(index, iid)
+        self.values[iid] = (values, tags)
+        return iid
+
+    def move(self, item, parent, index):
+        self.calls.append(("move", item))
+        self.order.remove(item)
+        self.order.insert(index, item)
+
+    def delete(self, *items):
+        self.calls.append(("delete",) + items)
+        for iid in items:
+            self.order.remove(iid)
+            del self.values[iid]
+
+    def item(self, iid, values=(), tags=()):
+        self.calls.append(("item", iid))
+        self.values[iid] = (values, tags)
+
+
+def test_sync_tree():
+    section("sync_tree")
+
+    tree = _RecordingTree()
+    shown = {}
+    rows = [(f"r{i}", (f"site{i}", "u"), ()) for i in range(5)]
+
+    # --- 4c.1 Boş ağaca ekleme ---
+    sync_tree(tree, rows, shown)
+    if (tree.order == [r[0] for r in rows]
+            and tree.calls == [("insert", r[0]) for r in rows]):
+        ok("sync_tree: 5 satır eklendi")
+    else:
+        fail("sync_tree ekleme", str(tree.calls))
+
+    # --- 4c.2 Aynı satırlar → hiçbir çağrı yok ---
+    tree.calls.clear()
+    sync_tree(tree, list(rows), shown)
+    if not tree.calls:
+        ok("sync_tree: değişmeyen satırlara dokunulmadı")
+    else:
+        fail("sync_tree değişmeyen", str(tree.calls))
+
+    # --- 4c.3 Yeniden sıralama → yalnızca taşıma ---
+    tree.calls.clear()
+    reordered = [rows[4]] + rows[:4]
+    sync_tree(tree, reordered, shown)
+    if (tree.order == [r[0] for r in reordered]
+            and tree.calls == [("move", "r4")]):
+        ok("sync_tree: sıralama tek taşıma ile")
+    else:
+        fail("sync_tree sıralama", f"{tree.order}, {tree.calls}")
+
+    # --- 4c.4 Silme + yalnızca değer değişimi + ekleme ---
+    tree.calls.clear()
+    updated = [reordered[0], ("r0", ("site0", "yeni"), ("weak",)),
+               reordered[2], ("r9", ("site9", "u"), ())]
+    sync_tree(tree, updated, shown)
+    calls = sorted(tree.calls)
+    if (tree.order == ["r4", "r0", "r1", "r9"]
+            and calls == [("delete", "r2", "r3"), ("insert", "r9"),
+                          ("item", "r0")]
+            and tree.values["r0"] == (("site0", "yeni"), ("weak",))
+            and set(shown) == {"r4", "r0", "r1", "r9"}):
+        ok("sync_tree: silme, değer güncelleme ve ekleme yalnızca gerekenlerde")
+    else:
+        fail("sync_tree karışık", f"{tree.order}, {tree.calls}")
+
+
 # ═══════════════════════════════════════════════════════════════
 #  5. DataManager testleri
 # ═══════════════════════════════════════════════════════════════
@@ -545,8 +1081,26 @@ def test_data_manager():
         else:
             fail("Tema kaydetme")
 
+        # --- 5.16b PNG kayıt profili ---
+        dm.set_png_profile("balanced")
+        try:
+            dm.set_png_profile("bilinmeyen")
+            fail("Geçersiz PNG profili → ValueError beklendi")
+        except ValueError:
+            if dm.get_png_profile() == "balanced":
+                ok("PNG profili kaydedildi (balanced), geçersiz profil reddedildi")
+            else:
+                fail("PNG profili", dm.get_png_profile())
+        dm.set_png_profile("fast")
+        fast_size = os.path.getsize(os.path.join(tmpdir, "vault.png"))
+
         # --- 5.17 Lock → key temizleniyor ---
         dm.lock()
+        compact_size = os.path.getsize(os.path.join(tmpdir, "vault.png"))
+        if compact_size < fast_size:
+            ok(f"Kilitte compact kayıt: {fast_size} → {compact_size} bayt")
+        else:
+            fail("Kilitte compact kayıt", f"{fast_size} → {compact_size}")
         if not dm.is_authenticated:
             ok("Lock sonrası authenticated değil")
         else:
@@ -588,6 +1142,283 @@ def test_data_manager():
         else:
             fail("Kategori tekrar engeli")
 
+        # --- 5.23 Kapasite aşımında taşıyıcı büyütülüyor ---
+        big_ids = [dm.add_note({"title": f"Büyük {i}",
+                                "content": secrets.token_hex(30_000)})
+                   for i in range(6)]
+        with Image.open(os.path.join(tmpdir, "vault.png")) as im:
+            grown_size = im.size
+        dm3 = DataManager(tmpdir)
+        dm3.authenticate("TestMaster1234!")
+        if grown_size[0] > 1024 and len(dm3.get_notes()) == len(dm.get_notes()):
+            ok(f"Taşıyıcı büyütüldü: {grown_size[0]}×{grown_size[1]}")
+        else:
+            fail("Taşıyıcı büyütme",
+                 f"boyut={grown_size}, notlar={len(dm3.get_notes())}")
+        for nid in big_ids:
+            dm.delete_note(nid)
+
+        # --- 5.24 Toplu ekleme/güncelleme/silme tek kayıtla yapılır ---
+        batch_saves = []
+        real_save = dm.save
+        dm.save = lambda profile=None: (batch_saves.append(profile),
+                                        real_save(profile))
+        bulk_ids = dm.add_passwords([
+            {"site_name": f"Toplu {i}", "username": "b", "password": "Pw!1",
+             "category": "İş"} for i in range(50)])
+        updated = dm.update_passwords({pid: {"username": "bb"}
+                                       for pid in bulk_ids[:10]})
+        removed = dm.delete_passwords(bulk_ids[10:] + ["yok"])
+        dm.save = real_save
+        if (len(bulk_ids) == 50 and updated == 10 and removed == 40
+                and len(batch_saves) == 3):
+            ok("Toplu işlemler: 3 çağrı → 3 kayıt")
+        else:
+            fail("Toplu işlemler",
+                 f"ids={len(bulk_ids)}, upd={updated}, del={removed}, "
+                 f"kayıt={len(batch_saves)}")
+
+        # --- 5.25 Toplu eklemede geçersiz kayıt → hiçbiri eklenmez ---
+        before_len = len(dm.get_passwords())
+        try:
+            dm.add_passwords([{"site_name": "Geçerli"},
+                              {"site_name": "x" * 10_000}])
+            fail("Toplu doğrulama", "ValueError bekleniyordu")
+        except ValueError:
+            if len(dm.get_passwords()) == before_len:
+                ok("Toplu eklemede geçersiz kayıt → hiçbiri eklenmedi")
+            else:
+                fail("Toplu doğrulama", "kısmi ekleme yapıldı")
+
+        # --- 5.26 batch() hata ile biterse değişiklikler geri alınır ---
+        try:
+            with dm.batch():
+                dm.delete_passwords(bulk_ids[:10])
+                dm.add_note({"title": "Geri alınacak", "content": ""})
+                raise RuntimeError("iptal")
+        except RuntimeError:
+            pass
+        dm4 = DataManager(tmpdir)
+        dm4.authenticate("TestMaster1234!")
+        if (len(dm.get_passwords()) == before_len
+                and not any(n["title"] == "Geri alınacak" for n in dm.get_notes())
+                and len(dm4.get_passwords()) == before_len):
+            ok("batch() hatada geri alındı")
+        else:
+            fail("batch() geri alma", str(len(dm.get_passwords())))
+        dm.delete_passwords(bulk_ids[:10])
+
+        # --- 5.27 authenticate ilerleme bildiriyor ---
+        stages = []
+        dm5 = DataManager(tmpdir)
+        if (dm5.authenticate("TestMaster1234!",
+                             progress=lambda m, f: stages.append(f))
+                and len(stages) >= 2 and stages == sorted(stages)):
+            ok(f"İlerleme bildirimi: {len(stages)} aşama")
+        else:
+            fail("İlerleme bildirimi", str(stages))
+
+        # --- 5.28 İlerleme geri çağrısından iptal → kasa kilitli kalır ---
+        def cancel_after_kdf(_message, fraction):
+            if fraction > 0:
+                raise OperationCancelled()
+
+        dm6 = DataManager(tmpdir)
+        try:
+            dm6.authenticate("TestMaster1234!", progress=cancel_after_kdf)
+            fail("İptal", "OperationCancelled bekleniyordu")
+        except OperationCancelled:
+            if not dm6.is_authenticated:
+                ok("İptal edilen kilit açma → kasa kilitli")
+            else:
+                fail("İptal", "kasa açık kaldı")
+
+        # --- 5.29 vault.png anahtar türetmeyle paralel okunuyor ---
+        dm7 = DataManager(tmpdir)
+        read_threads = []
+        real_read = dm7._read_vault
+        dm7._read_vault = lambda: (read_threads.append(
+            threading.current_thread().name), real_read())[1]
+        if (dm7.authenticate("TestMaster1234!") and read_threads
+                and read_threads[0].startswith("vault-decode")
+                and len(dm7.get_passwords()) == len(dm.get_passwords())):
+            ok("vault.png ayrı iş parçacığında KDF ile paralel çözüldü")
+        else:
+            fail("Paralel çözme", str(read_threads))
+
+        # --- 5.30 Bozuk vault.png → yedek alınır, boş vault ile açılır ---
+        corrupt_dir = tempfile.mkdtemp(prefix="dm_corrupt_")
+        try:
+            dmc = DataManager(corrupt_dir)
+            dmc.create_master_password("TestMaster1234!")
+            dmc.add_password({"site_name": "Kayıp", "password": "x"})
+            dmc.lock()
+            with open(os.path.join(corrupt_dir, "vault.png"), "wb") as fh:
+                fh.write(b"bozuk png")
+            dmc2 = DataManager(corrupt_dir)
+            opened = dmc2.authenticate("TestMaster1234!")
+            backups = [f for f in os.listdir(corrupt_dir) if ".backup_" in f]
+            if opened and dmc2.get_passwords() == [] and backups:
+                ok("Bozuk vault.png → yedek + boş vault")
+            else:
+                fail("Bozuk vault.png", str(os.listdir(corrupt_dir)))
+            if not dmc2.authenticate("YanlisParola"):
+                ok("Paralel okumada yanlış parola → False")
+            else:
+                fail("Paralel okumada yanlış parola")
+        finally:
+            shutil.rmtree(corrupt_dir, ignore_errors=True)
+
+        # --- 5.31 Eski biçimli vault.key kilit açılışında yükseltiliyor ---
+        legacy_dir = tempfile.mkdtemp(prefix="dm_legacy_")
+        try:
+            dml = DataManager(legacy_dir)
+            dml.create_master_password("Eski#Parola1")
+            dml.add_password({"site_name": "Eski", "password": "x"})
+            salt = secrets.token_bytes(32)
+            legacy_key = CryptoManager.derive_key("Eski#Parola1", salt)
+            dml._rekey({"salt": base64.b64encode(salt).decode("ascii"),
+                        "hash": hashlib.sha256(legacy_key).hexdigest()},
+                       legacy_key)
+            dml.lock()
+
+            key_path = os.path.join(legacy_dir, "vault.key")
+            no_upgrade = DataManager(legacy_dir, upgrade_kdf=False)
+            no_upgrade.authenticate("Eski#Parola1")
+            with open(key_path, encoding="utf-8") as fh:
+                still_legacy = "kdf" not in json.load(fh)
+            no_upgrade.lock()
+
+            dml2 = DataManager(legacy_dir)
+            opened = dml2.authenticate("Eski#Parola1")
+            dml2.lock()
+            with open(key_path, encoding="utf-8") as fh:
+                upgraded = json.load(fh)
+            dml3 = DataManager(legacy_dir)
+            if (still_legacy and opened
+                    and upgraded.get("kdf") == CryptoManager.preferred_kdf()
+                    and dml3.authenticate("Eski#Parola1")
+                    and dml3.search_passwords("eski")):
+                ok(f"Eski vault.key → {upgraded['kdf']} yükseltildi, veri korundu")
+            else:
+                fail("KDF yükseltme", str(upgraded))
+        finally:
+            shutil.rmtree(legacy_dir, ignore_errors=True)
+
+        # --- 5.31b Yükseltme sırasında kayıt hatası / çökme → eski parola açar ---
+        rekey_dir = tempfile.mkdtemp(prefix="dm_rekey_")
+        try:
+            dmr = DataManager(rekey_dir)
+            dmr.create_master_password("Eski#Parola1")
+            dmr.add_password({"site_name": "Korunan", "password": "x"})
+            salt = secrets.token_bytes(32)
+            legacy_key = CryptoManager.derive_key("Eski#Parola1", salt)
+            legacy_record = {"salt": base64.b64encode(salt).decode("ascii"),
+                             "hash": hashlib.sha256(legacy_key).hexdigest()}
+            dmr._rekey(legacy_record, legacy_key)
+            dmr.lock()
+            key_path = os.path.join(rekey_dir, "vault.key")
+            backup_path = key_path + ".bak"
+
+            # a) save() hata verir: giriş yapılır, eski kayıt geri yüklenir
+            failing = DataManager(rekey_dir)
+
+            def broken_save(profile=None):
+                raise OSError("disk dolu")
+
+            failing.save = broken_save
+            failed_open = failing.authenticate("Eski#Parola1")
+            with open(key_path, encoding="utf-8") as fh:
+                kept_legacy = "kdf" not in json.load(fh)
+            del failing.save
+            failing.lock()
+
+            # b) Süreç vault.key yazıldıktan sonra, vault.png'den önce ölür
+            shutil.copy2(key_path, backup_path)
+            with open(key_path, "w", encoding="utf-8") as fh:
+                json.dump(CryptoManager.create_master_key("Eski#Parola1")[0], fh)
+            crashed = DataManager(rekey_dir)
+            crash_open = crashed.authenticate("Eski#Parola1")
+            crash_data = crashed.search_passwords("korunan")
+            crashed.lock()
+            if (failed_open and kept_legacy and crash_open and crash_data
+                    and not os.path.exists(backup_path)
+                    and DataManager(rekey_dir).authenticate("Eski#Parola1")):
+                ok("KDF yükseltmesi yarıda kalınca kasa eski parolayla açılıyor")
+            else:
+                fail("Yarım kalan yükseltme",
+                     f"hata={failed_open}/{kept_legacy}, çökme={crash_open}/"
+                     f"{len(crash_data)}, yedek={os.path.exists(backup_path)}")
+
+            # c) Kurulumda olmayan KDF → açık hata
+            with open(key_path, "w", encoding="utf-8") as fh:
+                json.dump(dict(legacy_record, kdf="argon9", params={}), fh)
+            try:
+                DataManager(rekey_dir).authenticate("Eski#Parola1")
+                fail("Desteklenmeyen KDF", "hata bekleniyordu")
+            except KdfUnavailableError as exc:
+                ok(f"Desteklenmeyen KDF → KdfUnavailableError ({exc.kdf})")
+        finally:
+            shutil.rmtree(rekey_dir, ignore_errors=True)
+
+        # --- 5.32 Hızlı kilit açma (PIN) ---
+        quick_dir = tempfile.mkdtemp(prefix="dm_quick_")
+        try:
+            dmq = DataManager(quick_dir)
+            dmq.create_master_password("Hizli#Parola1")
+            dmq.add_password({"site_name": "PinSite", "password": "p"})
+            try:
+                dmq.enable_quick_unlock("12")
+                short_pin_rejected = False
+            except ValueError:
+                short_pin_rejected = True
+            dmq.enable_quick_unlock("2468")
+            dmq.lock()
+
+            t0 = time.perf_counter()
+            opened = dmq.quick_unlock("2468")
+            quick_s = time.perf_counter() - t0
+            restored = bool(dmq.search_passwords("pinsite"))
+            dmq.lock()
+
+            wrong = [dmq.quick_unlock("0000") for _ in range(3)]
+            wiped = not dmq.quick_unlock_available() and not dmq.quick_unlock("2468")
+
+            dmq.authenticate("Hizli#Parola1")
+            dmq.enable_quick_unlock("2468", window_seconds=0)
+            dmq.lock()
+            expired = not dmq.quick_unlock_available()
+
+            # Süre etkinleştirmede değil kilitlemede başlar
+            dmq.authenticate("Hizli#Parola1")
+            dmq.enable_quick_unlock("2468", window_seconds=0.3)
+            time.sleep(0.45)
+            dmq.lock()
+            armed_on_lock = (dmq.quick_unlock_available()
+                             and dmq.quick_unlock("2468"))
+            time.sleep(0.45)
+            dmq.lock()
+            rearmed = dmq.quick_unlock_available()
+            time.sleep(0.45)
+            window_closed = not dmq.quick_unlock_available()
+
+            dmq.authenticate("Hizli#Parola1")
+            dmq.enable_quick_unlock("2468")
+            dmq.change_master_password("Hizli#Parola1", "Hizli#Parola2")
+            rekey_wiped = not dmq.quick_unlock_available()
+
+            if (short_pin_rejected and opened and restored and not any(wrong)
+                    and wiped and expired and rekey_wiped
+                    and armed_on_lock and rearmed and window_closed):
+                ok(f"PIN ile açma {quick_s * 1000:.0f}ms; süre kilitte başlıyor; 3 hatada/süre dolunca/rekey'de silindi")
+            else:
+                fail("Hızlı kilit açma",
+                     f"open={opened} data={restored} wrong={wrong} wiped={wiped} "
+                     f"expired={expired} rekey={rekey_wiped} "
+                     f"lock_window={armed_on_lock}/{rearmed}/{window_closed}")
+        finally:
+            shutil.rmtree(quick_dir, ignore_errors=True)
+
     finally:
         shutil.rmtree(tmpdir, ignore_errors=True)
 
@@ -608,6 +1439,68 @@ def test_performance():
     else:
         fail(f"1000 şifre üretimi çok yavaş: {dt:.3f}s")
 
+    # --- 6.1b Toplu üretim (generate_many) ---
+    t0 = time.perf_counter()
+    PasswordGenerator.generate_many(1000, length=20)
+    batch_dt = time.perf_counter() - t0
+    if batch_dt < dt:
+        ok(f"generate_many(1000): {batch_dt:.3f}s ({dt / batch_dt:.0f}× hızlı)")
+    else:
+        fail("generate_many tekli üretimden yavaş",
+             f"{batch_dt:.3f}s / {dt:.3f}s")
+
+    # --- 6.1c Tek geçişli entropi hesabı ---
+    entropy_samples = PasswordGenerator.generate_many(20_000, length=16)
+    t0 = time.perf_counter()
+    for pw in entropy_samples:
+        _reference_entropy(pw)
+    ref_dt = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for pw in entropy_samples:
+        PasswordGenerator.get_entropy(pw)
+    new_dt = time.perf_counter() - t0
+    if new_dt < ref_dt:
+        ok(f"20.000 entropi: {new_dt * 1000:.0f}ms (eski: {ref_dt * 1000:.0f}ms)")
+    else:
+        fail("Tek geçişli entropi yavaş", f"{new_dt:.3f}s / {ref_dt:.3f}s")
+
+    # --- 6.1d Desen tabanlı güç tahmini hızı ---
+    # Yarısı rastgele, yarısı kelime + rakam/yıl/sembol içeren insan işi
+    # şifreler: sözlük ve tarih eşleştiricileri ikincilerde çok daha çok çalışır
+    estimate_bits("ısınma")   # sözlükler ilk kullanımda kurulur
+    words = default_wordlist()
+    human_samples = []
+    for k in range(5_000):
+        w1 = words[k * 7919 % len(words)]
+        w2 = words[k * 104729 % len(words)]
+        human_samples.append((
+            f"{w1.capitalize()}{k}!",
+            f"{w1}{w2}{1950 + k % 75}",
+            w1.replace("a", "@").replace("o", "0") + "123",
+            f"{w1.capitalize()}.{w2}{k % 100}",
+        )[k % 4])
+    strength_samples = entropy_samples[:5_000] + human_samples
+    t0 = time.perf_counter()
+    for pw in strength_samples:
+        estimate_bits(pw)
+    est_dt = time.perf_counter() - t0
+    if est_dt < 1.0:
+        ok(f"10.000 şifre desen analizi: {est_dt:.2f}s "
+           f"({len(strength_samples) / est_dt:,.0f}/s)")
+    else:
+        fail("Desen analizi yavaş", f"{est_dt:.2f}s")
+
+    # Çok uzun girdide desen araması ilk MAX_ANALYSIS_LENGTH karakterle sınırlı
+    long_pw = "".join(entropy_samples[:256])   # 4096 karakter
+    t0 = time.perf_counter()
+    long_bits = estimate_bits(long_pw)["bits"]
+    long_dt = time.perf_counter() - t0
+    head_bits = estimate_bits(long_pw[:strength_mod.MAX_ANALYSIS_LENGTH])["bits"]
+    if long_dt < 0.05 and head_bits < long_bits <= PasswordGenerator.get_entropy(long_pw):
+        ok(f"4096 karakterlik şifre analizi: {long_dt * 1000:.1f}ms")
+    else:
+        fail("Uzun şifre analizi", f"{long_dt:.3f}s bits={long_bits:.0f}")
+
     # --- 6.2 1000 kayıt sağlık raporu süresi ---
     entries = [
         {"id": f"p{i}", "site_name": f"site{i}", "username": f"u{i}",
@@ -622,11 +1515,91 @@ def test_performance():
     else:
         fail(f"1000 kayıt sağlık raporu çok yavaş: {dt:.3f}s")
 
+    # --- 6.2b 20.000 kayıtta id ile erişim/güncelleme/silme ---
+    # Anahtar yok → kayıt yapılmaz; yalnızca bellek içi işlemler ölçülür.
+    # Mutlak süre yerine aynı çalıştırmadaki 2.000 kayıtlık ölçümle
+    # karşılaştırılır: doğrusal ≈10×, kayıt başına tarama ≈100× olur.
+    def id_ops(count):
+        mgr = DataManager(tempfile.gettempdir())
+        mgr._set_data(mgr._empty_vault())
+        new_ids = mgr.add_passwords([{"site_name": f"s{i}", "username": "u"}
+                                     for i in range(count)])
+        t0 = time.perf_counter()
+        for pid in new_ids:
+            mgr.get_password(pid)
+            mgr.update_password(pid, {"username": "v"})
+        for pid in new_ids[::2]:
+            mgr.delete_password(pid)
+        return mgr, new_ids, time.perf_counter() - t0
+
+    small_dt = min(id_ops(2_000)[2] for _ in range(3))
+    dm_mem, ids, dt = id_ops(20_000)
+    ratio = dt / max(small_dt, 1e-6)
+    if (ratio < 30 and len(dm_mem.get_passwords()) == 10_000
+            and dm_mem.get_passwords()[0]["id"] == ids[1]):
+        ok(f"20.000 kayıt id işlemleri: {dt*1000:.0f}ms "
+           f"(2.000 kayda göre {ratio:.1f}×)")
+    else:
+        fail("20.000 kayıt id işlemleri", f"{dt:.3f}s, {ratio:.1f}×")
+
+    # --- 6.2c 10.000 kayıtta indeksli arama (tuş başına) ---
+    t0 = time.perf_counter()
+    for q in ("s1", "s12", "s123", "s19999", "u", "yok"):
+        dm_mem.search_passwords(q)
+    dt = (time.perf_counter() - t0) / 6
+    if dt < 0.05 and len(dm_mem.search_passwords("s19999")) == 1:
+        ok(f"10.000 kayıtta arama: {dt*1000:.2f}ms/sorgu")
+    else:
+        fail("10.000 kayıtta arama", f"{dt*1000:.2f}ms")
+
+    # --- 6.2d 10.000 kayıtta bulanık arama (indeks kurulduktan sonra) ---
+    dm_mem.fuzzy_search_passwords("s1")
+    t0 = time.perf_counter()
+    for q in ("s1999", "s19y99", "sx234", "v"):
+        dm_mem.fuzzy_search_passwords(q)
+    dt = (time.perf_counter() - t0) / 4
+    top = dm_mem.fuzzy_search_passwords("s19999", limit=1)
+    if dt < 0.1 and top and top[0][0]["site_name"] == "s19999":
+        ok(f"10.000 kayıtta bulanık arama: {dt*1000:.1f}ms/sorgu")
+    else:
+        fail("10.000 kayıtta bulanık arama", f"{dt*1000:.1f}ms, {top}")
+
     # --- 6.3 Steganografi encode/decode süresi (100 KB veri) ---
     tmpdir = tempfile.mkdtemp(prefix="perf_test_")
     try:
         img = os.path.join(tmpdir, "perf.png")
+        t0 = time.perf_counter()
         SteganographyManager.create_carrier_image(img, 1024, 1024)
+        carrier_dt = time.perf_counter() - t0
+        if carrier_dt < 2.0:
+            ok(f"1024×1024 taşıyıcı oluşturma: {carrier_dt*1000:.0f}ms")
+        else:
+            fail(f"Taşıyıcı oluşturma çok yavaş: {carrier_dt:.2f}s")
+
+        # Aralarında asal boyutlar (gcd=1) şerit yolunu O(w·h) yapardı
+        odd_img = os.path.join(tmpdir, "perf_odd.png")
+        t0 = time.perf_counter()
+        SteganographyManager.create_carrier_image(odd_img, 1537, 1531)
+        odd_dt = time.perf_counter() - t0
+
+        def expected_pixel(x, y, w, h):
+            t = ((x / w) + (y / h)) / 2.0
+            return tuple(int(a * (1 - t) + b * t)
+                         for a, b in ((30, 40), (30, 60), (60, 180)))
+
+        small = SteganographyManager._diagonal_gradient(97, 61)
+        small_ok = all(small.getpixel((x, y)) == expected_pixel(x, y, 97, 61)
+                       for y in range(61) for x in range(97))
+        with Image.open(odd_img) as odd:
+            odd_size = odd.size
+            corners = [odd.getpixel(p) for p in ((0, 0), (1536, 1530))]
+        if (odd_dt < 2.0 and odd_size == (1537, 1531) and small_ok
+                and corners == [expected_pixel(0, 0, 1537, 1531),
+                                expected_pixel(1536, 1530, 1537, 1531)]):
+            ok(f"1537×1531 taşıyıcı oluşturma: {odd_dt*1000:.0f}ms")
+        else:
+            fail("Kare olmayan taşıyıcı",
+                 f"{odd_dt:.2f}s, boyut={odd_size}, 97×61 eşleşme={small_ok}")
         data = secrets.token_bytes(100_000)  # 100 KB
 
         t0 = time.perf_counter()
@@ -642,6 +1615,38 @@ def test_performance():
         else:
             fail(f"Steganografi performans",
                  f"encode={encode_dt:.2f}s, decode={decode_dt:.2f}s, eşleşme={decoded == data}")
+
+        # --- 6.3b 1 MB veri decode süresi (2048×2048 taşıyıcı) ---
+        big_img = os.path.join(tmpdir, "perf_big.png")
+        Image.frombytes("RGB", (2048, 2048),
+                        secrets.token_bytes(2048 * 2048 * 3)).save(big_img)
+        big_payload = secrets.token_bytes(1_000_000)
+        SteganographyManager.encode(big_img, big_payload)
+
+        t0 = time.perf_counter()
+        decoded_big = SteganographyManager.decode(big_img)
+        big_decode_dt = time.perf_counter() - t0
+        if decoded_big == big_payload and big_decode_dt < 2.0:
+            ok(f"1 MB steganografi decode: {big_decode_dt*1000:.0f}ms")
+        else:
+            fail("1 MB steganografi decode",
+                 f"{big_decode_dt:.2f}s, eşleşme={decoded_big == big_payload}")
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    # --- 6.3c PNG kayıt profilleri (1024×1024, 100 KB veri) ---
+    carrier = CarrierBuffer.blank(1024, 1024)
+    carrier.embed(secrets.token_bytes(100_000))
+    tmpdir = tempfile.mkdtemp(prefix="perf_png_")
+    try:
+        timings = []
+        for name, options in PNG_SAVE_PROFILES.items():
+            out = os.path.join(tmpdir, f"{name}.png")
+            t0 = time.perf_counter()
+            carrier.save(out, **options)
+            timings.append(f"{name}={time.perf_counter() - t0:.2f}s/"
+                           f"{os.path.getsize(out) // 1024}KB")
+        ok("PNG profilleri: " + ", ".join(timings))
     finally:
         shutil.rmtree(tmpdir, ignore_errors=True)
 
@@ -745,7 +1750,52 @@ def test_integration():
         else:
             fail("Silme sonrası sayı")
 
-        # 9) Tamamen yeni DataManager ile doğrulama
+        # 9) Write-behind: art arda değişiklikler tek kayıtta birleşir
+        wb = DataManager(tmpdir, write_behind=True)
+        wb.authenticate("Integration$Test#2024")
+        save_calls = []
+        real_save = wb.save
+        wb.save = lambda profile=None: (save_calls.append(profile),
+                                        real_save(profile))
+        for i in range(20):
+            wb.add_password({"site_name": f"Toplu {i}", "username": "wb",
+                             "password": "Pw!12345", "category": "İş"})
+        wb.flush()
+        wb.save = real_save
+
+        # batch() içinden flush/save/lock kilitlenmek yerine hata verir
+        rejected = []
+        with wb.batch():
+            wb.add_password({"site_name": "Toplu blok", "username": "wb",
+                             "password": "Pw!12345", "category": "İş"})
+            for call in (wb.flush, wb.save, wb.lock):
+                try:
+                    call()
+                except RuntimeError:
+                    rejected.append(call.__name__)
+        wb.flush()
+        if rejected == ["flush", "save", "lock"] and wb.is_authenticated:
+            ok("batch() içinde flush/save/lock → RuntimeError")
+        else:
+            fail("batch() yeniden giriş", str(rejected))
+        for p in wb.search_passwords("toplu blok"):
+            wb.delete_password(p["id"])
+        wb.flush()
+        wb.lock()
+        dm_check = DataManager(tmpdir)
+        dm_check.authenticate("Integration$Test#2024")
+        if (len(dm_check.search_passwords("toplu")) == 20
+                and 1 <= len(save_calls) < 20):
+            ok(f"Write-behind: 20 değişiklik → {len(save_calls)} kayıt")
+        else:
+            fail("Write-behind",
+                 f"kayıt={len(save_calls)}, "
+                 f"bulunan={len(dm_check.search_passwords('toplu'))}")
+        for p in dm_check.search_passwords("toplu"):
+            dm_check.delete_password(p["id"])
+        dm_check.lock()
+
+        # 10) Tamamen yeni DataManager ile doğrulama
         dm2 = DataManager(tmpdir)
         dm2.authenticate("Integration$Test#2024")
         if len(dm2.get_passwords()) == 49 and len(dm2.get_notes()) == 10:
@@ -769,6 +1819,8 @@ if __name__ == "__main__":
     test_steganography()
     test_generator()
     test_health()
+    test_search()
+    test_sync_tree()
     test_data_manager()
     test_performance()
     test_integration()